@@ -28,6 +28,9 @@ yes | npx update-browserslist-db@latest
 echo "======Migrating Database======"
 python3.13 manage.py migrate --no-input
 
+echo "======Compiling Church Year Snapshots======"
+python3.13 manage.py compile_church_years
+
 echo "======Collecting Static Files======"
 # enable corepack
 #mkdir -p static
@@ -49,6 +52,15 @@ systemctl start dailyoffice
 echo "======Reclearing Memcached======"
 echo "flush_all" | nc -q 2 localhost 11211
 
+echo "======Warming Calendar Cache======"
+python3.13 manage.py warm_calendar_cache
+
+echo "======Building Office Calendar Download======"
+python3.13 manage.py generate_office_calendar
+
+echo "======Pre-rendering Offices======"
+python3.13 manage.py prerender_offices
+
 echo "======Clearing Python Cache and Recompiling======"
 sudo find . -name "*.pyc" -exec rm -f {} \;
 sudo find . -name "*.pyo" -exec rm -f {} \;
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import atexit
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from analytics.models import AnalyticsEvent
+
+logger = logging.getLogger(__name__)
+
+SPOOL_DIRECTORY_NAME = "analytics_spool"
+
+
+def get_spool_directory() -> Path:
+    return Path(settings.MEDIA_ROOT) / SPOOL_DIRECTORY_NAME
+
+
+def _encode(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot spool {type(value).__name__}")
+
+
+def _decode(row: dict) -> dict:
+    row["created"] = datetime.datetime.fromisoformat(row["created"])
+    if row.get("office_date"):
+        row["office_date"] = datetime.date.fromisoformat(row["office_date"])
+    return row
+
+
+class AnalyticsEventBuffer:
+    """Collects analytics events in memory and writes them in batches, off the request path.
+
+    ``add`` only appends to a bounded ring buffer; a daemon thread writes the
+    buffer with one ``bulk_create`` once ``batch_size`` events are waiting or
+    ``flush_interval`` seconds have passed. When the buffer is full the oldest
+    events are dropped, since analytics must never hold up or grow a worker.
+
+    If the database cannot be written, the batch is appended to a JSON-lines
+    file under ``MEDIA_ROOT/analytics_spool`` and replayed after the next
+    successful write, by whichever process gets there first.
+
+    With ``ANALYTICS_BUFFER_EVENTS`` off (tests, management commands) every
+    ``add`` is written straight away in the calling thread.
+    """
+
+    def __init__(self, capacity: int = 10000, batch_size: int = 500, flush_interval: float = 5.0):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._events = deque(maxlen=self.capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self.dropped = 0
+
+    def add(self, **fields) -> None:
+        """Queue one event; ``fields`` are ``AnalyticsEvent`` field values."""
+        if self._pid != os.getpid():
+            # Forked from a process that had already buffered events: those belong to the parent.
+            self._reset()
+        fields.setdefault("created", timezone.now())
+
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(fields)
+            pending = len(self._events)
+
+        if not settings.ANALYTICS_BUFFER_EVENTS:
+            self.flush()
+            return
+
+        self._ensure_thread()
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write every queued event now and return how many were taken from the buffer."""
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._events)
+                self._events.clear()
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                logger.warning("Analytics buffer was full; dropped %s events", dropped)
+            if not rows:
+                return 0
+
+            try:
+                self._write(rows)
+            except Exception:
+                logger.exception("Could not write %s analytics events; spooling them to disk", len(rows))
+                self._spool(rows)
+            else:
+                self._replay_spool()
+            return len(rows)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="analytics-flush", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            # Long-lived thread: drop a connection that has gone away or outlived CONN_MAX_AGE.
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Analytics flush failed")
+
+    def _write(self, rows: list[dict]) -> None:
+        AnalyticsEvent.objects.bulk_create([AnalyticsEvent(**row) for row in rows], batch_size=self.batch_size)
+
+    def _spool(self, rows: list[dict]) -> None:
+        directory = get_spool_directory()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{os.getpid()}-{time.time_ns()}.jsonl"
+            with path.open("a", encoding="utf-8") as spool_file:
+                for row in rows:
+                    spool_file.write(json.dumps(row, default=_encode) + "\n")
+        except OSError:
+            logger.exception("Could not spool %s analytics events; they are lost", len(rows))
+
+    def _replay_spool(self) -> None:
+        directory = get_spool_directory()
+        if not directory.is_dir():
+            return
+        for path in sorted(directory.glob("*.jsonl")):
+            claimed = path.with_suffix(".replaying")
+            try:
+                # The rename is atomic, so only one process replays a given file.
+                path.rename(claimed)
+            except OSError:
+                continue
+            try:
+                with claimed.open(encoding="utf-8") as spool_file:
+                    rows = [_decode(json.loads(line)) for line in spool_file if line.strip()]
+                self._write(rows)
+            except Exception:
+                logger.exception("Could not replay analytics spool %s", path.name)
+                claimed.rename(path)
+                return
+            claimed.unlink()
+
+
+event_buffer = AnalyticsEventBuffer()
+
+
+def record_event(**fields) -> None:
+    """Queue an ``AnalyticsEvent`` for the background writer; never raises."""
+    try:
+        event_buffer.add(**fields)
+    except Exception:
+        logger.exception("Could not record analytics event")
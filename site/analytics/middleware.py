@@ -1,3 +1,4 @@
+from analytics.buffer import record_event
 from analytics.models import AnalyticsEvent
 from analytics.utils import known_setting_names, office_date_from_kwargs, parse_client_meta
 
@@ -19,7 +20,8 @@ OFFICE_VIEW_URL_NAMES = {
 class AnalyticsMiddleware:
     """Records one ``office_view`` per office API request, for every app version.
 
-    Logging is best-effort and wrapped so it can never affect the response.
+    Logging is best-effort and wrapped so it can never affect the response;
+    the event is only queued here and written later by ``analytics.buffer``.
     """
 
     def __init__(self, get_response):
@@ -37,7 +39,10 @@ class AnalyticsMiddleware:
     def _maybe_log_office_view(request, response):
         if request.method != "GET":
             return
-        if getattr(response, "status_code", 0) // 100 != 2:
+        # A 304 is a repeat load answered from the client's own copy of the
+        # office (see OfficeResponseCache); it is still a view.
+        status_code = getattr(response, "status_code", 0)
+        if status_code // 100 != 2 and status_code != 304:
             return
 
         match = getattr(request, "resolver_match", None)
@@ -58,7 +63,7 @@ class AnalyticsMiddleware:
         allowed = known_setting_names()
         settings = {str(key)[:60]: str(value)[:120] for key, value in request.GET.items() if key in allowed}
 
-        AnalyticsEvent.objects.create(
+        record_event(
             event_type=AnalyticsEvent.OFFICE_VIEW,
             service_type=service_type,
             office=office,
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.4 on 2026-10-18 12:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_analyticsevent_settings"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="analyticsevent",
+            name="created",
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+    ]
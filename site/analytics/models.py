@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.utils import timezone
 
 
 class AnalyticsEvent(models.Model):
@@ -58,7 +59,9 @@ class AnalyticsEvent(models.Model):
     # captured from the request query params. Used for "most common setting"
     # distributions in the dashboard.
     settings = models.JSONField(default=dict, blank=True)
-    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Set when the event happens rather than when it is saved: events are
+    # written in batches by ``analytics.buffer``, sometimes from the disk spool.
+    created = models.DateTimeField(default=timezone.now, editable=False, db_index=True)
 
     class Meta:
         ordering = ("-created",)
@@ -1,12 +1,17 @@
 import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import OperationalError
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.urls import ResolverMatch, reverse
 from rest_framework.test import APIClient
 
+from analytics.buffer import AnalyticsEventBuffer, get_spool_directory
 from analytics.middleware import AnalyticsMiddleware
 from analytics.models import AnalyticsEvent
 from analytics.utils import parse_client_meta, record_audio_loaded
@@ -67,6 +72,10 @@ class OfficeViewMiddlewareTests(TestCase):
         self._run(status=404)
         self.assertEqual(AnalyticsEvent.objects.count(), 0)
 
+    def test_not_modified_counted(self):
+        self._run(status=304)
+        self.assertEqual(AnalyticsEvent.objects.count(), 1)
+
     def test_unrelated_route_not_counted(self):
         self._run(url_name="day_view")
         self.assertEqual(AnalyticsEvent.objects.count(), 0)
@@ -220,3 +229,36 @@ class DashboardViewTests(TestCase):
         self.assertContains(response, "Settings usage")
         self.assertContains(response, "Bible Translation")
         self.assertContains(response, "ESV")
+
+
+class AnalyticsEventBufferTests(SimpleTestCase):
+    @override_settings(ANALYTICS_BUFFER_EVENTS=True)
+    def test_events_wait_for_flush(self):
+        buffer = AnalyticsEventBuffer(capacity=2)
+        with patch.object(buffer, "_ensure_thread"), patch.object(buffer, "_write") as write:
+            for office in ("morning_prayer", "midday_prayer", "compline"):
+                buffer.add(event_type=AnalyticsEvent.OFFICE_VIEW, office=office)
+            write.assert_not_called()
+
+            self.assertEqual(buffer.flush(), 2)
+        rows = write.call_args.args[0]
+        # The ring buffer keeps the newest events.
+        self.assertEqual([row["office"] for row in rows], ["midday_prayer", "compline"])
+        self.assertTrue(all(isinstance(row["created"], datetime.datetime) for row in rows))
+
+    @override_settings(ANALYTICS_BUFFER_EVENTS=False)
+    def test_failed_write_is_spooled_and_replayed(self):
+        buffer = AnalyticsEventBuffer()
+        with TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            with patch.object(buffer, "_write", side_effect=[OperationalError, None, None]) as write:
+                buffer.add(event_type=AnalyticsEvent.AUDIO_PLAY, office_date=datetime.date(2026, 7, 19))
+                self.assertEqual(len(list(get_spool_directory().glob("*.jsonl"))), 1)
+
+                buffer.add(event_type=AnalyticsEvent.AUDIO_LOADED)
+
+            self.assertEqual(write.call_count, 3)
+            replayed = write.call_args.args[0]
+            self.assertEqual(replayed[0]["event_type"], AnalyticsEvent.AUDIO_PLAY)
+            self.assertEqual(replayed[0]["office_date"], datetime.date(2026, 7, 19))
+            self.assertIsInstance(replayed[0]["created"], datetime.datetime)
+            self.assertEqual(list(Path(media_root, "analytics_spool").iterdir()), [])
@@ -1,32 +1,25 @@
 import datetime
 
-from django.apps import apps
-from django.core.cache import cache
-
 try:  # Optional dependency: analytics must never break the site if it's missing.
     from user_agents import parse as parse_user_agent
 except ImportError:  # pragma: no cover - exercised only when dep is absent
     parse_user_agent = None
 
+from analytics.buffer import record_event
 from analytics.models import AnalyticsEvent
 
-_SETTING_NAMES_CACHE_KEY = "analytics_known_setting_names"
-
 
 def known_setting_names():
     """Return the set of valid office setting keys (``Setting.name``).
 
     These are exactly the query-param keys the client sends on an office
     request, so they let us capture the settings snapshot while ignoring other
-    params (extra_collects, include_audio_links, cache-busters, etc.). Cached
-    briefly since settings rarely change.
+    params (extra_collects, include_audio_links, cache-busters, etc.). Read
+    from the office settings registry, which is invalidated on setting edits.
     """
-    names = cache.get(_SETTING_NAMES_CACHE_KEY)
-    if names is None:
-        setting_model = apps.get_model("office", "Setting")
-        names = set(setting_model.objects.values_list("name", flat=True))
-        cache.set(_SETTING_NAMES_CACHE_KEY, names, 300)
-    return names
+    from office.settings_registry import SettingsRegistry
+
+    return SettingsRegistry.names()
 
 
 # Platform is only trusted when the client explicitly reports it via the
@@ -95,7 +88,7 @@ def record_audio_loaded(request, is_initial_request):
     try:
         client_id = (request.headers.get("X-Client-Id") or request.GET.get("cid") or "").strip()
         platform, browser, os_family = parse_client_meta(request)
-        AnalyticsEvent.objects.create(
+        record_event(
             event_type=AnalyticsEvent.AUDIO_LOADED,
             client_id=client_id[:64],
             platform=platform,
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 
+from analytics.buffer import record_event
 from analytics.models import AnalyticsEvent
 from analytics.utils import parse_client_meta, parse_office_date
 
@@ -33,7 +34,7 @@ class AnalyticsEventView(APIView):
         platform, browser, os_family = parse_client_meta(request, declared_platform=data.get("platform"))
         client_id = (data.get("client_id") or request.headers.get("X-Client-Id") or "").strip()
 
-        AnalyticsEvent.objects.create(
+        record_event(
             event_type=event_type,
             service_type=(data.get("service_type") or "")[:20],
             office=(data.get("office") or "")[:50],
@@ -8,6 +8,7 @@ This module provides functionality to:
 """
 
 import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from xml.etree import ElementTree as ET
@@ -17,6 +18,74 @@ from html2text import html2text
 
 from bible.sources import BibleSource, PassageNotFoundException
 
+ESV_NAMESPACE = "http://www.crosswaybibles.org"
+
+# Parsed books kept per process. Imports walk the lectionary in order, so a
+# handful of books covers almost every consecutive passage.
+ESV_BOOK_CACHE_SIZE = 16
+
+
+class ESVChapter:
+    """The top-level elements of one chapter, with the verse lookahead precomputed.
+
+    ``verses_ahead[i]`` holds the verse numbers that follow element ``i``
+    before the next heading or subheading, which is what decides whether a
+    heading, paragraph or block indent belongs to a requested verse range.
+    """
+
+    def __init__(self, element):
+        self.element = element
+        self.elements = list(element)
+        self.tags = [elem.tag.replace(f"{{{ESV_NAMESPACE}}}", "") for elem in self.elements]
+        self.verse_numbers = set()
+        self.verses_ahead = [frozenset()] * len(self.elements)
+
+        ahead = frozenset()
+        for position in reversed(range(len(self.elements))):
+            self.verses_ahead[position] = ahead
+            tag = self.tags[position]
+            if tag in ["heading", "subheading"]:
+                ahead = frozenset()
+            elif tag == "verse":
+                verse_num = ESVXMLAdapter._extract_verse_number(self.elements[position].get("num", "0"))
+                self.verse_numbers.add(verse_num)
+                ahead = ahead | {verse_num}
+
+    def has_verse_ahead(self, position: int, include_verses: set) -> bool:
+        return not self.verses_ahead[position].isdisjoint(include_verses)
+
+
+class ESVBook:
+    """A parsed book XML file with its chapters indexed by number."""
+
+    def __init__(self, root):
+        self.root = root
+        self._chapter_elements = {}
+        for chapter in root.iter(f"{{{ESV_NAMESPACE}}}chapter"):
+            self._chapter_elements.setdefault(chapter.get("num"), chapter)
+        self._chapters = {}
+
+    def chapter(self, chapter_num: int) -> Optional[ESVChapter]:
+        key = str(chapter_num)
+        if key not in self._chapters:
+            element = self._chapter_elements.get(key)
+            self._chapters[key] = ESVChapter(element) if element is not None else None
+        return self._chapters[key]
+
+
+@lru_cache(maxsize=ESV_BOOK_CACHE_SIZE)
+def load_esv_book(filepath: str) -> ESVBook:
+    """Parse a book XML file once per process; the trees are only ever read."""
+    try:
+        # Parse with lxml to handle entities defined in DTD
+        from lxml import etree
+
+        parser = etree.XMLParser(load_dtd=True, resolve_entities=True)
+        return ESVBook(etree.parse(filepath, parser).getroot())
+    except ImportError:
+        # Fallback to standard library (may not handle entities properly)
+        return ESVBook(ET.parse(filepath).getroot())
+
 
 class ESVXMLAdapter(BibleSource):
     """
@@ -27,7 +96,7 @@ class ESVXMLAdapter(BibleSource):
     """
 
     # XML namespace used in ESV files
-    NAMESPACE = {"cb": "http://www.crosswaybibles.org"}
+    NAMESPACE = {"cb": ESV_NAMESPACE}
 
     # Path to ESV XML files
     ESV_DIR = Path(__file__).parent / "esv"
@@ -191,10 +260,19 @@ class ESVXMLAdapter(BibleSource):
             normalized_refs.append((self._normalize_book_name(book), sc, sv, ec, ev, test))
         self.references = normalized_refs
 
-        # Generate the HTML
-        self.html = self._generate_html()
-        self.text = self._generate_text()
-        self.headings = self._extract_headings()
+    # HTML, text and headings are each built on first use, so callers that
+    # only need one of them never pay for the others.
+    @cached_property
+    def html(self) -> str:
+        return self._generate_html()
+
+    @cached_property
+    def text(self) -> str:
+        return self._generate_text()
+
+    @cached_property
+    def headings(self) -> list:
+        return self._extract_headings()
 
     def _normalize_book_name(self, book_name: str) -> str:
         """
@@ -266,9 +344,9 @@ class ESVXMLAdapter(BibleSource):
         """Return list of headings in the passage."""
         return self.headings
 
-    def _get_xml_filename(self) -> str:
+    def _get_xml_filename(self, book_name: Optional[str] = None) -> str:
         """
-        Get the XML filename for the given book.
+        Get the XML filename for the given book (defaults to ``self.book``).
 
         Returns:
             Filename of the XML file
@@ -276,44 +354,36 @@ class ESVXMLAdapter(BibleSource):
         Raises:
             PassageNotFoundException: If book is not found
         """
+        book_name = book_name or self.book
+
         # Try direct lookup
-        if self.book in self.BOOK_NAME_MAP:
-            return self.BOOK_NAME_MAP[self.book]
+        if book_name in self.BOOK_NAME_MAP:
+            return self.BOOK_NAME_MAP[book_name]
 
         # Try case-insensitive lookup
         for key, value in self.BOOK_NAME_MAP.items():
-            if key.lower() == self.book.lower():
+            if key.lower() == book_name.lower():
                 return value
 
-        raise PassageNotFoundException(f"Book not found: {self.book}")
+        raise PassageNotFoundException(f"Book not found: {book_name}")
 
-    def _load_xml_tree(self) -> ET.Element:
+    def _load_book(self, book_name: Optional[str] = None) -> ESVBook:
         """
-        Load and parse the XML file for the book.
+        Load the parsed, indexed XML for the book from the shared book cache.
 
         Returns:
-            Root element of the parsed XML tree
+            ESVBook for the book
 
         Raises:
             PassageNotFoundException: If file cannot be loaded
         """
-        filename = self._get_xml_filename()
+        filename = self._get_xml_filename(book_name)
         filepath = self.ESV_DIR / filename
 
         if not filepath.exists():
             raise PassageNotFoundException(f"XML file not found: {filepath}")
 
-        try:
-            # Parse with lxml to handle entities defined in DTD
-            from lxml import etree
-
-            parser = etree.XMLParser(load_dtd=True, resolve_entities=True)
-            tree = etree.parse(str(filepath), parser)
-            return tree.getroot()
-        except ImportError:
-            # Fallback to standard library (may not handle entities properly)
-            tree = ET.parse(filepath)
-            return tree.getroot()
+        return load_esv_book(str(filepath))
 
     def _generate_html(self) -> str:
         """
@@ -328,13 +398,11 @@ class ESVXMLAdapter(BibleSource):
             for ref in self.references:
                 book_name, start_chap, start_verse, end_chap, end_verse, _ = ref
 
-                # Temporarily set self.book so _load_xml_tree works
-                self.book = book_name
-                root = self._load_xml_tree()
+                book = self._load_book(book_name)
 
                 # Special handling for Sirach chapter 1: include the prologue
                 if book_name in ["Sirach", "Ecclesiasticus"] and start_chap == 1 and start_verse == 1:
-                    prologue_html = self._extract_sirach_prologue(root)
+                    prologue_html = self._extract_sirach_prologue(book)
                     if prologue_html:
                         html_parts.append(prologue_html)
 
@@ -344,33 +412,29 @@ class ESVXMLAdapter(BibleSource):
                     verse_start = start_verse if chapter_num == start_chap else 1
                     verse_end = end_verse if chapter_num == end_chap else 999
 
-                    chapter_html = self._process_chapter(root, chapter_num, verse_start, verse_end)
+                    chapter_html = self._process_chapter(book, chapter_num, verse_start, verse_end)
                     if chapter_html:
                         html_parts.append(chapter_html)
 
             if not html_parts:
                 raise PassageNotFoundException(f"No verses found for passage: {self.passage}")
 
-            # Restore self.book to the first reference's book
-            if hasattr(self, "references") and self.references:
-                self.book = self.references[0][0]
-
             return "\n".join(html_parts)
 
         except Exception as e:
             raise PassageNotFoundException(f"Error generating HTML: {str(e)}")
 
-    def _extract_sirach_prologue(self, root: ET.Element) -> str:
+    def _extract_sirach_prologue(self, book: ESVBook) -> str:
         """
         Extract the prologue from Sirach chapter 1 (the unversed text before verse 1).
 
         Args:
-            root: XML root element
+            book: Parsed book
 
         Returns:
             HTML string of the prologue content
         """
-        chapter = root.find(f".//cb:chapter[@num='1']", self.NAMESPACE)
+        chapter = book.chapter(1)
         if chapter is None:
             return ""
 
@@ -379,8 +443,7 @@ class ESVXMLAdapter(BibleSource):
         paragraph_content = []
 
         # Process elements and text nodes until we hit the first verse
-        for i, elem in enumerate(chapter):
-            tag = elem.tag.replace(f"{{{self.NAMESPACE['cb']}}}", "")
+        for elem, tag in zip(chapter.elements, chapter.tags):
 
             # Stop when we reach the first verse
             if tag == "verse":
@@ -470,7 +533,8 @@ class ESVXMLAdapter(BibleSource):
 
         return "".join(parts)
 
-    def _extract_verse_number(self, verse_num_str: str) -> int:
+    @staticmethod
+    def _extract_verse_number(verse_num_str: str) -> int:
         """
         Extract the numeric part from a verse number string.
 
@@ -490,12 +554,12 @@ class ESVXMLAdapter(BibleSource):
             return int(match.group(1))
         return 0
 
-    def _process_chapter(self, root: ET.Element, chapter_num: int, verse_start: int, verse_end: int) -> str:
+    def _process_chapter(self, book: ESVBook, chapter_num: int, verse_start: int, verse_end: int) -> str:
         """
         Process a chapter and extract verses in the specified range.
 
         Args:
-            root: XML root element
+            book: Parsed book
             chapter_num: Chapter number
             verse_start: Starting verse number
             verse_end: Ending verse number
@@ -503,8 +567,7 @@ class ESVXMLAdapter(BibleSource):
         Returns:
             HTML string for the chapter content
         """
-        # Find the chapter element
-        chapter = root.find(f".//cb:chapter[@num='{chapter_num}']", self.NAMESPACE)
+        chapter = book.chapter(chapter_num)
         if chapter is None:
             return ""
 
@@ -519,23 +582,24 @@ class ESVXMLAdapter(BibleSource):
 
         # Track verse numbers to include
         include_verses = set(range(verse_start, min(verse_end + 1, 1000)))
+        if chapter.verse_numbers.isdisjoint(include_verses):
+            return ""
 
         # Track if we've seen any verses in the current structural block
         verses_in_current_block = False
         pending_opening_tags = []
 
         # Process all child elements of the chapter
-        for elem in chapter:
-            tag = elem.tag.replace(f"{{{self.NAMESPACE['cb']}}}", "")
+        for position, (elem, tag) in enumerate(zip(chapter.elements, chapter.tags)):
 
             if tag == "heading":
                 # Only include heading if followed by a verse in our range
-                if self._has_relevant_verse_after(elem, include_verses):
+                if chapter.has_verse_ahead(position, include_verses):
                     html_parts.extend(pending_opening_tags)
                     pending_opening_tags = []
                     html_parts.append(self._format_heading(elem))
             elif tag == "subheading":
-                if self._has_relevant_verse_after(elem, include_verses):
+                if chapter.has_verse_ahead(position, include_verses):
                     html_parts.extend(pending_opening_tags)
                     pending_opening_tags = []
                     html_parts.append(self._format_subheading(elem))
@@ -577,7 +641,7 @@ class ESVXMLAdapter(BibleSource):
                 verses_in_current_block = False
             elif tag == "begin-block-indent":
                 # Only open if there will be relevant content
-                if self._has_relevant_verse_after(elem, include_verses):
+                if chapter.has_verse_ahead(position, include_verses):
                     pending_opening_tags.append('<div class="block-indent">')
                     context["in_block_indent"] = True
             elif tag == "end-block-indent":
@@ -591,33 +655,6 @@ class ESVXMLAdapter(BibleSource):
 
         return "\n".join(html_parts)
 
-    def _has_relevant_verse_after(self, elem: ET.Element, include_verses: set) -> bool:
-        """
-        Check if there are any relevant verses after this element in the chapter,
-        before the next heading.
-
-        Args:
-            elem: The element to check after
-            include_verses: Set of verse numbers to include
-
-        Returns:
-            True if there are relevant verses after this element
-        """
-        # Check following siblings
-        current = elem.getnext()
-        while current is not None:
-            tag = current.tag.replace(f"{{{self.NAMESPACE['cb']}}}", "")
-            if tag in ["heading", "subheading"]:
-                # Stop checking if we hit another heading
-                return False
-            if tag == "verse":
-                verse_num_str = current.get("num", "0")
-                verse_num = self._extract_verse_number(verse_num_str)
-                if verse_num in include_verses:
-                    return True
-            current = current.getnext()
-        return False
-
     def _format_heading(self, elem: ET.Element) -> str:
         """Format a heading element."""
         text = "".join(elem.itertext()).strip()
@@ -830,16 +867,15 @@ class ESVXMLAdapter(BibleSource):
         try:
             for ref in self.references:
                 book_name, start_chap, start_verse, end_chap, end_verse, _ = ref
-                self.book = book_name
-                root = self._load_xml_tree()
+                book = self._load_book(book_name)
 
                 # Find all headings in the chapter range
                 for chapter_num in range(start_chap, end_chap + 1):
-                    chapter = root.find(f".//cb:chapter[@num='{chapter_num}']", self.NAMESPACE)
+                    chapter = book.chapter(chapter_num)
                     if chapter is None:
                         continue
 
-                    for heading in chapter.findall(".//cb:heading", self.NAMESPACE):
+                    for heading in chapter.element.findall(".//cb:heading", self.NAMESPACE):
                         text = "".join(heading.itertext()).strip()
                         if text:
                             # Try to find the next verse to associate with the heading
@@ -860,7 +896,7 @@ class ESVXMLAdapter(BibleSource):
                                         in_range = True
 
                                     if in_range:
-                                        ref_str = f"{self.book} {chapter_num}:{verse_num}"
+                                        ref_str = f"{book_name} {chapter_num}:{verse_num}"
                                         headings.append((ref_str, text))
                                     break
                                 next_verse = next_verse.getnext()
@@ -868,8 +904,4 @@ class ESVXMLAdapter(BibleSource):
         except Exception:
             pass
 
-        # Restore self.book to the first reference's book
-        if hasattr(self, "references") and self.references:
-            self.book = self.references[0][0]
-
         return headings
@@ -0,0 +1,113 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from bible.esv_xml_adapter import ESVXMLAdapter, load_esv_book
+
+JONAH_XML = """<?xml version="1.0"?>
+<crossway-bible xmlns="http://www.crosswaybibles.org">
+<book title="Jonah" num="32">
+<chapter num="1">
+<heading>The Call</heading>
+<begin-paragraph/>
+<verse num="1">One.</verse>
+<verse num="2">Two.</verse>
+<end-paragraph/>
+<subheading>The Flight</subheading>
+<begin-block-indent/>
+<begin-paragraph class="line-group"/>
+<verse num="3">Three.</verse>
+<end-paragraph/>
+<end-block-indent/>
+</chapter>
+<chapter num="2">
+<heading>The Prayer</heading>
+<begin-paragraph/>
+<verse num="1">Four.</verse>
+<verse num="2">Five.</verse>
+<end-paragraph/>
+</chapter>
+</book>
+</crossway-bible>
+"""
+
+
+def has_relevant_verse_after(elem, include_verses):
+    """The sibling walk ``ESVChapter.verses_ahead`` replaced, kept as the reference."""
+    current = elem.getnext()
+    while current is not None:
+        tag = current.tag.replace(f"{{{ESVXMLAdapter.NAMESPACE['cb']}}}", "")
+        if tag in ["heading", "subheading"]:
+            return False
+        if tag == "verse" and ESVXMLAdapter._extract_verse_number(current.get("num", "0")) in include_verses:
+            return True
+        current = current.getnext()
+    return False
+
+
+class ESVXMLAdapterTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        Path(temp_dir.name, "Jonah.xml").write_text(JONAH_XML)
+        patcher = mock.patch.object(ESVXMLAdapter, "ESV_DIR", Path(temp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_passages_render_as_before(self):
+        # Expected output was produced by the adapter before chapters were indexed.
+        expected = {
+            "Jonah 1:1-2": (
+                '<h3 class="passage-heading">The Call</h3>\n<p>\n<sup class="verse-num">1</sup> One.\n'
+                '<sup class="verse-num">2</sup> Two.\n</p>',
+                "### The Call 1 One. 2 Two.",
+                [("Jonah 1:1", "The Call")],
+            ),
+            "Jonah 1:2-3": (
+                '<h3 class="passage-heading">The Call</h3>\n<p>\n<sup class="verse-num">2</sup> Two.\n</p>\n'
+                '<h4 class="passage-subheading ">The Flight</h4>\n<div class="block-indent">\n'
+                '<div class="poetry">\n<sup class="verse-num">3</sup> Three.\n</div>',
+                "### The Call 2 Two. #### The Flight 3 Three.",
+                [],
+            ),
+            "Jonah 1:3-2:1": (
+                '<h4 class="passage-subheading ">The Flight</h4>\n<div class="block-indent">\n'
+                '<div class="poetry">\n<sup class="verse-num">3</sup> Three.\n</div>\n'
+                '<h3 class="passage-heading">The Prayer</h3>\n<p>\n<sup class="verse-num">1</sup> Four.\n</p>',
+                "#### The Flight 3 Three. ### The Prayer 1 Four.",
+                [("Jonah 2:1", "The Prayer")],
+            ),
+            # Chapter 1 has no verse from 4 on, so it is skipped entirely.
+            "Jonah 1:4-2:2": (
+                '<h3 class="passage-heading">The Prayer</h3>\n<p>\n<sup class="verse-num">1</sup> Four.\n'
+                '<sup class="verse-num">2</sup> Five.\n</p>',
+                "### The Prayer 1 Four. 2 Five.",
+                [("Jonah 2:1", "The Prayer")],
+            ),
+        }
+        for passage, (html, text, headings) in expected.items():
+            with self.subTest(passage=passage):
+                adapter = ESVXMLAdapter(passage, "esv")
+                # Built lazily, so read them in the reverse of the order they used to be built in.
+                self.assertEqual(adapter.headings, headings)
+                self.assertEqual(adapter.text, text)
+                self.assertEqual(adapter.html, html)
+
+    def test_lookahead_matches_the_sibling_walk(self):
+        books = [ESVXMLAdapter.ESV_DIR / "Jonah.xml", Path(__file__).parent / "esv" / "Jonah.xml"]
+        for path in books:
+            book = load_esv_book(str(path))
+            for chapter_num in range(1, 5):
+                chapter = book.chapter(chapter_num)
+                if chapter is None:
+                    continue
+                for start in range(1, 12, 3):
+                    include_verses = set(range(start, start + 4))
+                    for position, elem in enumerate(chapter.elements):
+                        with self.subTest(path=path.name, chapter=chapter_num, start=start, position=position):
+                            self.assertEqual(
+                                chapter.has_verse_ahead(position, include_verses),
+                                has_relevant_verse_after(elem, include_verses),
+                            )
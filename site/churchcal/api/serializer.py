@@ -1,10 +1,10 @@
 import calendar
 import re
 
-from django.db.models.query_utils import Q
 from rest_framework import serializers
 
-from churchcal.models import Commemoration
+from churchcal.mass_readings import MassLectionary, MassReadingSource
+from churchcal.sanctorale import SanctoraleNeighborIndex
 
 
 class RankSerializer(serializers.Serializer):
@@ -85,53 +85,19 @@ class CommemorationSerializer(serializers.Serializer):
             return [text]
         return ""
 
+    def _sanctorale_neighbors(self):
+        # DayListSerializer pins the index so a month of days checks the generation token once.
+        return self.context.get("sanctorale_neighbors") or SanctoraleNeighborIndex.current()
+
     def get_previous_commemoration(self, obj):
         if not hasattr(obj, "month") or not hasattr(obj, "day"):
             return None
-        next = (
-            Commemoration.objects.filter(
-                sanctoralecommemoration__month__isnull=False,
-                sanctoralecommemoration__day__isnull=False,
-                ai_one_sentence__isnull=False,
-            )
-            .order_by("-sanctoralecommemoration__month", "-sanctoralecommemoration__day")
-            .filter(
-                Q(sanctoralecommemoration__month__lt=obj.month)
-                | Q(sanctoralecommemoration__month=obj.month, sanctoralecommemoration__day__lte=obj.day)
-            )
-            .exclude(uuid=obj.uuid)
-            .first()
-        )
-        if next:
-            return {
-                "name": next.name,
-                "uuid": next.uuid,
-            }
-        return None
+        return self._sanctorale_neighbors().previous(obj)
 
     def get_next_commemoration(self, obj):
         if not hasattr(obj, "month") or not hasattr(obj, "day"):
             return None
-        next = (
-            Commemoration.objects.filter(
-                sanctoralecommemoration__month__isnull=False,
-                sanctoralecommemoration__day__isnull=False,
-                ai_one_sentence__isnull=False,
-            )
-            .order_by("sanctoralecommemoration__month", "sanctoralecommemoration__day")
-            .filter(
-                Q(sanctoralecommemoration__month__gt=obj.month)
-                | Q(sanctoralecommemoration__month=obj.month, sanctoralecommemoration__day__gte=obj.day)
-            )
-            .exclude(uuid=obj.uuid)
-            .first()
-        )
-        if next:
-            return {
-                "name": next.name,
-                "uuid": next.uuid,
-            }
-        return None
+        return self._sanctorale_neighbors().next(obj)
 
     def get_date_string(self, obj):
         if hasattr(obj, "month"):
@@ -199,6 +165,22 @@ class SeasonSerializer(serializers.Serializer):
         return [color.lower() for color in colors if color]
 
 
+class DayListSerializer(serializers.ListSerializer):
+    """Serializes a run of days (a month or a year) against one mass lectionary and sanctorale index.
+
+    Both are resolved once and handed to the nested serializers through the
+    context, so their generation tokens are checked once per response rather
+    than once per day.
+    """
+
+    def to_representation(self, data):
+        if "mass_lectionary" not in self.context:
+            self.context["mass_lectionary"] = MassLectionary.current()
+        if "sanctorale_neighbors" not in self.context:
+            self.context["sanctorale_neighbors"] = SanctoraleNeighborIndex.current()
+        return super().to_representation(data)
+
+
 class DaySerializer(serializers.Serializer):
     date = serializers.DateField()
     date_description = serializers.SerializerMethodField()
@@ -214,6 +196,9 @@ class DaySerializer(serializers.Serializer):
     major_feast = serializers.SerializerMethodField()
     major_or_minor_feast = serializers.SerializerMethodField()
 
+    class Meta:
+        list_serializer_class = DayListSerializer
+
     def get_date_description(self, obj):
         return {
             "date": obj.date.strftime("%Y-%-m-%-d"),
@@ -232,7 +217,12 @@ class DaySerializer(serializers.Serializer):
         }
 
     def get_mass_readings(self, obj):
-        return [{"citation": reading.long_citation, "text": reading.long_text} for reading in obj.mass_readings]
+        lectionary = self.context.get("mass_lectionary")
+        if lectionary is not None:
+            readings = lectionary.readings(MassReadingSource.for_calendar_date(obj))
+        else:
+            readings = obj.mass_readings
+        return [{"citation": reading.long_citation, "text": reading.long_text} for reading in readings]
 
     def get_primary_color(self, obj):
         try:
@@ -1,12 +1,15 @@
+import calendar as calendar_module
 import os
+from datetime import date, timedelta
 
 from django.conf import settings
-from django.core.cache import cache
 from django.http import FileResponse
 from django.http import HttpResponse
 from django.http import HttpResponseNotFound
 from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from mutagen.mp3 import MP3
 from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
 from rest_framework.response import Response
@@ -14,13 +17,13 @@ from rest_framework.views import APIView
 
 from churchcal.api.permissions import ReadOnly
 from churchcal.api.serializer import DaySerializer
-from churchcal.calculations import get_calendar_date, ChurchYear, CalendarYear
+from churchcal.calculations import get_calendar_date, get_calendar_dates, ChurchYear
 from churchcal.calendar_feeds import (
     ChurchCalendarFeedService,
     get_calendar_feed_filename,
     get_feed_scope_label,
 )
-from website import settings as site_settings
+from churchcal.utils import advent
 
 
 class CalendarFeedRenderer(BaseRenderer):
@@ -36,22 +39,6 @@ class CalendarFeedRenderer(BaseRenderer):
         return str(data).encode(self.charset)
 
 
-def get_calendar_year(year, calendar):
-    year = int(year)
-    first_year = year - 1
-    second_year = year
-    print(calendar)
-    first_church_year = cache.get(f"{first_year}_{calendar}") if site_settings.USE_CALENDAR_CACHE else None
-    if not first_church_year:
-        first_church_year = ChurchYear(first_year, calendar)
-        cache.set(f"{first_year}_{calendar}", first_church_year, 60 * 60 * 12)
-    second_church_year = cache.get(f"{second_year}_{calendar}") if site_settings.USE_CALENDAR_CACHE else None
-    if not second_church_year:
-        second_church_year = ChurchYear(second_year, calendar)
-    cache.set(f"{second_year}_{calendar}", second_church_year, 60 * 60 * 12)
-    return CalendarYear(year, first_church_year, second_church_year)
-
-
 class DayView(APIView):
     permission_classes = [ReadOnly]
 
@@ -69,10 +56,13 @@ class MonthView(APIView):
     permission_classes = [ReadOnly]
 
     def get(self, request, year, month):
-        calendar_year = get_calendar_year(year, request.GET.get("calendar", "ACNA_BCP2019"))
-        serializer = DaySerializer(
-            [date for date in calendar_year if date.date.month == month and date.date.year == year], many=True
-        )
+        try:
+            days_in_month = calendar_module.monthrange(year, month)[1]
+        except calendar_module.IllegalMonthError:
+            return Response(status=404)
+        days = [date(year, month, day) for day in range(1, days_in_month + 1)]
+        calendar_dates = get_calendar_dates(days, request.GET.get("calendar", "ACNA_BCP2019"))
+        serializer = DaySerializer(calendar_dates, many=True)
         return Response(serializer.data)
 
 
@@ -81,11 +71,8 @@ class YearView(APIView):
 
     def get(self, request, year):
         calendar = request.GET.get("calendar", "ACNA_BCP2019")
-        church_year = cache.get(f"{year}_{calendar}") if site_settings.USE_CALENDAR_CACHE else None
-        if not church_year:
-            church_year = ChurchYear(year, calendar)
-            cache.set(f"{year}_{calendar}", church_year, 60 * 60 * 12)
-        serializer = DaySerializer([date for date in church_year], many=True)
+        days = ChurchYear.daterange(advent(year), advent(year + 1) - timedelta(days=1))
+        serializer = DaySerializer(get_calendar_dates(days, calendar), many=True)
         return Response(serializer.data)
 
 
@@ -100,7 +87,26 @@ class CalendarFeedView(APIView):
         except ValueError:
             return Response(status=404)
 
+        # Calendar clients poll often; let them revalidate against the manifest instead of downloading.
+        etag, last_modified = ChurchCalendarFeedService.get_validators(scope, canceled=canceled)
+        validators = {}
+        if etag:
+            validators["ETag"] = quote_etag(etag)
+        if last_modified:
+            validators["Last-Modified"] = http_date(last_modified.timestamp())
+        conditional_response = get_conditional_response(
+            request,
+            etag=validators.get("ETag"),
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if conditional_response is not None:
+            for header, value in validators.items():
+                conditional_response[header] = value
+            return conditional_response
+
         response = FileResponse(open(feed_path, "rb"), content_type="text/calendar; charset=utf-8")
+        for header, value in validators.items():
+            response[header] = value
         disposition = "attachment" if request.GET.get("download") == "1" else "inline"
         response["Content-Disposition"] = (
             f'{disposition}; filename="{get_calendar_feed_filename(scope, canceled=canceled)}"'
@@ -111,6 +117,23 @@ class CalendarFeedView(APIView):
 class AudioTrackView(APIView):
     permission_classes = [ReadOnly]
 
+    @staticmethod
+    def _duration(file_path):
+        """Whole seconds of a combined track, from its ``AudioTrack`` record when it has one."""
+        from office.models import AudioTrack
+
+        key = os.path.splitext(os.path.basename(file_path))[0]
+        try:
+            duration = AudioTrack.objects.filter(key=key).values_list("duration", flat=True).first()
+        except Exception:
+            duration = None
+        if duration is None:
+            try:
+                duration = MP3(file_path).info.length
+            except Exception:
+                return "Unknown"  # Fallback if metadata cannot be read
+        return int(duration)
+
     def get(self, request, *args, **kwargs):
         filename = kwargs["track"]
         # `track` may include a provider subfolder (e.g. "fish/<uuid>.mp3").
@@ -125,12 +148,7 @@ class AudioTrackView(APIView):
         if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
             return HttpResponseNotFound("Audio file not found.")
 
-        try:
-            audio = MP3(file_path)
-            duration = int(audio.info.length)  # Duration in seconds
-        except Exception:
-            duration = "Unknown"  # Fallback if metadata cannot be read
-
+        duration = self._duration(file_path)
         file_size = os.path.getsize(file_path)
         range_header = request.META.get("HTTP_RANGE", "").strip()
         start, end = self._parse_range(range_header, file_size)
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class ChurchcalConfig(AppConfig):
+    name = "churchcal"
+
+    def ready(self):
+        from churchcal.signals import connect_signals
+
+        connect_signals()
@@ -1,7 +1,7 @@
+from copy import copy
 from datetime import datetime, timedelta, date
 
 from dateutil.parser import parse
-from django.core.cache import cache
 from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
 from indexed import IndexedOrderedDict
@@ -238,6 +238,18 @@ class CalendarDate(object):
             self.primary = self.optional[0]
         self.finalized = True
 
+    def detach(self):
+        """Return a copy of this date that no longer references its whole ChurchYear.
+
+        The copy carries a ChurchYearReference instead, so it can be pickled and
+        cached on its own without dragging the other ~364 days along with it.
+        """
+        # Resolve the proper while the year's proper_lookup is still reachable.
+        self.proper
+        detached = copy(self)
+        detached.year = ChurchYearReference(self.year)
+        return detached
+
     def __repr__(self):
         return "{} {} - {}".format(
             self.date.strftime("%A"),
@@ -319,14 +331,6 @@ class ChurchYear(object):
     def __iter__(self):
         return ChurchYearIterator(self)
 
-    #
-    # # in case we want to cache by day instead of year
-    # def build_from_cache(self):
-    #     for name, date in self.dates.items():
-    #         self.dates[name] = cache.get(name)
-    #         if not self.dates[name]:
-    #             return self.build_from_scratch()
-
     def build_from_scratch(self):
         self.seasons = self._get_seasons()
         self.season_tracker = None
@@ -512,6 +516,20 @@ class ChurchYear(object):
             return None
 
 
+class ChurchYearReference(object):
+    """The year-level values a detached CalendarDate still needs."""
+
+    def __init__(self, church_year):
+        self.calendar = church_year.calendar
+        self.start_year = church_year.start_year
+        self.end_year = church_year.end_year
+        self.start_date = church_year.start_date
+        self.end_date = church_year.end_date
+        self.mass_year = church_year.mass_year
+        self.daily_mass_year = church_year.daily_mass_year
+        self.office_year = church_year.office_year
+
+
 class CalendarYear(object):
     def __iter__(self):
         return ChurchYearIterator(self)
@@ -845,7 +863,7 @@ def to_date(date_string):
         return date_string.date()
 
     if isinstance(date_string, date):
-        return date
+        return date_string
 
     if isinstance(date_string, str):
         try:
@@ -856,17 +874,31 @@ def to_date(date_string):
     return None
 
 
-def get_church_year(date_string):
+def get_advent_year(date_string):
     date = to_date(date_string)
-    advent_start = advent(date.year)
-    year = date.year if date >= advent_start else date.year - 1
-    church_year = cache.get(str(year)) if settings.USE_CALENDAR_CACHE else None
-    if not church_year:
-        church_year = ChurchYear(year)
-        cache.set(str(year), church_year, 60 * 60 * 12)
-    return church_year
-
-
-def get_calendar_date(date_string):
-    church_year = get_church_year(date_string)
-    return church_year.get_date(date_string)
+    return date.year if date >= advent(date.year) else date.year - 1
+
+
+def get_church_year(date_string, calendar="ACNA_BCP2019"):
+    return load_church_year(get_advent_year(date_string), calendar)
+
+
+def load_church_year(year, calendar="ACNA_BCP2019"):
+    if not settings.USE_CALENDAR_CACHE:
+        return ChurchYear(year, calendar)
+
+    from churchcal.snapshots import ChurchYearSnapshotStore
+
+    return ChurchYearSnapshotStore.get(year, calendar)
+
+
+def get_calendar_date(date_string, calendar="ACNA_BCP2019"):
+    from churchcal.calendar_cache import CalendarCache
+
+    return CalendarCache.get_date(to_date(date_string), calendar)
+
+
+def get_calendar_dates(dates, calendar="ACNA_BCP2019"):
+    from churchcal.calendar_cache import CalendarCache
+
+    return CalendarCache.get_dates([to_date(date_string) for date_string in dates], calendar)
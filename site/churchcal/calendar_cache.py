@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from django.core.cache import cache
+
+from churchcal.calculations import CalendarDate, get_advent_year, load_church_year
+from churchcal.snapshots import CHURCH_YEAR_SNAPSHOT_VERSION, DEFAULT_CALENDAR
+from website import settings
+
+
+class CalendarCache:
+    """The one cache in front of ChurchYear for offices, readings and the calendar API.
+
+    Every day is stored under its own namespaced key (calendar abbreviation +
+    ISO date) with a cache ``version`` that follows the snapshot format, so a
+    change to the pickled shape never reads an incompatible entry and
+    calendars other than the default can never collide with it.
+
+    Keys also carry a generation token that ``churchcal/signals.py`` bumps
+    whenever a commemoration, proper, season, rank or collect changes, so an
+    edit is never answered from the detached rows pickled before it.
+
+    ``warm_calendar_cache`` fills every served year at deploy and again each
+    night from cron; entries outlive the gap between two runs, so a warmed
+    day is never evicted before it is warmed again.
+    """
+
+    NAMESPACE = "churchcal:calendar_date"
+    GENERATION_KEY = "churchcal:calendar_date:generation"
+    VERSION = CHURCH_YEAR_SNAPSHOT_VERSION
+    TIMEOUT = 60 * 60 * 36
+
+    @classmethod
+    def generation(cls):
+        return cache.get_or_set(cls.GENERATION_KEY, lambda: uuid.uuid4().hex, None)
+
+    @classmethod
+    def invalidate(cls):
+        cache.set(cls.GENERATION_KEY, uuid.uuid4().hex, None)
+
+    @classmethod
+    def key(cls, day: date, calendar: str = DEFAULT_CALENDAR, generation: str | None = None) -> str:
+        return f"{cls.NAMESPACE}:{generation or cls.generation()}:{calendar}:{day.isoformat()}"
+
+    @classmethod
+    def get_date(cls, day: date, calendar: str = DEFAULT_CALENDAR) -> CalendarDate | None:
+        return cls.get_dates([day], calendar)[0]
+
+    @classmethod
+    def get_dates(cls, days: list[date], calendar: str = DEFAULT_CALENDAR) -> list[CalendarDate | None]:
+        """Resolve many dates with one ``get_many`` and at most one load per missing church year."""
+        generation = cls.generation()
+        keys = [cls.key(day, calendar, generation) for day in days]
+        found = cache.get_many(keys, version=cls.VERSION) if settings.USE_CALENDAR_CACHE else {}
+
+        missing_years = sorted({get_advent_year(day) for day, key in zip(days, keys) if key not in found})
+        for year in missing_years:
+            found.update(cls.store_year(load_church_year(year, calendar), calendar, generation))
+
+        return [found.get(key) for key in keys]
+
+    @classmethod
+    def store_year(
+        cls, church_year, calendar: str = DEFAULT_CALENDAR, generation: str | None = None
+    ) -> dict[str, CalendarDate]:
+        """Detach every day of ``church_year`` and store each under its own key.
+
+        Returns the detached dates by cache key so callers that had to load the
+        year can answer from it without a second round trip to the cache.
+        """
+        generation = generation or cls.generation()
+        detached = {
+            cls.key(calendar_date.date, calendar, generation): calendar_date.detach() for calendar_date in church_year
+        }
+        if settings.USE_CALENDAR_CACHE:
+            cache.set_many(detached, cls.TIMEOUT, version=cls.VERSION)
+        return detached
+
+    @classmethod
+    def warm_year(cls, year: int, calendar: str = DEFAULT_CALENDAR) -> int:
+        return len(cls.store_year(load_church_year(year, calendar), calendar))
@@ -1,27 +1,47 @@
 from __future__ import annotations
 
+import fcntl
+import hashlib
 import json
+import logging
 import os
 import tempfile
+import pickle
+import threading
+import zlib
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from functools import cached_property
 from pathlib import Path
 from typing import Iterable
 
 from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Max
 from django.utils import timezone
 from icalendar import Calendar, Event
 
-from churchcal.calculations import ChurchYear
+from churchcal.mass_readings import MassLectionary, MassReadingSource
 from churchcal.models import MassReading
+from churchcal.snapshots import DEFAULT_CALENDAR, ChurchYearSnapshotStore, get_calendar_source_fingerprint
 from churchcal.utils import advent
 from office.models import HolyDayOfficeDay, StandardOfficeDay, ThirtyDayPsalterDay
 
+logger = logging.getLogger(__name__)
+
 VALID_CALENDAR_FEED_SCOPES = ("major", "major_minor", "every")
 
 PUBLIC_SITE_BASE_URL = "https://www.dailyoffice2019.com"
 CALENDAR_FEED_DIRECTORY_NAME = "calendar_feeds"
 CALENDAR_FEED_MANIFEST_NAME = "manifest.json"
+CALENDAR_FEED_LOCK_NAME = ".regenerate.lock"
+CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+# Bump whenever FeedDay or the event serialization changes so compiled years are rebuilt.
+FEED_YEAR_VERSION = 1
+FEED_YEAR_DIRECTORY_NAME = "years"
+DTSTAMP_PLACEHOLDER = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
 
 CALENDAR_FEED_LABELS = {
     "major": "Major Feasts",
@@ -53,6 +73,10 @@ def get_calendar_feed_manifest_path() -> Path:
     return get_calendar_feed_directory() / CALENDAR_FEED_MANIFEST_NAME
 
 
+def get_calendar_feed_lock_path() -> Path:
+    return get_calendar_feed_directory() / CALENDAR_FEED_LOCK_NAME
+
+
 def get_calendar_feed_filename(scope: str, canceled: bool = False) -> str:
     suffix = "-cancel" if canceled else ""
     return f"acna-{scope}{suffix}.ics"
@@ -62,6 +86,37 @@ def get_calendar_feed_path(scope: str, canceled: bool = False) -> Path:
     return get_calendar_feed_directory() / get_calendar_feed_filename(scope, canceled=canceled)
 
 
+def acquire_lock(lock_path: Path, blocking: bool = True):
+    """An open lock file holding an exclusive ``flock``, or None if it is taken and ``blocking`` is off.
+
+    Closing the file releases the lock, including when the process dies.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_file = open(lock_path, "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def write_chunks_atomic(path: Path, chunks: Iterable[bytes]) -> dict[str, object]:
+    """Stream ``chunks`` into ``path`` through a temporary file; returns the size and ETag of the result."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temporary_file:
+        for chunk in chunks:
+            temporary_file.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+        temp_name = temporary_file.name
+
+    os.replace(temp_name, path)
+    return {"size": size, "etag": digest.hexdigest()[:32]}
+
+
 @dataclass(frozen=True)
 class OfficeDayDetails:
     mp_psalms_30_day: str
@@ -199,125 +254,157 @@ class OfficeReadingsResolver:
 
 
 class MassReadingsResolver:
-    def __init__(self):
-        self.cache: dict[tuple, tuple[str, ...]] = {}
+    @cached_property
+    def lectionary(self) -> MassLectionary:
+        return MassLectionary.current()
 
     def resolve(self, calendar_date) -> tuple[str, ...]:
         if calendar_date.primary.rank.precedence_rank > 4:
             return ()
 
-        key = self._cache_key(calendar_date)
-        if key in self.cache:
-            return self.cache[key]
-
-        citations = tuple(
+        return tuple(
             reading.long_citation
-            for reading in self._get_queryset(
-                calendar_date.primary, calendar_date.proper, calendar_date.year.mass_year
-            )
+            for reading in self.lectionary.readings(MassReadingSource.for_calendar_date(calendar_date))
             if reading.long_citation
         )
-        self.cache[key] = citations
-        return citations
 
-    def _cache_key(self, calendar_date) -> tuple:
-        commemoration = self._resolve_original_commemoration(calendar_date.primary)
-        proper = self._resolve_original_proper(calendar_date.primary, calendar_date.proper)
-        return (
-            getattr(commemoration, "pk", None) or getattr(commemoration, "original_pk", None),
-            getattr(proper, "pk", None),
-            calendar_date.year.mass_year,
-            calendar_date.primary.name,
-        )
-
-    def _resolve_original_commemoration(self, commemoration):
-        if hasattr(commemoration, "original_commemoration") and commemoration.original_commemoration:
-            return commemoration.original_commemoration
-        return commemoration
 
-    def _resolve_original_proper(self, commemoration, proper):
-        if hasattr(commemoration, "original_proper") and commemoration.original_proper:
-            return commemoration.original_proper
-        if hasattr(commemoration, "proper") and commemoration.proper:
-            return commemoration.proper
-        return proper
-
-    def _get_queryset(self, commemoration, proper, year, time="morning"):
-        original_commemoration = self._resolve_original_commemoration(commemoration)
-        original_proper = self._resolve_original_proper(commemoration, proper)
+@dataclass(frozen=True)
+class FeedYear:
+    """One church year of feed days plus every scope's events, serialized except for ``DTSTAMP``.
+
+    Each event is kept as the bytes before and after its ``DTSTAMP`` line, so
+    a feed is written by splicing in the build's timestamp and concatenating.
+    """
+
+    start_year: int
+    feed_days: tuple[FeedDay, ...]
+    events: dict[tuple[str, bool], tuple[tuple[bytes, bytes], ...]]
+
+
+def get_feed_source_fingerprint(calendar: str = DEFAULT_CALENDAR) -> str:
+    """The church year fingerprint extended with the office and lectionary tables a feed day reads."""
+    sources = (
+        ("standard_office_day", StandardOfficeDay.objects.all()),
+        ("holy_day_office_day", HolyDayOfficeDay.objects.all()),
+        ("psalter_day", ThirtyDayPsalterDay.objects.all()),
+        ("mass_reading", MassReading.objects.all()),
+    )
+    parts = [get_calendar_source_fingerprint(calendar)]
+    for name, queryset in sources:
+        summary = queryset.order_by().aggregate(count=Count("pk"), updated=Max("updated"))
+        updated = summary["updated"].isoformat() if summary["updated"] else ""
+        parts.append(f"{name}:{summary['count']}:{updated}")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class FeedYearStore:
+    """Compiled ``FeedYear`` artifacts next to the feeds, laid out like ``ChurchYearSnapshotStore``.
+
+    A one-line JSON header (format version, year, source fingerprint) is
+    followed by a zlib-compressed pickle, so a stale year is detected
+    without unpickling it.
+    """
 
-        if original_proper and commemoration.rank.name == "SUNDAY":
-            query = MassReading.objects.filter(years__contains=year, proper=original_proper)
-        else:
-            commemoration_id = getattr(original_commemoration, "original_pk", None) or getattr(
-                original_commemoration, "pk", None
-            )
-            query = MassReading.objects.filter(years__contains=year, commemoration_id=commemoration_id)
+    @classmethod
+    def path(cls, year: int) -> Path:
+        return get_calendar_feed_directory() / FEED_YEAR_DIRECTORY_NAME / f"{int(year)}.feedyear"
 
-        if year in ["A", "C"] and time == "morning":
-            query = query.order_by("reading_number", "-order")
-        else:
-            query = query.order_by("reading_number", "order")
+    @classmethod
+    def load(cls, year: int, fingerprint: str) -> FeedYear | None:
+        try:
+            with cls.path(year).open("rb") as artifact:
+                try:
+                    header = json.loads(artifact.readline())
+                except ValueError:
+                    return None
+                if header != {"version": FEED_YEAR_VERSION, "year": int(year), "fingerprint": fingerprint}:
+                    return None
+                return pickle.loads(zlib.decompress(artifact.read()))
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
 
-        if commemoration.name == "Eve of Easter Day":
-            query = query.filter(abbreviation="EasterEve")
+    @classmethod
+    def save(cls, feed_year: FeedYear, fingerprint: str) -> Path:
+        header = {"version": FEED_YEAR_VERSION, "year": feed_year.start_year, "fingerprint": fingerprint}
+        content = json.dumps(header).encode("utf-8") + b"\n"
+        content += zlib.compress(pickle.dumps(feed_year, protocol=pickle.HIGHEST_PROTOCOL))
+        path = cls.path(feed_year.start_year)
+        ChurchCalendarFeedService._write_atomic(path, content)
+        return path
 
-        if commemoration.name == "Easter Day":
-            if time == "morning":
-                query = query.filter(service="Principal Service")
-            else:
-                query = query.filter(service="Evening Service")
 
-        if commemoration.name == "Eve of The Nativity of our Lord Jesus Christ: Christmas Day":
-            query = query.filter(service="I")
+def _dtstamp_line(dtstamp: datetime) -> bytes:
+    event = Event()
+    event.add("dtstamp", dtstamp)
+    return next(line for line in event.to_ical().splitlines(keepends=True) if line.startswith(b"DTSTAMP"))
 
-        if commemoration.name == "The Nativity of Our Lord Jesus Christ: Christmas Day":
-            if time == "morning":
-                query = query.filter(service="II")
-            else:
-                query = query.filter(service="III")
 
-        if commemoration.name in ["Eve of Palm Sunday", "Palm Sunday"]:
-            query = query.filter(service="Liturgy of the Word")
+class ChurchCalendarFeedBuilder:
+    def __init__(self):
+        self.generated_at = timezone.now()
 
-        readings = list(query.all())
-        if readings:
-            return readings
+    @cached_property
+    def office_resolver(self) -> OfficeReadingsResolver:
+        return OfficeReadingsResolver()
 
-        saint_type = getattr(original_commemoration, "saint_type", None)
-        if saint_type:
-            return list(
-                MassReading.objects.filter(common__abbreviation=saint_type).order_by("reading_number", "order")
-            )
+    @cached_property
+    def mass_resolver(self) -> MassReadingsResolver:
+        return MassReadingsResolver()
 
-        return readings
+    @cached_property
+    def fingerprint(self) -> str:
+        return get_feed_source_fingerprint()
 
-
-class ChurchCalendarFeedBuilder:
-    def __init__(self):
-        self.office_resolver = OfficeReadingsResolver()
-        self.mass_resolver = MassReadingsResolver()
-        self.generated_at = timezone.now()
+    def feed_year(self, year_start: int) -> FeedYear:
+        """The compiled year from disk, built (from the church year snapshot) only when missing or stale."""
+        feed_year = FeedYearStore.load(year_start, self.fingerprint)
+        if feed_year is None:
+            feed_year = self._build_feed_year(year_start)
+            FeedYearStore.save(feed_year, self.fingerprint)
+        return feed_year
 
     def build_feed_days(self, today: date | None = None) -> list[FeedDay]:
+        today = today or timezone.localdate()
+        return [
+            feed_day
+            for year_start in get_feed_window_start_years(today)
+            for feed_day in self.feed_year(year_start).feed_days
+        ]
+
+    def write_all(self, today: date | None = None) -> dict[tuple[str, bool], dict[str, object]]:
+        """Stream every scope's feed to disk; returns the size and ETag of each file."""
         today = today or timezone.localdate()
         years = get_feed_window_start_years(today)
-        feed_days: list[FeedDay] = []
-        for year_start in years:
-            church_year = ChurchYear(year_start)
-            for calendar_date in church_year:
-                feed_days.append(self._build_feed_day(calendar_date))
-        return sorted(feed_days, key=lambda feed_day: feed_day.event_date)
-
-    def build_all(self, today: date | None = None) -> dict[tuple[str, bool], bytes]:
-        feed_days = self.build_feed_days(today=today)
-        calendars: dict[tuple[str, bool], bytes] = {}
+        feed_years = [self.feed_year(year_start) for year_start in years]
+
+        files = {}
         for scope in VALID_CALENDAR_FEED_SCOPES:
-            calendars[(scope, False)] = self.serialize(scope, feed_days, canceled=False)
-            calendars[(scope, True)] = self.serialize(scope, feed_days, canceled=True)
-        return calendars
+            for canceled in (False, True):
+                events = (event for feed_year in feed_years for event in feed_year.events[(scope, canceled)])
+                files[(scope, canceled)] = write_chunks_atomic(
+                    get_calendar_feed_path(scope, canceled=canceled), self.iter_ical(scope, events, canceled=canceled)
+                )
+        return files
 
     def serialize(self, scope: str, feed_days: Iterable[FeedDay], canceled: bool = False) -> bytes:
+        events = (
+            self._serialize_event(scope, feed_day, canceled)
+            for feed_day in feed_days
+            if feed_day.should_include_for_scope(scope)
+        )
+        return b"".join(self.iter_ical(scope, events, canceled=canceled))
+
+    def iter_ical(self, scope: str, events: Iterable[tuple[bytes, bytes]], canceled: bool = False) -> Iterable[bytes]:
+        """The feed as byte chunks: the calendar header, each event with this build's ``DTSTAMP``, the footer."""
+        header = self._calendar(scope, canceled).to_ical()
+        yield header[: -len(CALENDAR_FOOTER)]
+        dtstamp = _dtstamp_line(self.generated_at)
+        for before, after in events:
+            yield before + dtstamp + after
+        yield CALENDAR_FOOTER
+
+    def _calendar(self, scope: str, canceled: bool) -> Calendar:
         label = get_feed_scope_label(scope)
         calendar = Calendar()
         calendar.add("prodid", "-//Daily Office 2019//ACNA Calendar//dailyoffice2019.com//")
@@ -331,35 +418,51 @@ class ChurchCalendarFeedBuilder:
         )
         calendar.add("x-published-ttl", "PT12H")
         calendar.add("method", "CANCEL" if canceled else "PUBLISH")
+        return calendar
+
+    def _serialize_event(self, scope: str, feed_day: FeedDay, canceled: bool) -> tuple[bytes, bytes]:
+        event = Event()
+        event.add("uid", f"acna-{scope}-{feed_day.event_uid_date}@dailyoffice2019.com")
+        event.add("summary", feed_day.summary_for_scope(scope))
+        event.add("dtstart", feed_day.event_date)
+        event.add("dtend", feed_day.event_date + timedelta(days=1))
+        event.add("dtstamp", DTSTAMP_PLACEHOLDER)
+        event.add("sequence", 1 if canceled else 0)
+        event.add("url", feed_day.day_page_url)
+
+        if canceled:
+            event.add("status", "CANCELLED")
+            event.add(
+                "description",
+                (
+                    "Cancellation event for removing a previously imported Daily Office calendar item. "
+                    "Subscription is still the safer option for ongoing updates."
+                ),
+            )
+        else:
+            event.add("description", "\n".join(feed_day.description_lines()))
 
-        for feed_day in feed_days:
-            if not feed_day.should_include_for_scope(scope):
-                continue
-
-            event = Event()
-            event.add("uid", f"acna-{scope}-{feed_day.event_uid_date}@dailyoffice2019.com")
-            event.add("summary", feed_day.summary_for_scope(scope))
-            event.add("dtstart", feed_day.event_date)
-            event.add("dtend", feed_day.event_date + timedelta(days=1))
-            event.add("dtstamp", self.generated_at)
-            event.add("sequence", 1 if canceled else 0)
-            event.add("url", feed_day.day_page_url)
-
-            if canceled:
-                event.add("status", "CANCELLED")
-                event.add(
-                    "description",
-                    (
-                        "Cancellation event for removing a previously imported Daily Office calendar item. "
-                        "Subscription is still the safer option for ongoing updates."
-                    ),
-                )
-            else:
-                event.add("description", "\n".join(feed_day.description_lines()))
-
-            calendar.add_component(event)
+        before, after = event.to_ical().split(_dtstamp_line(DTSTAMP_PLACEHOLDER))
+        return before, after
 
-        return calendar.to_ical()
+    def _build_feed_year(self, year_start: int) -> FeedYear:
+        church_year = ChurchYearSnapshotStore.get(year_start)
+        feed_days = tuple(
+            sorted(
+                (self._build_feed_day(calendar_date) for calendar_date in church_year),
+                key=lambda feed_day: feed_day.event_date,
+            )
+        )
+        events = {
+            (scope, canceled): tuple(
+                self._serialize_event(scope, feed_day, canceled)
+                for feed_day in feed_days
+                if feed_day.should_include_for_scope(scope)
+            )
+            for scope in VALID_CALENDAR_FEED_SCOPES
+            for canceled in (False, True)
+        }
+        return FeedYear(year_start, feed_days, events)
 
     def _build_feed_day(self, calendar_date) -> FeedDay:
         major_feast_name = calendar_date.required[0].name if calendar_date.required else None
@@ -383,43 +486,90 @@ class ChurchCalendarFeedBuilder:
 
 
 class ChurchCalendarFeedService:
+    """Builds the ICS feeds once a day and serves them from disk.
+
+    Rebuilding takes a while, so only one process does it at a time: a
+    ``flock`` on a file next to the feeds is the cross-process lock. When the
+    feeds are merely out of date, requests keep serving the previous files
+    while one background thread rebuilds them; only a missing feed makes a
+    request wait for a build.
+    """
+
     @classmethod
     def ensure_current(cls, today: date | None = None, force: bool = False) -> dict[str, object]:
         today = today or timezone.localdate()
         manifest = cls._read_manifest()
         if force or cls._manifest_is_stale(manifest, today):
-            cls._regenerate(today)
-            manifest = cls._read_manifest()
+            lock_file = cls._acquire_lock(blocking=True)
+            try:
+                # Whoever held the lock before us may already have rebuilt the feeds.
+                manifest = cls._read_manifest()
+                if force or cls._manifest_is_stale(manifest, today):
+                    cls._regenerate(today)
+                    manifest = cls._read_manifest()
+            finally:
+                lock_file.close()
         return manifest
 
     @classmethod
     def get_feed_path(cls, scope: str, canceled: bool = False, today: date | None = None) -> Path:
         get_feed_scope_label(scope)
-        cls.ensure_current(today=today)
+        today = today or timezone.localdate()
+        manifest = cls._read_manifest()
+        if cls._manifest_is_stale(manifest, today):
+            if manifest and cls._feeds_exist():
+                cls.refresh_in_background(today)
+            else:
+                cls.ensure_current(today=today)
         return get_calendar_feed_path(scope, canceled=canceled)
 
     @classmethod
-    def _regenerate(cls, today: date) -> None:
-        builder = ChurchCalendarFeedBuilder()
-        calendars = builder.build_all(today=today)
+    def refresh_in_background(cls, today: date) -> threading.Thread | None:
+        """Start rebuilding the feeds in a daemon thread unless another process or thread already is."""
+        lock_file = cls._acquire_lock(blocking=False)
+        if lock_file is None:
+            return None
 
-        directory = get_calendar_feed_directory()
-        directory.mkdir(parents=True, exist_ok=True)
+        thread = threading.Thread(
+            target=cls._refresh_and_release, args=(today, lock_file), name="calendar-feed-refresh", daemon=True
+        )
+        thread.start()
+        return thread
 
-        for (scope, canceled), content in calendars.items():
-            cls._write_atomic(get_calendar_feed_path(scope, canceled=canceled), content)
+    @classmethod
+    def get_validators(cls, scope: str, canceled: bool = False) -> tuple[str | None, datetime | None]:
+        """The ETag and last-modified time of a feed file, as recorded in the manifest."""
+        manifest = cls._read_manifest() or {}
+        entry = manifest.get("files", {}).get(get_calendar_feed_filename(scope, canceled=canceled), {})
+        generated_at = manifest.get("generated_at")
+        return entry.get("etag"), datetime.fromisoformat(generated_at) if generated_at else None
+
+    @classmethod
+    def _refresh_and_release(cls, today: date, lock_file) -> None:
+        try:
+            if cls._manifest_is_stale(cls._read_manifest(), today):
+                cls._regenerate(today)
+        except Exception:
+            logger.exception("Calendar feed regeneration failed")
+        finally:
+            lock_file.close()
+            connections.close_all()
+
+    @classmethod
+    def _acquire_lock(cls, blocking: bool):
+        return acquire_lock(get_calendar_feed_lock_path(), blocking=blocking)
+
+    @classmethod
+    def _regenerate(cls, today: date) -> None:
+        files = ChurchCalendarFeedBuilder().write_all(today=today)
 
         manifest = {
             "build_date": today.isoformat(),
             "window_start_years": get_feed_window_start_years(today),
             "generated_at": timezone.now().isoformat(),
             "files": {
-                get_calendar_feed_filename(scope, canceled=canceled): {
-                    "scope": scope,
-                    "canceled": canceled,
-                    "size": len(content),
-                }
-                for (scope, canceled), content in calendars.items()
+                get_calendar_feed_filename(scope, canceled=canceled): {"scope": scope, "canceled": canceled, **details}
+                for (scope, canceled), details in files.items()
             },
         }
         cls._write_atomic(get_calendar_feed_manifest_path(), json.dumps(manifest, indent=2).encode("utf-8"))
@@ -428,13 +578,15 @@ class ChurchCalendarFeedService:
     def _manifest_is_stale(cls, manifest: dict[str, object] | None, today: date) -> bool:
         if not manifest or manifest.get("build_date") != today.isoformat():
             return True
+        return not cls._feeds_exist()
 
-        for scope in VALID_CALENDAR_FEED_SCOPES:
-            if not get_calendar_feed_path(scope).exists():
-                return True
-            if not get_calendar_feed_path(scope, canceled=True).exists():
-                return True
-        return False
+    @classmethod
+    def _feeds_exist(cls) -> bool:
+        return all(
+            get_calendar_feed_path(scope, canceled=canceled).exists()
+            for scope in VALID_CALENDAR_FEED_SCOPES
+            for canceled in (False, True)
+        )
 
     @classmethod
     def _read_manifest(cls) -> dict[str, object] | None:
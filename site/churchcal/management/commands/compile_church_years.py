@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from churchcal.snapshots import DEFAULT_CALENDAR, ChurchYearSnapshotStore, get_calendar_source_fingerprint
+
+
+class Command(BaseCommand):
+    help = "Compile ChurchYear snapshot artifacts so get_church_year can load them instead of rebuilding."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calendar", default=DEFAULT_CALENDAR, help="Calendar abbreviation to compile.")
+        parser.add_argument("--start", type=int, default=settings.FIRST_BEGINNING_YEAR, help="First advent year.")
+        parser.add_argument("--end", type=int, default=settings.LAST_BEGINNING_YEAR, help="Last advent year.")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild every year, even when the existing artifact is current.",
+        )
+
+    def handle(self, *args, **options):
+        calendar = options["calendar"]
+        fingerprint = get_calendar_source_fingerprint(calendar)
+        built = 0
+        for year in range(options["start"], options["end"] + 1):
+            if not options["force"] and ChurchYearSnapshotStore.is_current(year, calendar, fingerprint=fingerprint):
+                self.stdout.write(f"{calendar} {year}: current")
+                continue
+            ChurchYearSnapshotStore.build(year, calendar, fingerprint=fingerprint)
+            built += 1
+            self.stdout.write(f"{calendar} {year}: compiled")
+
+        self.stdout.write(self.style.SUCCESS(f"Compiled {built} {calendar} church year snapshot(s)."))
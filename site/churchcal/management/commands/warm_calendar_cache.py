@@ -0,0 +1,27 @@
+import kronos
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from churchcal.calendar_cache import CalendarCache
+from churchcal.snapshots import DEFAULT_CALENDAR
+
+
+# Entries expire after CalendarCache.TIMEOUT; re-warm daily so they never lapse.
+@kronos.register("30 3 * * *")
+class Command(BaseCommand):
+    help = "Pre-warm the per-day calendar cache for every church year the site serves."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calendar", default=DEFAULT_CALENDAR, help="Calendar abbreviation to warm.")
+        parser.add_argument("--start", type=int, default=settings.FIRST_BEGINNING_YEAR, help="First advent year.")
+        parser.add_argument("--end", type=int, default=settings.LAST_BEGINNING_YEAR, help="Last advent year.")
+
+    def handle(self, *args, **options):
+        calendar = options["calendar"]
+        total = 0
+        for year in range(options["start"], options["end"] + 1):
+            count = CalendarCache.warm_year(year, calendar)
+            total += count
+            self.stdout.write(f"{calendar} {year}: {count} days cached")
+
+        self.stdout.write(self.style.SUCCESS(f"Warmed {total} {calendar} calendar days."))
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from churchcal.models import MassReading, SanctoraleCommemoration
+from website.generations import GenerationCachedSnapshot
+
+
+def _pk(instance):
+    """Primary key of a model instance, following ``BaseModel.copy`` back to the stored row."""
+    return getattr(instance, "original_pk", None) or getattr(instance, "pk", None)
+
+
+class MassReadingSource(NamedTuple):
+    """Which lectionary entries a commemoration or proper reads from, reduced to plain values."""
+
+    proper: object
+    commemoration: object
+    year: str
+    time: str
+    name: str | None
+    saint_type: str | None
+    descending_order: bool
+
+    @classmethod
+    def for_commemoration(cls, commemoration, year, time="morning") -> MassReadingSource:
+        original = getattr(commemoration, "original_commemoration", None) or commemoration
+        proper = getattr(commemoration, "original_proper", None) or getattr(commemoration, "proper", None)
+        saint_type = (
+            getattr(original, "saint_type", None) if isinstance(commemoration, SanctoraleCommemoration) else None
+        )
+        descending_order = year in ["A", "C"] and time == "morning"
+        return cls(_pk(proper), _pk(original), year, time, commemoration.name, saint_type, descending_order)
+
+    @classmethod
+    def for_proper(cls, proper, year) -> MassReadingSource:
+        return cls(_pk(proper), None, year, "morning", None, None, False)
+
+    @classmethod
+    def for_calendar_date(cls, calendar_date) -> MassReadingSource:
+        """Mirrors ``CalendarDate.mass_readings``."""
+        if calendar_date.proper and calendar_date.primary.rank.name in ["SUNDAY"]:
+            return cls.for_proper(calendar_date.proper, calendar_date.year.mass_year)
+        return cls.for_commemoration(calendar_date.primary, calendar_date.year.mass_year)
+
+
+# Services kept for commemorations whose lectionary entry lists several, by time of day.
+SERVICES_BY_NAME = {
+    "Easter Day": {"morning": "Principal Service", "evening": "Evening Service"},
+    "Eve of The Nativity of our Lord Jesus Christ: Christmas Day": {"morning": "I", "evening": "I"},
+    "The Nativity of Our Lord Jesus Christ: Christmas Day": {"morning": "II", "evening": "III"},
+    "Eve of Palm Sunday": {"morning": "Liturgy of the Word", "evening": "Liturgy of the Word"},
+    "Palm Sunday": {"morning": "Liturgy of the Word", "evening": "Liturgy of the Word"},
+}
+
+# Services that belong to the feast itself rather than to its eve.
+FEAST_DAY_SERVICES = frozenset({"II", "III", "Early Service", "Principal Service", "Evening Service"})
+
+
+class MassLectionary(GenerationCachedSnapshot):
+    """The whole mass lectionary in memory, indexed by proper, commemoration and common.
+
+    ``readings`` applies the year filter, ordering and Easter/Christmas/Palm
+    Sunday service rules of the lectionary, and ``all_readings`` lists every
+    service for the readings page, so resolving a day never queries
+    ``MassReading``. Scripture text is joined in per translation on first use
+    rather than loading every translation of every passage up front.
+
+    Each process keeps one lectionary until a reading or scripture passage is
+    edited (see ``churchcal/signals.py``).
+    """
+
+    GENERATION_KEY = "churchcal:mass_lectionary:generation"
+
+    def __init__(self, readings):
+        self.by_proper = {}
+        self.by_commemoration = {}
+        self.by_common = {}
+        self.scripture_ids = set()
+        self._scripture_texts = {}
+        for reading in readings:
+            if reading.proper_id:
+                self.by_proper.setdefault(reading.proper_id, []).append(reading)
+            if reading.commemoration_id:
+                self.by_commemoration.setdefault(reading.commemoration_id, []).append(reading)
+            if reading.common_id:
+                self.by_common.setdefault(reading.common.abbreviation, []).append(reading)
+            self.scripture_ids.update(
+                scripture_id
+                for scripture_id in (reading.long_scripture_id, reading.short_scripture_id)
+                if scripture_id
+            )
+
+    @classmethod
+    def load(cls) -> MassLectionary:
+        return cls(MassReading.objects.select_related("common").order_by("reading_number", "order"))
+
+    def readings(self, source: MassReadingSource) -> list[MassReading]:
+        if source.proper:
+            candidates = self.by_proper.get(source.proper, ())
+        else:
+            candidates = self.by_commemoration.get(source.commemoration, ())
+        readings = [reading for reading in candidates if source.year in reading.years]
+
+        if source.name == "Eve of Easter Day":
+            readings = [reading for reading in readings if reading.abbreviation == "EasterEve"]
+        if source.name in SERVICES_BY_NAME:
+            service = SERVICES_BY_NAME[source.name][source.time]
+            readings = [reading for reading in readings if reading.service == service]
+
+        if source.descending_order:
+            readings.sort(key=lambda reading: (reading.reading_number, -reading.order))
+        else:
+            readings.sort(key=lambda reading: (reading.reading_number, reading.order))
+
+        if not readings and source.saint_type:
+            readings = sorted(
+                self.by_common.get(source.saint_type, ()),
+                key=lambda reading: (reading.reading_number, reading.order),
+            )
+        return readings
+
+    def all_readings(self, commemoration, year) -> list[MassReading]:
+        """Every service's readings for a commemoration, as listed on the readings page."""
+        original = getattr(commemoration, "original_commemoration", None) or commemoration
+        proper = getattr(commemoration, "original_proper", None) or getattr(commemoration, "proper", None)
+        saint_type = getattr(original, "saint_type", None)
+        if saint_type:
+            readings = list(self.by_common.get(saint_type, ()))
+        elif proper:
+            readings = [reading for reading in self.by_proper.get(_pk(proper), ()) if year in reading.years]
+        else:
+            readings = [reading for reading in self.by_commemoration.get(_pk(original), ()) if year in reading.years]
+            if "Eve of" in original.name:
+                readings = [reading for reading in readings if reading.service not in FEAST_DAY_SERVICES]
+        return sorted(
+            readings,
+            key=lambda reading: (
+                reading.abbreviation is None,
+                reading.abbreviation or "",
+                reading.reading_number,
+                reading.order,
+                reading.service,
+            ),
+        )
+
+    def scripture_text(self, scripture_id, translation) -> str | None:
+        """The text of one lectionary passage in ``translation``, loading that translation on first use."""
+        if translation not in self._scripture_texts:
+            from office.models import Scripture
+
+            self._scripture_texts[translation] = dict(
+                Scripture.objects.filter(pk__in=self.scripture_ids).values_list("pk", translation)
+            )
+        return self._scripture_texts[translation].get(scripture_id)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from churchcal.models import SanctoraleCommemoration
+from website.generations import GenerationCachedSnapshot
+
+
+class SanctoraleEntry(NamedTuple):
+    month: int
+    day: int
+    name: str
+    uuid: object
+
+
+class SanctoraleNeighborIndex(GenerationCachedSnapshot):
+    """Sanctorale commemorations with a one-sentence summary, sorted by month and day.
+
+    Answers ``CommemorationSerializer``'s previous/next lookups with a bisect
+    instead of one ordered query per commemoration. The year is treated as a
+    cycle, so the commemoration before the first of January is the last one of
+    December. Each process keeps one index until a commemoration is edited (see
+    ``churchcal/signals.py``).
+    """
+
+    GENERATION_KEY = "churchcal:sanctorale:generation"
+
+    def __init__(self, entries):
+        self.entries = tuple(sorted(entries, key=lambda entry: (entry.month, entry.day, entry.name)))
+        self.dates = tuple((entry.month, entry.day) for entry in self.entries)
+
+    @classmethod
+    def load(cls) -> SanctoraleNeighborIndex:
+        return cls(
+            SanctoraleEntry(*row)
+            for row in SanctoraleCommemoration.objects.filter(ai_one_sentence__isnull=False).values_list(
+                "month", "day", "name", "uuid"
+            )
+        )
+
+    @staticmethod
+    def _summary(entry):
+        return {"name": entry.name, "uuid": entry.uuid}
+
+    @staticmethod
+    def _uuid(commemoration):
+        return getattr(commemoration, "original_pk", None) or commemoration.uuid
+
+    def _first_other(self, commemoration, start, step):
+        own_uuid = self._uuid(commemoration)
+        count = len(self.entries)
+        for offset in range(count):
+            entry = self.entries[(start + step * offset) % count]
+            if entry.uuid != own_uuid:
+                return self._summary(entry)
+        return None
+
+    def previous(self, commemoration):
+        """The closest entry on or before the commemoration's date, other than itself."""
+        position = bisect_right(self.dates, (commemoration.month, commemoration.day))
+        return self._first_other(commemoration, position - 1, -1)
+
+    def next(self, commemoration):
+        """The closest entry on or after the commemoration's date, other than itself."""
+        position = bisect_left(self.dates, (commemoration.month, commemoration.day))
+        return self._first_other(commemoration, position, 1)
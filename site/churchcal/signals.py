@@ -0,0 +1,62 @@
+from django.db.models.signals import post_delete, post_save
+
+from churchcal.calendar_cache import CalendarCache
+from churchcal.mass_readings import MassLectionary
+from churchcal.models import Commemoration, CommemorationRank, Common, MassReading, Proper, Season
+from churchcal.sanctorale import SanctoraleNeighborIndex
+from office.models import Collect, Scripture
+
+
+def invalidate_sanctorale_neighbors(sender, **kwargs):
+    SanctoraleNeighborIndex.invalidate()
+
+
+def invalidate_calendar_cache(sender, **kwargs):
+    CalendarCache.invalidate()
+
+
+def invalidate_mass_lectionary(sender, **kwargs):
+    MassLectionary.invalidate()
+
+
+def commemoration_models():
+    """``Commemoration`` and every concrete table that inherits from it.
+
+    With multi-table inheritance a save only signals for the class of the
+    instance saved, so a handler has to be connected to each subclass.
+    """
+    models = [Commemoration]
+    for model in models:
+        models.extend(
+            subclass
+            for subclass in model.__subclasses__()
+            if subclass._meta.managed and not subclass._meta.proxy and not subclass._meta.abstract
+        )
+    return models
+
+
+def connect_signals():
+    for model in commemoration_models():
+        post_save.connect(
+            invalidate_sanctorale_neighbors, sender=model, dispatch_uid=f"churchcal_sanctorale_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_sanctorale_neighbors, sender=model, dispatch_uid=f"churchcal_sanctorale_delete_{model.__name__}"
+        )
+
+    for model in (MassReading, Common, Scripture):
+        post_save.connect(
+            invalidate_mass_lectionary, sender=model, dispatch_uid=f"churchcal_lectionary_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_mass_lectionary, sender=model, dispatch_uid=f"churchcal_lectionary_delete_{model.__name__}"
+        )
+
+    # The tables a ChurchYear is built from (see ``get_calendar_source_fingerprint``).
+    for model in (*commemoration_models(), Proper, Season, CommemorationRank, Collect):
+        post_save.connect(
+            invalidate_calendar_cache, sender=model, dispatch_uid=f"churchcal_calendar_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_calendar_cache, sender=model, dispatch_uid=f"churchcal_calendar_delete_{model.__name__}"
+        )
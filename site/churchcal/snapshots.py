@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from churchcal.calculations import ChurchYear
+from churchcal.models import Commemoration, CommemorationRank, Proper, Season
+from office.models import Collect
+
+# Bump whenever ChurchYear/CalendarDate (or anything pickled alongside them)
+# changes shape so that old artifacts are rebuilt instead of unpickled.
+CHURCH_YEAR_SNAPSHOT_VERSION = 1
+
+DEFAULT_CALENDAR = "ACNA_BCP2019"
+CALENDAR_SNAPSHOT_DIRECTORY_NAME = "calendar_snapshots"
+
+
+def get_calendar_snapshot_directory(calendar: str = DEFAULT_CALENDAR) -> Path:
+    return Path(settings.MEDIA_ROOT) / CALENDAR_SNAPSHOT_DIRECTORY_NAME / calendar
+
+
+def get_calendar_snapshot_path(year: int, calendar: str = DEFAULT_CALENDAR) -> Path:
+    return get_calendar_snapshot_directory(calendar) / f"{int(year)}.churchyear"
+
+
+def get_calendar_source_fingerprint(calendar: str = DEFAULT_CALENDAR) -> str:
+    """Summarize every row a ChurchYear is built from.
+
+    Uses the row count and latest ``updated`` timestamp of each source table, so
+    adding, editing or deleting a commemoration, proper, season, rank or collect
+    produces a new fingerprint and invalidates the compiled artifacts.
+    """
+    sources = (
+        ("commemoration", Commemoration.objects.filter(calendar__abbreviation=calendar)),
+        ("proper", Proper.objects.filter(calendar__abbreviation=calendar)),
+        ("season", Season.objects.filter(calendar__abbreviation=calendar)),
+        ("rank", CommemorationRank.objects.filter(calendar__abbreviation=calendar)),
+        ("collect", Collect.objects.all()),
+    )
+    parts = []
+    for name, queryset in sources:
+        summary = queryset.order_by().aggregate(count=Count("pk"), updated=Max("updated"))
+        updated = summary["updated"].isoformat() if summary["updated"] else ""
+        parts.append(f"{name}:{summary['count']}:{updated}")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class ChurchYearSnapshotStore:
+    """Compiled, on-disk ChurchYear artifacts (one file per calendar and advent year).
+
+    Each file is a one-line JSON header followed by a zlib-compressed pickle of
+    the fully built ChurchYear. The header records the snapshot format version
+    and the source fingerprint so a stale artifact can be detected without
+    unpickling it.
+    """
+
+    @classmethod
+    def get(cls, year: int, calendar: str = DEFAULT_CALENDAR) -> ChurchYear:
+        fingerprint = get_calendar_source_fingerprint(calendar)
+        church_year = cls.load(year, calendar, fingerprint=fingerprint)
+        if church_year is None:
+            church_year = cls.build(year, calendar, fingerprint=fingerprint)
+        return church_year
+
+    @classmethod
+    def build(cls, year: int, calendar: str = DEFAULT_CALENDAR, fingerprint: str | None = None) -> ChurchYear:
+        fingerprint = fingerprint or get_calendar_source_fingerprint(calendar)
+        church_year = ChurchYear(int(year), calendar)
+        cls.save(church_year, calendar, fingerprint=fingerprint)
+        return church_year
+
+    @classmethod
+    def load(cls, year: int, calendar: str = DEFAULT_CALENDAR, fingerprint: str | None = None) -> ChurchYear | None:
+        path = get_calendar_snapshot_path(year, calendar)
+        try:
+            with path.open("rb") as snapshot:
+                header = cls._parse_header(snapshot.readline())
+                if not cls._header_is_current(header, year, calendar, fingerprint):
+                    return None
+                return pickle.loads(zlib.decompress(snapshot.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+    @classmethod
+    def is_current(cls, year: int, calendar: str = DEFAULT_CALENDAR, fingerprint: str | None = None) -> bool:
+        path = get_calendar_snapshot_path(year, calendar)
+        try:
+            with path.open("rb") as snapshot:
+                header = cls._parse_header(snapshot.readline())
+        except OSError:
+            return False
+        return cls._header_is_current(header, year, calendar, fingerprint)
+
+    @classmethod
+    def save(cls, church_year: ChurchYear, calendar: str = DEFAULT_CALENDAR, fingerprint: str | None = None) -> Path:
+        fingerprint = fingerprint or get_calendar_source_fingerprint(calendar)
+        header = {
+            "version": CHURCH_YEAR_SNAPSHOT_VERSION,
+            "calendar": calendar,
+            "year": church_year.start_year,
+            "fingerprint": fingerprint,
+        }
+        content = json.dumps(header).encode("utf-8") + b"\n"
+        content += zlib.compress(pickle.dumps(church_year, protocol=pickle.HIGHEST_PROTOCOL))
+        path = get_calendar_snapshot_path(church_year.start_year, calendar)
+        cls._write_atomic(path, content)
+        return path
+
+    @staticmethod
+    def _parse_header(line: bytes) -> dict[str, object] | None:
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _header_is_current(header, year: int, calendar: str, fingerprint: str | None) -> bool:
+        if not isinstance(header, dict):
+            return False
+        if header.get("version") != CHURCH_YEAR_SNAPSHOT_VERSION:
+            return False
+        if header.get("calendar") != calendar or header.get("year") != int(year):
+            return False
+        if fingerprint is not None and header.get("fingerprint") != fingerprint:
+            return False
+        return True
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temporary_file:
+            temporary_file.write(content)
+            temp_name = temporary_file.name
+
+        os.replace(temp_name, path)
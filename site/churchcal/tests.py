@@ -1,20 +1,37 @@
+import json
+import threading
 from datetime import date, datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from django.test import SimpleTestCase, TestCase
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.test import SimpleTestCase, TestCase, override_settings
 from icalendar import Calendar
 
+from churchcal.api.serializer import CommemorationSerializer
+from churchcal.calendar_cache import CalendarCache
 from churchcal.calendar_feeds import (
+    VALID_CALENDAR_FEED_SCOPES,
     ChurchCalendarFeedBuilder,
+    ChurchCalendarFeedService,
     FeedDay,
+    FeedYear,
+    FeedYearStore,
     OfficeDayDetails,
     OfficeReadingsResolver,
+    get_calendar_feed_filename,
+    get_calendar_feed_manifest_path,
+    get_calendar_feed_path,
     get_feed_window_start_years,
 )
 from churchcal.ce_bce_replacement import replace_ce_bce_in_text
+from churchcal.mass_readings import MassLectionary, MassReadingSource
+from churchcal.models import SanctoraleCommemoration, TemporaleCommemoration
+from churchcal.sanctorale import SanctoraleEntry, SanctoraleNeighborIndex
+from churchcal.snapshots import ChurchYearSnapshotStore, get_calendar_snapshot_path
 from churchcal.utils import advent
 from office.models import StandardOfficeDay, ThirtyDayPsalterDay
 
@@ -217,6 +234,46 @@ class CalendarFeedSerializationTests(SimpleTestCase):
         self.assertEqual(str(canceled_event.get("status")), "CANCELLED")
         self.assertEqual(canceled_event.decoded("sequence"), 1)
 
+    def _feed_year(self, builder, year_start):
+        feed_days = (self.major_day, self.feria_day)
+        events = {
+            (scope, canceled): tuple(
+                builder._serialize_event(scope, feed_day, canceled)
+                for feed_day in feed_days
+                if feed_day.should_include_for_scope(scope)
+            )
+            for scope in VALID_CALENDAR_FEED_SCOPES
+            for canceled in (False, True)
+        }
+        return FeedYear(year_start, feed_days, events)
+
+    def test_feed_year_store_round_trip_and_fingerprint_check(self):
+        feed_year = self._feed_year(self._builder(), 2025)
+        with TemporaryDirectory() as temp_dir, override_settings(MEDIA_ROOT=temp_dir):
+            FeedYearStore.save(feed_year, fingerprint="abc")
+
+            self.assertEqual(FeedYearStore.load(2025, fingerprint="abc"), feed_year)
+            self.assertIsNone(FeedYearStore.load(2025, fingerprint="other"))
+            self.assertIsNone(FeedYearStore.load(2026, fingerprint="abc"))
+
+    def test_streamed_feed_matches_serialized_feed_and_reuses_compiled_years(self):
+        builder = self._builder()
+        builder.fingerprint = "abc"
+        with (
+            TemporaryDirectory() as temp_dir,
+            override_settings(MEDIA_ROOT=temp_dir),
+            patch.object(
+                ChurchCalendarFeedBuilder, "_build_feed_year", side_effect=lambda year: self._feed_year(builder, year)
+            ) as build,
+        ):
+            files = builder.write_all(today=date(2026, 4, 26))
+            builder.write_all(today=date(2026, 4, 26))
+            content = get_calendar_feed_path("major").read_bytes()
+
+        self.assertEqual(build.call_count, 4)
+        self.assertEqual(content, builder.serialize("major", [self.major_day, self.feria_day] * 4))
+        self.assertEqual(files[("major", False)]["size"], len(content))
+
 
 class CalendarFeedEndpointTests(SimpleTestCase):
     def test_calendar_feed_endpoint_serves_inline_text_calendar(self):
@@ -262,6 +319,285 @@ class CalendarFeedEndpointTests(SimpleTestCase):
         self.assertIn("acna-major-cancel.ics", response["Content-Disposition"])
 
 
+class CalendarFeedServiceTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.today = date(2026, 4, 26)
+
+    def write_feeds(self, build_date):
+        for scope in VALID_CALENDAR_FEED_SCOPES:
+            for canceled in (False, True):
+                path = get_calendar_feed_path(scope, canceled=canceled)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n")
+        manifest = {
+            "build_date": build_date.isoformat(),
+            "generated_at": "2026-04-25T00:05:00+00:00",
+            "files": {get_calendar_feed_filename("major"): {"scope": "major", "canceled": False, "etag": "abc123"}},
+        }
+        get_calendar_feed_manifest_path().write_text(json.dumps(manifest))
+
+    def test_stale_feeds_are_served_while_rebuilding_in_the_background(self):
+        self.write_feeds(self.today - date.resolution)
+        with (
+            patch.object(ChurchCalendarFeedService, "refresh_in_background") as refresh,
+            patch.object(ChurchCalendarFeedService, "_regenerate") as regenerate,
+        ):
+            path = ChurchCalendarFeedService.get_feed_path("major", today=self.today)
+
+        self.assertEqual(path, get_calendar_feed_path("major"))
+        refresh.assert_called_once_with(self.today)
+        regenerate.assert_not_called()
+
+    def test_missing_feeds_are_built_before_serving(self):
+        with patch.object(ChurchCalendarFeedService, "_regenerate") as regenerate:
+            ChurchCalendarFeedService.get_feed_path("major", today=self.today)
+
+        regenerate.assert_called_once_with(self.today)
+
+    def test_only_one_background_rebuild_runs_at_a_time(self):
+        self.write_feeds(self.today - date.resolution)
+        release = threading.Event()
+        with patch.object(
+            ChurchCalendarFeedService, "_regenerate", side_effect=lambda today: release.wait(5)
+        ) as regenerate:
+            thread = ChurchCalendarFeedService.refresh_in_background(self.today)
+            self.assertIsNone(ChurchCalendarFeedService.refresh_in_background(self.today))
+            release.set()
+            thread.join(5)
+
+        regenerate.assert_called_once_with(self.today)
+
+    def test_polling_clients_get_not_modified(self):
+        self.write_feeds(self.today)
+        with patch(
+            "churchcal.api.views.ChurchCalendarFeedService.get_feed_path", return_value=get_calendar_feed_path("major")
+        ):
+            first = self.client.get("/api/v1/calendar/feed/major.ics")
+            second = self.client.get("/api/v1/calendar/feed/major.ics", HTTP_IF_NONE_MATCH=first["ETag"])
+            changed = self.client.get("/api/v1/calendar/feed/major.ics", HTTP_IF_NONE_MATCH='"other"')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first["ETag"], '"abc123"')
+        self.assertIn("Last-Modified", first)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], '"abc123"')
+        self.assertEqual(changed.status_code, 200)
+
+
+class ChurchYearSnapshotStoreTests(SimpleTestCase):
+    def test_round_trips_church_year_for_matching_fingerprint(self):
+        with TemporaryDirectory() as temp_dir, override_settings(MEDIA_ROOT=temp_dir):
+            church_year = SimpleNamespace(start_year=2025, dates={"2025-11-30": "First Sunday of Advent"})
+            ChurchYearSnapshotStore.save(church_year, fingerprint="abc")
+
+            loaded = ChurchYearSnapshotStore.load(2025, fingerprint="abc")
+
+        self.assertEqual(loaded.start_year, 2025)
+        self.assertEqual(loaded.dates, church_year.dates)
+
+    def test_changed_fingerprint_or_version_invalidates_snapshot(self):
+        with TemporaryDirectory() as temp_dir, override_settings(MEDIA_ROOT=temp_dir):
+            ChurchYearSnapshotStore.save(SimpleNamespace(start_year=2025, dates={}), fingerprint="abc")
+
+            self.assertTrue(ChurchYearSnapshotStore.is_current(2025, fingerprint="abc"))
+            self.assertFalse(ChurchYearSnapshotStore.is_current(2025, fingerprint="def"))
+            self.assertIsNone(ChurchYearSnapshotStore.load(2025, fingerprint="def"))
+
+            with patch("churchcal.snapshots.CHURCH_YEAR_SNAPSHOT_VERSION", 0):
+                self.assertIsNone(ChurchYearSnapshotStore.load(2025, fingerprint="abc"))
+
+    def test_missing_or_corrupt_snapshot_loads_as_none(self):
+        with TemporaryDirectory() as temp_dir, override_settings(MEDIA_ROOT=temp_dir):
+            self.assertIsNone(ChurchYearSnapshotStore.load(2025, fingerprint="abc"))
+
+            path = get_calendar_snapshot_path(2025)
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b"not a snapshot")
+
+            self.assertIsNone(ChurchYearSnapshotStore.load(2025, fingerprint="abc"))
+
+
+class SanctoraleNeighborIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SanctoraleNeighborIndex(
+            [
+                SanctoraleEntry(3, 17, "Patrick", "patrick"),
+                SanctoraleEntry(1, 2, "Basil", "basil"),
+                SanctoraleEntry(3, 17, "Other", "other"),
+                SanctoraleEntry(12, 26, "Stephen", "stephen"),
+            ]
+        )
+
+    def commemoration(self, month, day, uuid):
+        return SimpleNamespace(month=month, day=day, uuid=uuid)
+
+    def test_neighbors_skip_the_commemoration_itself(self):
+        patrick = self.commemoration(3, 17, "patrick")
+        self.assertEqual(self.index.previous(patrick), {"name": "Other", "uuid": "other"})
+        self.assertEqual(self.index.next(patrick), {"name": "Other", "uuid": "other"})
+
+    def test_neighbors_between_entries(self):
+        day = self.commemoration(6, 1, "unknown")
+        self.assertEqual(self.index.previous(day)["uuid"], "patrick")
+        self.assertEqual(self.index.next(day)["uuid"], "stephen")
+
+    def test_neighbors_wrap_around_the_year(self):
+        self.assertEqual(self.index.previous(self.commemoration(1, 2, "basil"))["uuid"], "stephen")
+        self.assertEqual(self.index.next(self.commemoration(12, 26, "stephen"))["uuid"], "basil")
+        self.assertEqual(self.index.next(self.commemoration(12, 31, "unknown"))["uuid"], "basil")
+
+    def test_only_entry_has_no_neighbors(self):
+        index = SanctoraleNeighborIndex([SanctoraleEntry(1, 2, "Basil", "basil")])
+        self.assertIsNone(index.previous(self.commemoration(1, 2, "basil")))
+        self.assertIsNone(index.next(self.commemoration(1, 2, "basil")))
+
+    def test_current_index_is_reloaded_after_invalidation(self):
+        cache.clear()
+        with patch.object(SanctoraleNeighborIndex, "load", return_value=self.index) as load:
+            self.assertIs(SanctoraleNeighborIndex.current(), self.index)
+            SanctoraleNeighborIndex.current()
+            SanctoraleNeighborIndex.invalidate()
+            SanctoraleNeighborIndex.current()
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_commemoration_serializes_without_a_pinned_index(self):
+        basil = SanctoraleCommemoration(month=1, day=2, name="Basil", uuid="basil")
+        serializer = CommemorationSerializer(basil)
+        with patch.object(SanctoraleNeighborIndex, "current", return_value=self.index):
+            self.assertEqual(serializer.get_previous_commemoration(basil)["uuid"], "stephen")
+            self.assertEqual(serializer.get_next_commemoration(basil)["uuid"], "other")
+
+
+def fake_reading(citation, reading_number, order, years="ABC", service="", **keys):
+    keys = {"proper_id": None, "commemoration_id": None, "common_id": None, **keys}
+    return SimpleNamespace(
+        long_citation=citation,
+        reading_number=reading_number,
+        order=order,
+        years=years,
+        service=service,
+        abbreviation=None,
+        long_scripture_id=citation,
+        short_scripture_id=None,
+        common=SimpleNamespace(abbreviation=keys["common_id"]),
+        **keys,
+    )
+
+
+class MassLectionaryTests(SimpleTestCase):
+    def setUp(self):
+        self.lectionary = MassLectionary(
+            [
+                fake_reading("Isa 1", 1, 1, commemoration_id="feast"),
+                fake_reading("Isa 2", 1, 2, commemoration_id="feast"),
+                fake_reading("Rom 1", 2, 1, years="B", commemoration_id="feast"),
+                fake_reading("Jer 1", 1, 1, commemoration_id="easter", service="Principal Service"),
+                fake_reading("Jer 2", 1, 1, commemoration_id="easter", service="Evening Service"),
+                fake_reading("Gen 1", 1, 1, proper_id="proper"),
+                fake_reading("Gen 2", 1, 2, proper_id="proper"),
+                fake_reading("Wis 3", 1, 1, common_id="MARTYR"),
+                fake_reading("Luke 2", 1, 1, commemoration_id="christmas", service="I"),
+                fake_reading("John 1", 1, 1, commemoration_id="christmas", service="III"),
+            ]
+        )
+
+    def citations(self, source):
+        return [reading.long_citation for reading in self.lectionary.readings(source)]
+
+    def source(self, commemoration, year, name="Feast", time="morning", saint_type=None):
+        return MassReadingSource(None, commemoration, year, time, name, saint_type, year in "AC" and time == "morning")
+
+    def test_year_filter_and_alternative_order(self):
+        self.assertEqual(self.citations(self.source("feast", "A")), ["Isa 2", "Isa 1"])
+        self.assertEqual(self.citations(self.source("feast", "B")), ["Isa 1", "Isa 2", "Rom 1"])
+
+    def test_service_by_name_and_time(self):
+        self.assertEqual(self.citations(self.source("easter", "B", name="Easter Day")), ["Jer 1"])
+        self.assertEqual(self.citations(self.source("easter", "B", name="Easter Day", time="evening")), ["Jer 2"])
+
+    def test_proper_readings_keep_their_order(self):
+        source = MassReadingSource.for_proper(SimpleNamespace(pk="proper"), "A")
+        self.assertEqual(self.citations(source), ["Gen 1", "Gen 2"])
+
+    def test_common_of_saints_when_nothing_is_appointed(self):
+        self.assertEqual(self.citations(self.source("saint", "A", saint_type="MARTYR")), ["Wis 3"])
+        self.assertEqual(self.citations(self.source("saint", "A")), [])
+
+    def test_all_readings_leave_feast_day_services_off_the_eve(self):
+        eve = SimpleNamespace(pk="christmas", name="Eve of The Nativity of our Lord Jesus Christ: Christmas Day")
+        feast = SimpleNamespace(pk="christmas", name="The Nativity of Our Lord Jesus Christ: Christmas Day")
+
+        self.assertEqual([reading.long_citation for reading in self.lectionary.all_readings(eve, "A")], ["Luke 2"])
+        self.assertEqual(
+            [reading.long_citation for reading in self.lectionary.all_readings(feast, "A")], ["Luke 2", "John 1"]
+        )
+
+    def test_all_readings_for_a_saint_use_the_common(self):
+        saint = SimpleNamespace(pk="saint", name="Saint", saint_type="MARTYR")
+        self.assertEqual([reading.long_citation for reading in self.lectionary.all_readings(saint, "B")], ["Wis 3"])
+
+
+class FakeCalendarDate(SimpleNamespace):
+    def detach(self):
+        return FakeCalendarDate(date=self.date, name=self.name, detached=True)
+
+
+class CalendarDateCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _church_year(self, year, calendar):
+        start = advent(year)
+        return [
+            FakeCalendarDate(date=start + date.resolution * offset, name=f"{year}-{offset}") for offset in range(3)
+        ]
+
+    def test_bulk_lookup_builds_each_missing_church_year_once_then_hits_cache(self):
+        days = [advent(2025), advent(2025) + date.resolution, advent(2026)]
+        with patch("churchcal.calendar_cache.load_church_year", side_effect=self._church_year) as load:
+            first = CalendarCache.get_dates(days, "ACNA_BCP2019")
+            second = CalendarCache.get_dates(days, "ACNA_BCP2019")
+
+        self.assertEqual([call.args[0] for call in load.call_args_list], [2025, 2026])
+        self.assertEqual([day.name for day in first], ["2025-0", "2025-1", "2026-0"])
+        self.assertEqual([day.name for day in second], ["2025-0", "2025-1", "2026-0"])
+        self.assertTrue(all(day.detached for day in second))
+
+    def test_cache_keys_are_per_calendar(self):
+        day = advent(2025)
+        with patch("churchcal.calendar_cache.load_church_year", side_effect=self._church_year) as load:
+            CalendarCache.get_dates([day], "ACNA_BCP2019")
+            CalendarCache.get_dates([day], "OTHER")
+
+        self.assertEqual([call.args[1] for call in load.call_args_list], ["ACNA_BCP2019", "OTHER"])
+        self.assertNotEqual(CalendarCache.key(day, "ACNA_BCP2019"), CalendarCache.key(day, "OTHER"))
+
+    def test_entries_from_another_cache_version_are_ignored(self):
+        day = advent(2025)
+        with patch("churchcal.calendar_cache.load_church_year", side_effect=self._church_year) as load:
+            CalendarCache.get_dates([day], "ACNA_BCP2019")
+            with patch.object(CalendarCache, "VERSION", CalendarCache.VERSION + 1):
+                CalendarCache.get_dates([day], "ACNA_BCP2019")
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_calendar_edits_drop_cached_days(self):
+        day = advent(2025)
+        with patch("churchcal.calendar_cache.load_church_year", side_effect=self._church_year) as load:
+            CalendarCache.get_dates([day], "ACNA_BCP2019")
+            post_save.send(sender=TemporaleCommemoration, instance=TemporaleCommemoration(), created=False)
+            CalendarCache.get_dates([day], "ACNA_BCP2019")
+            CalendarCache.get_dates([day], "ACNA_BCP2019")
+
+        self.assertEqual(load.call_count, 2)
+
+
 class OfficeReadingsResolverTests(TestCase):
     def test_unsaved_or_ferial_commemoration_falls_back_to_standard_office_day(self):
         StandardOfficeDay.objects.create(
@@ -15,7 +15,9 @@ from office.models import (
     CollectTag,
     CollectTagCategory,
     SiteMessage,
+    AudioBuildJob,
     AudioClip,
+    AudioTrack,
     PronunciationOverride,
 )
 
@@ -220,8 +222,25 @@ class AudioClipAdmin(admin.ModelAdmin):
         )
 
 
+class AudioTrackAdmin(admin.ModelAdmin):
+    list_display = ("filename", "duration", "updated")
+    search_fields = ("key", "filename")
+    readonly_fields = ("key", "filename", "duration", "track_list", "short_track_list", "created", "updated")
+    ordering = ("-updated",)
+
+
+class AudioBuildJobAdmin(admin.ModelAdmin):
+    list_display = ("office", "office_date", "status", "attempts", "clips_ready", "clips_total", "updated")
+    list_filter = ("status", "office")
+    search_fields = ("key", "path", "error")
+    readonly_fields = ("key", "path", "query", "result", "error", "created", "updated")
+    ordering = ("-created",)
+
+
 admin.site.register(PronunciationOverride, PronunciationOverrideAdmin)
 admin.site.register(AudioClip, AudioClipAdmin)
+admin.site.register(AudioTrack, AudioTrackAdmin)
+admin.site.register(AudioBuildJob, AudioBuildJobAdmin)
 admin.site.register(AboutItem, AboutItemAdmin)
 admin.site.register(UpdateNotice, UpdateNoticeAdmin)
 admin.site.register(SiteMessage, SiteMessageAdmin)
@@ -6,6 +6,9 @@ Extracted to break circular imports between office.api.views, office.api.views.i
 import csv
 import os
 from distutils.util import strtobool
+from types import MappingProxyType
+
+from django.conf import settings
 
 from office.api.translations import get_csv_suffix, is_chinese
 
@@ -41,42 +44,47 @@ class Line(dict):
         )
 
 
-def file_to_lines(filename, language="english"):
-    def process_row(row):
-        result = {"content": row[0]}
-        if len(row) > 1 and row[1]:
-            result["line_type"] = row[1]
-        result["indented"] = False
-        if len(row) > 2:
-            if row[2].lower() == "true":
-                result["indented"] = "indent"
-            else:
-                result["indented"] = row[2]
-
-        if len(row) > 3:
-            if not row[3]:
-                result["extra_space_before"] = False
-            else:
-                result["extra_space_before"] = bool(strtobool(row[3].lower()))
-        # Optional audio-only silence padding (seconds, decimals allowed):
-        # column 5 = silence_before, column 6 = silence_after.
-        if len(row) > 4 and row[4].strip():
-            try:
-                result["silence_before"] = float(row[4])
-            except ValueError:
-                pass
-        if len(row) > 5 and row[5].strip():
-            try:
-                result["silence_after"] = float(row[5])
-            except ValueError:
-                pass
-        return result
+def _process_row(row):
+    result = {"content": row[0]}
+    if len(row) > 1 and row[1]:
+        result["line_type"] = row[1]
+    result["indented"] = False
+    if len(row) > 2:
+        if row[2].lower() == "true":
+            result["indented"] = "indent"
+        else:
+            result["indented"] = row[2]
+
+    if len(row) > 3:
+        if not row[3]:
+            result["extra_space_before"] = False
+        else:
+            result["extra_space_before"] = bool(strtobool(row[3].lower()))
+    # Optional audio-only silence padding (seconds, decimals allowed):
+    # column 5 = silence_before, column 6 = silence_after.
+    if len(row) > 4 and row[4].strip():
+        try:
+            result["silence_before"] = float(row[4])
+        except ValueError:
+            pass
+    if len(row) > 5 and row[5].strip():
+        try:
+            result["silence_after"] = float(row[5])
+        except ValueError:
+            pass
+    return result
 
-    base_filename = filename.replace(".csv", "")
-    suffix = get_csv_suffix(language)
-    dir_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "texts")
 
-    # Build list of filenames to try, in priority order
+TEXTS_DIRECTORY = os.path.join(os.path.dirname(os.path.realpath(__file__)), "texts")
+
+# (base filename, language suffix) -> (path, mtime, line templates), or None when
+# no candidate file exists. The texts ship with the code, so outside DEBUG a
+# parsed file is kept for the life of the process.
+_parsed_files = {}
+
+
+def _candidate_filenames(base_filename, language):
+    suffix = get_csv_suffix(language)
     candidates = []
     if suffix:
         candidates.append("{}{}.csv".format(base_filename, suffix))
@@ -84,12 +92,45 @@ def file_to_lines(filename, language="english"):
             stripped = base_filename.replace("_traditional", "")
             candidates.append("{}{}.csv".format(stripped, suffix))
     candidates.append("{}.csv".format(base_filename))
+    return candidates
+
+
+def _parse_file(base_filename, language):
+    for try_filename in _candidate_filenames(base_filename, language):
+        filepath = os.path.join(TEXTS_DIRECTORY, try_filename)
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            continue
+        with open(filepath, encoding="utf-8") as csvfile:
+            reader = csv.reader(csvfile, quotechar='"', delimiter=",", quoting=csv.QUOTE_ALL, skipinitialspace=True)
+            templates = tuple(MappingProxyType(_process_row(row)) for row in reader)
+        return filepath, mtime, templates
+    return None
+
+
+def _is_stale(parsed):
+    try:
+        return os.path.getmtime(parsed[0]) != parsed[1]
+    except OSError:
+        return True
+
+
+def file_to_lines(filename, language="english"):
+    """Lines of the text CSV ``filename``, preferring the language's own file.
+
+    Each file is read and parsed once per process; callers get fresh ``Line``
+    objects built from the cached templates, so they are free to modify them.
+    In DEBUG an edited file is reloaded and a missing one is looked for again.
+    """
+    base_filename = filename.replace(".csv", "")
+    key = (base_filename, get_csv_suffix(language))
+
+    parsed = _parsed_files.get(key)
+    if key not in _parsed_files or (settings.DEBUG and (parsed is None or _is_stale(parsed))):
+        parsed = _parse_file(base_filename, language)
+        _parsed_files[key] = parsed
 
-    for try_filename in candidates:
-        filepath = os.path.join(dir_path, try_filename)
-        if os.path.exists(filepath):
-            with open(filepath, encoding="utf-8") as csvfile:
-                reader = csv.reader(
-                    csvfile, quotechar='"', delimiter=",", quoting=csv.QUOTE_ALL, skipinitialspace=True
-                )
-                return [Line(**process_row(row)) for row in reader]
+    if parsed is None:
+        return None
+    return [Line(**template) for template in parsed[2]]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+
+from django.core.cache import caches
+from django.db import connections
+from django.db.models import Count
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from analytics.middleware import OFFICE_VIEW_URL_NAMES
+from analytics.models import AnalyticsEvent
+
+# The four daily offices and the four family offices, by URL name.
+PRERENDER_URL_NAMES = tuple(OFFICE_VIEW_URL_NAMES)
+
+
+def popular_setting_combinations(lookback_days: int = 30, limit: int = 10) -> list[dict]:
+    """The most requested settings snapshots from recent office views, most common first.
+
+    The snapshots are the query params clients actually sent (see
+    ``AnalyticsMiddleware``), so rendering with them produces the same cache
+    keys real requests will look up. Defaults (an empty snapshot) are always
+    included.
+    """
+    since = timezone.now() - timedelta(days=lookback_days)
+    rows = (
+        AnalyticsEvent.objects.filter(event_type=AnalyticsEvent.OFFICE_VIEW, created__gte=since)
+        .values("settings")
+        .annotate(count=Count("id"))
+        .order_by("-count")[:limit]
+    )
+    combinations = [row["settings"] or {} for row in rows]
+    if {} not in combinations:
+        combinations.append({})
+    return combinations
+
+
+def prerender_office(url_name: str, office_date: date, combinations: list[dict]) -> int:
+    """Render one office for one day under each settings combination.
+
+    Requests go through the office view itself, so the cache key, the
+    rendering and the cache write are exactly those of a live request; an
+    entry that is already cached costs only a cache read. Returns the number
+    of combinations that rendered successfully.
+    """
+    path = reverse(url_name, kwargs={"year": office_date.year, "month": office_date.month, "day": office_date.day})
+    match = resolve(path)
+    factory = RequestFactory()
+    rendered = 0
+    for params in combinations:
+        response = match.func(factory.get(path, data=params), *match.args, **match.kwargs)
+        if response.status_code == 200:
+            rendered += 1
+    return rendered
+
+
+def _prepare_worker():
+    # Forked workers must not share the parent's database or cache sockets.
+    connections.close_all()
+    caches.close_all()
+
+
+def prerender_offices(
+    days: list[date], combinations: list[dict], workers: int = 1, url_names=PRERENDER_URL_NAMES, log=None
+) -> int:
+    """Pre-render every office in ``url_names`` for every day, one (office, day) per task.
+
+    With more than one worker the tasks fan out over a forked process pool,
+    which only helps with a shared cache backend (memcached); the local-memory
+    cache used in DEBUG is per process.
+    """
+    tasks = [(url_name, day) for day in days for url_name in url_names]
+    if workers <= 1:
+        rendered = 0
+        for url_name, day in tasks:
+            count = prerender_office(url_name, day, combinations)
+            if log:
+                log(f"{day} {url_name}: {count}/{len(combinations)}")
+            rendered += count
+        return rendered
+
+    _prepare_worker()
+    rendered = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork"), initializer=_prepare_worker
+    ) as executor:
+        futures = {
+            executor.submit(prerender_office, url_name, day, combinations): (url_name, day) for url_name, day in tasks
+        }
+        for future in as_completed(futures):
+            url_name, day = futures[future]
+            count = future.result()
+            if log:
+                log(f"{day} {url_name}: {count}/{len(combinations)}")
+            rendered += count
+    return rendered
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import uuid
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.http import parse_etags
+
+
+class OfficeResponseCache:
+    """Cache of fully serialized office JSON.
+
+    An office is a pure function of its type, its date and the effective
+    settings (``Settings`` after defaults are applied), so those three make up
+    the key. Every key also carries a generation token; bumping the generation
+    (see ``office/signals.py``) drops every cached office at once when the
+    collects, scripture, office days or settings behind them change.
+    """
+
+    NAMESPACE = "office:response"
+    GENERATION_KEY = "office:response:generation"
+    TIMEOUT = 60 * 60 * 24
+    # Upper bound for dated entries; memcached would read a relative timeout
+    # above 30 days as a timestamp, and nothing is pre-rendered further ahead.
+    MAX_TIMEOUT = 60 * 60 * 24 * 10
+
+    @staticmethod
+    def canonical_settings(settings):
+        """JSON form of the effective settings with a stable key order."""
+        normalized = {key: value for key, value in settings.items() if key != "extra_collects"}
+        normalized["extra_collects"] = sorted(str(collect.pk) for collect in settings.get("extra_collects", []))
+        return json.dumps(normalized, sort_keys=True, default=str)
+
+    @classmethod
+    def generation(cls):
+        return cache.get_or_set(cls.GENERATION_KEY, lambda: uuid.uuid4().hex, None)
+
+    @classmethod
+    def invalidate(cls):
+        cache.set(cls.GENERATION_KEY, uuid.uuid4().hex, None)
+
+    @classmethod
+    def key(cls, office_name, office_date, settings):
+        settings_hash = hashlib.sha1(cls.canonical_settings(settings).encode("utf-8")).hexdigest()
+        return f"{cls.NAMESPACE}:{cls.generation()}:{office_name}:{office_date.isoformat()}:{settings_hash}"
+
+    @staticmethod
+    def etag(key):
+        return '"{}"'.format(hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def is_not_modified(request, etag):
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        # If-None-Match uses weak comparison, and compressing proxies weaken ETags.
+        etags = [tag.removeprefix("W/") for tag in parse_etags(if_none_match)]
+        return "*" in etags or etag in etags
+
+    @classmethod
+    def get(cls, key):
+        return cache.get(key)
+
+    @classmethod
+    def timeout(cls, office_date=None):
+        """At least ``TIMEOUT``, and for a dated office until its day is over everywhere.
+
+        ``prerender_offices`` renders days ahead of time; with a plain day-long
+        timeout everything after today would expire before it is asked for.
+        The day has ended in every time zone by the second midnight after it
+        here.
+        """
+        if office_date is None:
+            return cls.TIMEOUT
+        day_over = timezone.make_aware(datetime.combine(office_date + timedelta(days=2), time.min))
+        remaining = int((day_over - timezone.now()).total_seconds())
+        return min(max(cls.TIMEOUT, remaining), cls.MAX_TIMEOUT)
+
+    @classmethod
+    def set(cls, key, data, office_date=None):
+        cache.set(key, data, cls.timeout(office_date))
@@ -1,10 +1,15 @@
 import csv
 import datetime
 import json
+import logging
 import os
 import re
 import subprocess
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import NamedTuple
 from urllib.parse import quote
 
 import mailchimp_marketing as MailchimpMarketing
@@ -20,7 +25,6 @@ from django.utils.safestring import mark_safe
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import TemplateResponseMixin
 from mailchimp_marketing.api_client import ApiClientError
-from mutagen.mp3 import MP3
 from rest_framework import serializers, mixins, viewsets
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView
@@ -31,16 +35,24 @@ from rest_framework.viewsets import ViewSet
 
 from churchcal.api.permissions import ReadOnly
 from churchcal.api.serializer import DaySerializer, CommemorationSerializer
-from churchcal.calculations import get_calendar_date, get_church_year
+from churchcal.calculations import get_calendar_date
+from churchcal.mass_readings import MassLectionary
 from churchcal.models import Commemoration
 from office.api.line import Line
+from office.api.response_cache import OfficeResponseCache
+from office.collect_catalog import CollectCatalog
+from office.settings_registry import SettingsRegistry
 from office.api.serializers import UpdateNoticeSerializer, SiteMessageSerializer
 from office.api.translations import get_csv_suffix, is_chinese
 from office.api.views import Module
 from office.api.views.ep import EPOpeningSentence
 from office.api.views.tts import get_tts_provider
 from office.canticles import DefaultCanticles, BCP1979CanticleTable, REC2011CanticleTable, EP2, EP1, S8
+from office import audio_jobs, mp3_frames
+from office.audio_clips import AudioClipLedger
+from office.mp3_frames import Mp3Profile, Mp3Stream
 from office.models import (
+    AudioBuildJob,
     UpdateNotice,
     HolyDayOfficeDay,
     OfficeDay,
@@ -48,13 +60,14 @@ from office.models import (
     ThirtyDayPsalterDay,
     Setting,
     SettingOption,
-    Collect,
     Scripture,
     SiteMessage,
 )
 from office.utils import passage_to_citation, get_client_ip, generate_uuid_from_string
 from psalter.utils import get_psalms
 
+logger = logging.getLogger(__name__)
+
 # --- Text-to-speech configuration -------------------------------------------
 # The active backend (OpenAI, Fish Audio, ...) is selected by the TTS_PROVIDER
 # setting and encapsulates everything that affects the generated audio: model,
@@ -62,9 +75,8 @@ from psalter.utils import get_psalms
 # provider means the clip cache key and AudioClip rows stay in sync no matter
 # which service is used. See office/api/views/tts.py.
 TTS_PROVIDER = get_tts_provider()
-# Natural silence (seconds) inserted when concatenating clips, encoded as mono
-# mp3 at the provider's output sample rate so the final concat re-encode stays
-# consistent.
+# Natural silence (seconds) inserted when concatenating clips, written in the
+# same frame format as the clips so the office track is a plain frame join.
 TTS_GAP_GROUP = 0.5  # between speaker turns within a module
 TTS_GAP_MODULE = 1.35  # between modules
 # Short "breath" before a bare Amen/Alleluia response so it lands as an
@@ -72,7 +84,9 @@ TTS_GAP_MODULE = 1.35  # between modules
 # speaker-turn pause. Set to 0 to remove the gap entirely.
 TTS_GAP_AMEN = 0.03
 TTS_SILENCE_SAMPLE_RATE = TTS_PROVIDER.output_sample_rate
-TTS_SILENCE_BITRATE = "160k"
+# Every clip and silence gap is stored as mono CBR mp3 in this one profile, so
+# office tracks are assembled by joining frames instead of re-encoding.
+TTS_CLIP_PROFILE = Mp3Profile(sample_rate=TTS_SILENCE_SAMPLE_RATE, bitrate=160000)
 
 # Bare congregational responses that should follow the previous line almost
 # immediately. Compared against normalized text (lowercased, punctuation
@@ -125,6 +139,22 @@ def provider_media_name(filename):
     return f"{subdir}/{filename}"
 
 
+class TTSClip(NamedTuple):
+    """Where the clip for one spoken text lives, derived from its voice and normalized text."""
+
+    voice: str
+    text: str
+    key: str
+    filename: str
+    file_path: str
+    url: str
+    path: str
+
+    @property
+    def exists(self):
+        return os.path.isfile(self.file_path) and os.path.getsize(self.file_path) > 0
+
+
 # Audio is only ever generated or served for English offices read from an ESV or
 # KJV text -- the only combination the recorded voices and pronunciation
 # overrides are tuned for. Everything else must never hit the TTS backend.
@@ -164,32 +194,22 @@ class Settings(dict):
         super().__init__(**settings)
 
     def _default_settings(self):
-        settings = (
-            Setting.objects.order_by("site", "setting_type", "order")
-            .prefetch_related(
-                Prefetch("settingoption_set", queryset=SettingOption.objects.order_by("order"), to_attr="options")
-            )
-            .all()
-        )
-        defaults = {setting.name: setting.options[0].value for setting in settings}
-        return defaults
+        return SettingsRegistry.defaults()
 
     def _get_extra_collects(self, request):
-        try:
-            extra_collects = request.query_params.get("extra_collects", "")
-            if not extra_collects:
-                return []
-            extra_collects = extra_collects.split(",")
-            if not extra_collects:
-                return []
-            extra_collects = Collect.objects.filter(pk__in=extra_collects).all()
-        except:
+        extra_collects = request.query_params.get("extra_collects", "")
+        if not extra_collects:
             return []
-        return extra_collects
+        return CollectCatalog.get_many(extra_collects.split(","))
 
     def _get_settings(self, request):
         settings = self._default_settings().copy()
-        specified_settings = {k: v for (k, v) in request.query_params.items() if k in settings.keys()}
+        # Unknown values keep the default, so arbitrary input can't mint new cache keys or audio jobs.
+        specified_settings = {
+            k: v
+            for (k, v) in request.query_params.items()
+            if k in settings.keys() and SettingsRegistry.is_valid_option(k, v)
+        }
         for k, v in settings.items():
             if k in specified_settings.keys():
                 settings[k] = specified_settings[k]
@@ -368,9 +388,9 @@ class MPOpeningSentence(Module):
 class Office(object):
     tag = "office"
 
-    def __init__(self, request, year, month, day):
+    def __init__(self, request, year, month, day, settings=None):
 
-        self.settings = Settings(request)
+        self.settings = settings if settings is not None else Settings(request)
 
         self.date = get_calendar_date("{}-{}-{}".format(year, month, day))
 
@@ -1431,7 +1451,7 @@ class AdditionalCollects(Module):
 
     @cached_property
     def all_possible_collects(self):
-        collects = Collect.objects.filter(tags__name=self.tag_name).distinct().all()
+        collects = CollectCatalog.tagged(self.tag_name)
         results = {}
         mission_collects = []
         for collect in collects:
@@ -2941,7 +2961,7 @@ class Readings(Module):
         self.settings = Settings(request)
 
         self.date = get_calendar_date("{}-{}-{}".format(year, month, day))
-        self.mass_year = get_church_year("{}-{}-{}".format(year, month, day)).mass_year
+        self.mass_year = self.date.year.mass_year
         self.translation = translation
         self.psalms = psalms
         self.style = style
@@ -2994,31 +3014,28 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
         return content
 
     @staticmethod
-    def record_audio_clip(key, filename, text, line_type, voice, kind, file_path):
-        """Ensure an AudioClip row exists for a generated file (backfill-friendly)."""
-        try:
-            from office.models import AudioClip
+    def record_audio_clip(key, filename, text, line_type, voice, kind, file_path, ledger=None):
+        """Ensure an AudioClip row exists for a generated file (backfill-friendly).
 
-            if AudioClip.objects.filter(key=key).exists():
-                return
-            try:
-                duration = MP3(file_path).info.length
-            except Exception:
-                duration = None
-            AudioClip.objects.create(
-                key=key,
-                filename=filename,
-                text=text,
-                line_type=line_type,
-                voice=voice,
-                model=TTS_PROVIDER.model,
-                speed=TTS_PROVIDER.speed,
-                kind=kind,
-                duration=duration,
-            )
-        except Exception:
-            # DB tracking is best-effort; audio generation must not depend on it.
-            pass
+        With a ``ledger`` the row is only noted and written when the ledger is
+        flushed; without one it is written straight away.
+        """
+        flush = ledger is None
+        if ledger is None:
+            ledger = AudioClipLedger()
+        ledger.add(
+            key,
+            file_path,
+            filename=filename,
+            text=text,
+            line_type=line_type,
+            voice=voice,
+            model=TTS_PROVIDER.model,
+            speed=TTS_PROVIDER.speed,
+            kind=kind,
+        )
+        if flush:
+            ledger.flush()
 
     @staticmethod
     def tts_clip_key(voice, normalized):
@@ -3029,44 +3046,153 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
 
     @staticmethod
     def synthesize_speech(voice, text, file_path):
-        """Synthesize a line via the active TTS provider and write it to disk.
+        """Synthesize a line via the active TTS provider and write it to disk,
+        normalized to ``TTS_CLIP_PROFILE``.
 
         Raises on failure and never leaves a partial file behind.
         """
         TTS_PROVIDER.synthesize(voice, text, file_path)
+        try:
+            GenericDailyOfficeSerializer.normalize_clip(file_path)
+        except Exception:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
 
     @staticmethod
-    def get_or_create_clip(content, line_type, kind="line", no_generate=False):
-        """Normalize -> hash -> reuse-or-generate a TTS clip; record it in the DB.
+    def normalize_clip(file_path):
+        """Re-encode a clip to ``TTS_CLIP_PROFILE`` unless it is already in it.
 
-        Returns (file_url, media_relative_path) or (None, None) when the line is
-        not spoken or generation fails.
+        Providers return mp3 at varying bitrates. Doing this once per clip,
+        when it is synthesized, is what lets office tracks be joined frame by
+        frame. Returns the clip's ``Mp3Stream``; raises if ffmpeg fails.
         """
+        stream = Mp3Stream.read(file_path)
+        if stream.matches(TTS_CLIP_PROFILE):
+            return stream
+        temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.mp3"
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            file_path,
+            "-c:a",
+            "libmp3lame",
+            "-b:a",
+            str(TTS_CLIP_PROFILE.bitrate),
+            "-ar",
+            str(TTS_CLIP_PROFILE.sample_rate),
+            "-ac",
+            str(TTS_CLIP_PROFILE.channels),
+            # No ID3 tag: cleanup_full_audio_files takes a Lavf tag to mean a
+            # combined office file.
+            "-map_metadata",
+            "-1",
+            "-id3v2_version",
+            "0",
+            temp_path,
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0 or not os.path.isfile(temp_path):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise RuntimeError(f"ffmpeg could not normalize {file_path}: {result.stderr}")
+        os.replace(temp_path, file_path)
+        return Mp3Stream.read(file_path)
+
+    @staticmethod
+    def plan_clip(content, line_type):
+        """Normalize -> hash: the ``TTSClip`` a line would be spoken from, or None
+        when its line type is not spoken. Touches neither the provider nor the DB."""
         voice = voice_for_line_type(line_type)
         if not voice:
-            return None, None
+            return None
         normalized = GenericDailyOfficeSerializer.normalize_tts_text(content)
         key = GenericDailyOfficeSerializer.tts_clip_key(voice, normalized)
         filename = provider_media_name(f"{key}.mp3")
-        file_path = os.path.join(settings.MEDIA_ROOT, filename)
-        exists = os.path.isfile(file_path) and os.path.getsize(file_path) > 0
         path = settings.MEDIA_URL + filename
-        file_url = f"{audio_base_url()}{path}"
-        if exists:
+        return TTSClip(
+            voice=voice,
+            text=normalized,
+            key=key,
+            filename=filename,
+            file_path=os.path.join(settings.MEDIA_ROOT, filename),
+            url=f"{audio_base_url()}{path}",
+            path=path,
+        )
+
+    @staticmethod
+    def ensure_clip(clip, line_type, kind="line", no_generate=False, ledger=None):
+        """Reuse-or-generate a planned clip; record it in the DB (or in ``ledger``).
+
+        Returns (file_url, media_relative_path) or (None, None) when generation
+        fails.
+        """
+        if clip.exists:
             GenericDailyOfficeSerializer.record_audio_clip(
-                key, filename, normalized, line_type, voice, kind, file_path
+                clip.key, clip.filename, clip.text, line_type, clip.voice, kind, clip.file_path, ledger=ledger
             )
-            return file_url, path
+            return clip.url, clip.path
         if no_generate:
-            return file_url, path
+            return clip.url, clip.path
         try:
-            GenericDailyOfficeSerializer.synthesize_speech(voice, normalized, file_path)
+            GenericDailyOfficeSerializer.synthesize_speech(clip.voice, clip.text, clip.file_path)
         except Exception:
             return None, None
-        if not (os.path.isfile(file_path) and os.path.getsize(file_path) > 0):
+        if not clip.exists:
+            return None, None
+        GenericDailyOfficeSerializer.record_audio_clip(
+            clip.key, clip.filename, clip.text, line_type, clip.voice, kind, clip.file_path, ledger=ledger
+        )
+        return clip.url, clip.path
+
+    @staticmethod
+    def get_or_create_clip(content, line_type, kind="line", no_generate=False):
+        """Normalize -> hash -> reuse-or-generate a TTS clip; record it in the DB.
+
+        Returns (file_url, media_relative_path) or (None, None) when the line is
+        not spoken or generation fails.
+        """
+        clip = GenericDailyOfficeSerializer.plan_clip(content, line_type)
+        if clip is None:
             return None, None
-        GenericDailyOfficeSerializer.record_audio_clip(key, filename, normalized, line_type, voice, kind, file_path)
-        return file_url, path
+        return GenericDailyOfficeSerializer.ensure_clip(clip, line_type, kind=kind, no_generate=no_generate)
+
+    @staticmethod
+    def synthesize_clips(clips, progress=None):
+        """Synthesize every clip in ``clips`` that is not on disk yet, several at once.
+
+        A cold office needs around a hundred clips and each is a provider
+        round-trip, so they run on a pool of ``TTS_PROVIDER.max_concurrency``
+        threads instead of one after another. ``progress(ready, total)`` is
+        called from this thread as clips finish. Returns the keys that failed.
+        """
+        clips = {clip.key: clip for clip in clips}
+        missing = {key: clip for key, clip in clips.items() if not clip.exists}
+        ready = len(clips) - len(missing)
+        if progress:
+            progress(ready, len(clips))
+        if not missing:
+            return set()
+
+        def synthesize(clip):
+            try:
+                GenericDailyOfficeSerializer.synthesize_speech(clip.voice, clip.text, clip.file_path)
+            except Exception:
+                return clip.key
+            return None if clip.exists else clip.key
+
+        failed = set()
+        workers = max(1, min(TTS_PROVIDER.max_concurrency, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as pool:
+            for key in pool.map(synthesize, missing.values()):
+                if key:
+                    failed.add(key)
+                else:
+                    ready += 1
+                if progress:
+                    progress(ready, len(clips))
+        return failed
 
     @staticmethod
     def get_line_audio_file(line, no_generate=False):
@@ -3076,8 +3202,8 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
 
     @staticmethod
     def get_silence_clip(seconds):
-        """Return the path to a cached mono silence mp3 at the provider's sample
-        rate. The sample rate is part of the filename so switching TTS providers
+        """Return the path to a cached mono silence mp3 in ``TTS_CLIP_PROFILE``.
+        The sample rate is part of the filename so switching TTS providers
         (and thus output rates) never reuses a mismatched cached gap clip."""
         ms = int(round(seconds * 1000))
         sr = TTS_SILENCE_SAMPLE_RATE
@@ -3085,27 +3211,9 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
         file_path = os.path.join(settings.MEDIA_ROOT, filename)
         if os.path.isfile(file_path) and os.path.getsize(file_path) > 0:
             return file_path
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-f",
-            "lavfi",
-            "-i",
-            f"anullsrc=r={TTS_SILENCE_SAMPLE_RATE}:cl=mono",
-            "-t",
-            str(seconds),
-            "-c:a",
-            "libmp3lame",
-            "-b:a",
-            TTS_SILENCE_BITRATE,
-            "-ar",
-            str(TTS_SILENCE_SAMPLE_RATE),
-            "-ac",
-            "1",
-            file_path,
-        ]
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        if result.returncode != 0 or not os.path.isfile(file_path):
+        try:
+            mp3_frames.write(file_path, TTS_CLIP_PROFILE, mp3_frames.silence(TTS_CLIP_PROFILE, seconds))
+        except (OSError, ValueError):
             return None
         GenericDailyOfficeSerializer.record_audio_clip(
             f"silence_{TTS_PROVIDER.media_subdir}_{ms}ms_{sr}", filename, "", "silence", "", "silence", file_path
@@ -3113,10 +3221,13 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
         return file_path
 
     @staticmethod
-    def handle_html(line, html=False, no_generate=False, id=None, module="Reading"):
+    def handle_html(line, html=False, no_generate=False, id=None, module="Reading", get_clip=None):
         import re
         from bs4 import BeautifulSoup
 
+        if get_clip is None:
+            get_clip = partial(GenericDailyOfficeSerializer.get_or_create_clip, no_generate=no_generate)
+
         if "<iframe" in line and html:
             return line
         if "<iframe" in line and not html:
@@ -3140,9 +3251,7 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
             if not text_without_verses:
                 lines.append(paragraph)
                 continue
-            url, path = GenericDailyOfficeSerializer.get_or_create_clip(
-                text_without_verses, "reader", kind="reader", no_generate=no_generate
-            )
+            url, path = get_clip(text_without_verses, "reader", kind="reader")
             if url:
                 uuid_match = re.search(r"/uploads/(?:[^/]+/)?([0-9a-fA-F-]+)\.mp3", url)
                 if uuid_match:
@@ -3164,10 +3273,7 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
 
     @staticmethod
     def get_single_track(tracks):
-
-        def get_audio_duration(file_path):
-            audio = MP3(file_path)
-            return audio.info.length
+        from office.models import AudioTrack
 
         tracks = [
             {
@@ -3190,31 +3296,25 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
         if not mp3_files:
             return []
 
-        def silence_pad(seconds):
-            """(clip_path, duration) for an arbitrary silence length, or (None, 0)."""
+        def silence_clip(seconds):
+            """Path of a cached silence clip of an arbitrary length, or None."""
             if not seconds or seconds <= 0:
-                return None, 0
+                return None
             clip = GenericDailyOfficeSerializer.get_silence_clip(seconds)
-            dur = get_audio_duration(clip) if clip and os.path.exists(clip) else 0
-            return clip, dur
+            return clip if clip and os.path.exists(clip) else None
 
         # Cached silence clips inserted between speaker groups (short) and modules
-        # (longer) for more natural pacing. They share the TTS output sample rate
-        # and channel layout so ffmpeg can still concatenate with `-c copy`.
-        gap_group_clip = GenericDailyOfficeSerializer.get_silence_clip(TTS_GAP_GROUP)
-        gap_module_clip = GenericDailyOfficeSerializer.get_silence_clip(TTS_GAP_MODULE)
-        gap_group_dur = get_audio_duration(gap_group_clip) if gap_group_clip and os.path.exists(gap_group_clip) else 0
-        gap_module_dur = (
-            get_audio_duration(gap_module_clip) if gap_module_clip and os.path.exists(gap_module_clip) else 0
-        )
+        # (longer) for more natural pacing. They are written in TTS_CLIP_PROFILE,
+        # like the speech clips, so all of them can be joined frame by frame.
+        gap_group_clip = silence_clip(TTS_GAP_GROUP)
+        gap_module_clip = silence_clip(TTS_GAP_MODULE)
         # Optional near-zero gap used only before a bare Amen/Alleluia response.
-        gap_amen_clip = GenericDailyOfficeSerializer.get_silence_clip(TTS_GAP_AMEN) if TTS_GAP_AMEN > 0 else None
-        gap_amen_dur = get_audio_duration(gap_amen_clip) if gap_amen_clip and os.path.exists(gap_amen_clip) else 0
+        gap_amen_clip = silence_clip(TTS_GAP_AMEN)
 
+        # Lay out the concatenation first. Start times depend on the clips'
+        # lengths, which are only read when the combined track has no timeline yet.
         concat_paths = []
-        track_list = []
-        short_track_list = []
-        start_time = 0
+        track_starts = []  # (track, index of its clip in concat_paths, starts a module)
         name = ""
         first = True
         for track in mp3_files:
@@ -3224,55 +3324,30 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
                 # overrides the usual group/module pause with a short breath.
                 if is_immediate_response(track.get("text")):
                     gap_clip = gap_amen_clip
-                    gap_dur = gap_amen_dur
                 elif is_new_module:
                     gap_clip = gap_module_clip
-                    gap_dur = gap_module_dur
                 else:
                     gap_clip = gap_group_clip
-                    gap_dur = gap_group_dur
                 if gap_clip:
                     concat_paths.append(os.path.abspath(gap_clip))
-                    start_time += gap_dur
             first = False
             # Explicit per-item silence padding (decimals allowed), added on top
             # of the normal pacing gap. Applied even to the first track.
-            sb_clip, sb_dur = silence_pad(track["silence_before"])
+            sb_clip = silence_clip(track["silence_before"])
             if sb_clip:
                 concat_paths.append(os.path.abspath(sb_clip))
-                start_time += sb_dur
+            track_starts.append((track, len(concat_paths), is_new_module))
             concat_paths.append(os.path.abspath(track["path"]))
             if is_new_module:
                 name = track["name"]
-                track_list.append({"name": track["name"], "start_time": start_time})
-            for member_id in track["member_ids"]:
-                short_track_list.append({"id": member_id, "start_time": start_time})
-            start_time += get_audio_duration(track["path"])
-            sa_clip, sa_dur = silence_pad(track["silence_after"])
+            sa_clip = silence_clip(track["silence_after"])
             if sa_clip:
                 concat_paths.append(os.path.abspath(sa_clip))
-                start_time += sa_dur
-
-        # Segment start_times are summed from each source clip's reported length,
-        # but the concatenated file is re-encoded (see below) and ends up a hair
-        # shorter per clip; over a whole office that drift makes "jump to" land a
-        # few seconds late. Rescale the timeline to the actual output duration so
-        # timestamps line up with what the browser actually plays.
-        computed_total = start_time
-
-        def rescale_segments(actual_total):
-            if not (computed_total and actual_total and actual_total > 0):
-                return
-            scale = actual_total / computed_total
-            for segment in track_list:
-                segment["start_time"] *= scale
-            for segment in short_track_list:
-                segment["start_time"] *= scale
 
         # The silence entries are part of the concat list, so the hash naturally
         # changes when gaps change and the concatenated file is rebuilt. The
-        # "cbr1" marker also busts the cache for the re-encode change below.
-        full_string = "cbr1 " + " ".join(concat_paths)
+        # "frames1" marker busts the cache of tracks that ffmpeg re-encoded.
+        full_string = "frames1 " + " ".join(concat_paths)
         audio_id = generate_uuid_from_string(full_string)
         filename = provider_media_name(f"{audio_id}.mp3")
         file_path = os.path.join(settings.MEDIA_ROOT, filename)
@@ -3280,58 +3355,64 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
         path = settings.MEDIA_URL + filename
         file_url = f"{audio_base_url()}/api/v1/audio_track/{filename}"
 
+        # Already built: the timeline was recorded with it, so nothing is parsed.
         if exists:
-            rescale_segments(get_audio_duration(file_path))
-            return file_url, path, track_list, short_track_list
-
-        temp_file_list = os.path.join(settings.MEDIA_ROOT, f"{filename}.txt")
-        with open(temp_file_list, "w") as f:
+            try:
+                record = AudioTrack.objects.filter(key=str(audio_id)).first()
+            except Exception:
+                record = None
+            if record is not None:
+                return file_url, path, record.track_list, record.short_track_list
+
+        # Join the clips' frames behind a fresh Xing/LAME header instead of
+        # re-encoding: every clip is already constant-bitrate mp3 in one profile
+        # (see normalize_clip), so the result is a seekable CBR file. Clips made
+        # before clips were normalized are converted here, once.
+        streams = {}
+        try:
             for concat_path in concat_paths:
-                f.write(f"file '{concat_path}'\n")
-
-        # Re-encode (rather than `-c copy`) to a single constant-bitrate mp3 with
-        # a proper header. The per-clip sources vary in bitrate (gpt-4o-mini-tts
-        # ~128k vs the silence clips), and a stream-copied VBR mp3 with no Xing
-        # header is not reliably seekable in browsers (seeks snap to the start).
-        # A uniform CBR encode restores accurate time-based seeking.
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-y",
-            "-f",
-            "concat",
-            "-safe",
-            "0",
-            "-i",
-            temp_file_list,
-            "-c:a",
-            "libmp3lame",
-            "-b:a",
-            "160k",
-            "-ar",
-            str(TTS_SILENCE_SAMPLE_RATE),
-            "-ac",
-            "1",
-            file_path,
-        ]
+                if concat_path not in streams:
+                    streams[concat_path] = GenericDailyOfficeSerializer.normalize_clip(concat_path)
+            combined = mp3_frames.concatenate(streams[concat_path] for concat_path in concat_paths)
+            mp3_frames.write(file_path, TTS_CLIP_PROFILE, combined)
+        except Exception:
+            # Return empty so the client hides the player instead of loading a
+            # 404 and throwing NotSupportedError.
+            logger.exception("Could not assemble %s", filename)
+            return []
 
-        result = subprocess.run(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # Start times are exact: whole frames of a known length, less the encoder
+        # delay that players trim from the start of the file.
+        offsets = []
+        samples = 0
+        for concat_path in concat_paths:
+            offsets.append(samples)
+            samples += streams[concat_path].samples
+        sample_rate = TTS_CLIP_PROFILE.sample_rate
+        duration = max(0, samples - combined.delay - combined.end_padding) / sample_rate
 
-        if result.returncode != 0:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            print(f"ffmpeg failed with return code {result.returncode}: {result.stderr}")
-        elif os.path.isfile(file_path):
-            rescale_segments(get_audio_duration(file_path))
-
-        # Cleanup temp file list
-        if os.path.exists(temp_file_list):
-            os.remove(temp_file_list)
-
-        # Only advertise the combined track if it was actually produced. If
-        # ffmpeg failed (or produced nothing), return empty so the client hides
-        # the player instead of loading a 404 and throwing NotSupportedError.
-        if not (os.path.isfile(file_path) and os.path.getsize(file_path) > 0):
-            return []
+        track_list = []
+        short_track_list = []
+        for track, index, is_new_module in track_starts:
+            start_time = max(0, offsets[index] - combined.delay) / sample_rate
+            if is_new_module:
+                track_list.append({"name": track["name"], "start_time": start_time})
+            for member_id in track["member_ids"]:
+                short_track_list.append({"id": member_id, "start_time": start_time})
+
+        try:
+            AudioTrack.objects.update_or_create(
+                key=str(audio_id),
+                defaults={
+                    "filename": filename,
+                    "duration": duration,
+                    "track_list": track_list,
+                    "short_track_list": short_track_list,
+                },
+            )
+        except Exception:
+            # The record only saves work on the next request; the track is fine without it.
+            pass
 
         return file_url, path, track_list, short_track_list
 
@@ -3346,6 +3427,45 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
         ):
             return []
         modules = self.get_modules(obj)
+
+        # Planning pass: walk the office once just to learn which clips it is
+        # spoken from, and synthesize the missing ones concurrently. The second
+        # walk then finds every clip on disk and only assembles the tracks.
+        planned = {}
+
+        def plan(content, line_type, kind="line"):
+            clip = self.plan_clip(content, line_type)
+            if clip is None:
+                return None, None
+            planned[(content, line_type)] = clip
+            return clip.url, clip.path
+
+        self.collect_audio_tracks(modules, plan)
+        failed = self.synthesize_clips(planned.values(), progress=self.context.get("audio_progress"))
+
+        # Clip rows are noted while the tracks are assembled and written in one
+        # go, before the combined track reads their durations.
+        ledger = AudioClipLedger()
+
+        def resolve(content, line_type, kind="line"):
+            clip = planned.get((content, line_type))
+            if clip is None or clip.key in failed:
+                return None, None
+            return self.ensure_clip(clip, line_type, kind=kind, ledger=ledger)
+
+        tracks, headings = self.collect_audio_tracks(modules, resolve)
+        ledger.flush()
+        single_track = self.get_single_track(tracks)
+
+        return {"tracks": tracks, "headings": headings, "single_track": single_track}
+
+    def collect_audio_tracks(self, modules, get_clip):
+        """Group an office's spoken lines into clips and pace them with silence.
+
+        ``get_clip(content, line_type, kind)`` returns the ``(url, path)`` of
+        the clip for a text, or ``(None, None)`` when there is none. Returns
+        ``(tracks, headings)``.
+        """
         spoken_types = [
             "reader",
             "leader",
@@ -3389,7 +3509,7 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
             # into the leading pad so it lands right before this clip.
             silence_before = pending_before[0] + line_silence(group_buffer[0], "silence_before")
             silence_after = line_silence(group_buffer[-1], "silence_after")
-            url, path = self.get_or_create_clip(merged_text, line_type, kind=kind)
+            url, path = get_clip(merged_text, line_type, kind=kind)
             if path:
                 pending_before[0] = 0.0
                 tracks.append(
@@ -3439,7 +3559,9 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
                 if line["line_type"] == "html":
                     flush_group(group_buffer, module["name"])
                     temp_id = "_".join([line["id"].split("_")[0], line["id"].split("_")[-1]])
-                    html_tracks = self.handle_html(line["content"], id=temp_id, module=module["name"])
+                    html_tracks = self.handle_html(
+                        line["content"], id=temp_id, module=module["name"], get_clip=get_clip
+                    )
                     if html_tracks:
                         # Pad the first/last reading clip; fold in pending silence.
                         html_tracks[0]["silence_before"] = (
@@ -3476,9 +3598,7 @@ class GenericDailyOfficeSerializer(serializers.Serializer):
 
         tracks = [track for track in tracks if track]
         headings = [heading for heading in headings if heading]
-        single_track = self.get_single_track(tracks)
-
-        return {"tracks": tracks, "headings": headings, "single_track": single_track}
+        return tracks, headings
 
 
 class OfficeSerializer(GenericDailyOfficeSerializer):
@@ -3878,7 +3998,8 @@ def service_readings_to_citations(readings):
 def mass_readings(
     commemoration, mass_year, calendar_date, translation="esv", psalm_style="contemporary", display_language="english"
 ):
-    readings = commemoration.get_all_mass_readings_for_year(mass_year)
+    lectionary = MassLectionary.current()
+    readings = lectionary.all_readings(commemoration, mass_year)
     passages = []
     for reading in readings:
         passages.append(reading.long_citation)
@@ -3892,7 +4013,7 @@ def mass_readings(
             name=name,
             citation=reading.long_citation,
             text=(
-                getattr(reading.long_scripture, translation)
+                lectionary.scripture_text(reading.long_scripture_id, translation)
                 if "psalm" not in reading.long_citation.lower()
                 else get_psalms(
                     reading.long_citation.replace("Psalms", ""),
@@ -3911,7 +4032,7 @@ def mass_readings(
                 name=name,
                 citation=reading.short_citation,
                 text=(
-                    getattr(reading.short_scripture, translation)
+                    lectionary.scripture_text(reading.short_scripture_id, translation)
                     if "psalm" not in reading.short_citation.lower()
                     else get_psalms(
                         reading.short_citation.replace("Psalms", ""),
@@ -4066,85 +4187,119 @@ class AudioViewSet(ViewSet):
         return Response({"path": file_url})
 
 
-class MorningPrayerView(OfficeAPIView):
-    def get(self, request, year, month, day):
+class AudioBuildJobView(APIView):
+    """Status of a background office audio build, and the audio once it is ready."""
 
-        office = MorningPrayer(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+    permission_classes = [AllowAny]
 
+    def get(self, request, job_id):
+        job = AudioBuildJob.objects.filter(pk=job_id).first()
+        if job is None:
+            return Response(status=404)
+        audio_jobs.requeue_if_missing(job)
+        if job.status in (AudioBuildJob.PENDING, AudioBuildJob.RUNNING):
+            audio_jobs.AudioJobWorkers.ensure_started()
+            return Response(audio_jobs.audio_payload(job), status=202)
+        return Response(audio_jobs.audio_payload(job))
 
-class FamilyMorningPrayerView(OfficeAPIView):
-    def get(self, request, year, month, day):
-        office = FamilyMorningPrayer(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
 
+class DailyOfficeAPIView(OfficeAPIView):
+    office_class = None
+    cache_name = None
 
-class FamilyMiddayPrayerView(OfficeAPIView):
     def get(self, request, year, month, day):
-        office = FamilyMiddayPrayer(request, year, month, day)
+        try:
+            office_date = datetime.date(year, month, day)
+        except ValueError:
+            return Response(status=404)
+
+        office_settings = Settings(request)
         if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+            return self.get_audio(request, office_date, office_settings)
 
+        key = OfficeResponseCache.key(self.cache_name, office_date, office_settings)
+        etag = OfficeResponseCache.etag(key)
+        if OfficeResponseCache.is_not_modified(request, etag):
+            return Response(status=304, headers={"ETag": etag})
 
-class FamilyEarlyEveningPrayerView(OfficeAPIView):
-    def get(self, request, year, month, day):
-        office = FamilyEarlyEveningPrayer(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+        return Response(self.get_office_data(request, key, office_date, office_settings), headers={"ETag": etag})
 
+    def get_office_data(self, request, key, office_date, office_settings):
+        data = OfficeResponseCache.get(key)
+        if data is None:
+            office = self.office_class(
+                request, office_date.year, office_date.month, office_date.day, settings=office_settings
+            )
+            data = OfficeSerializer(office).data
+            OfficeResponseCache.set(key, data, office_date)
+        return data
+
+    def get_audio(self, request, office_date, office_settings):
+        """The office's audio if it has been built; otherwise queue the build and answer 202.
+
+        Synthesizing clips and joining them takes far longer than a request
+        should, so it runs in the background (see ``office/audio_jobs.py``).
+        The response carries the job's id and progress, and clients poll
+        ``AudioBuildJobView`` until it is ready. As before the build moved to
+        the background, it also carries the office's ``modules`` (taken from
+        the cached text response), so clients that read them here still can.
+        """
+        key = OfficeResponseCache.key(self.cache_name, office_date, office_settings)
+        modules = self.get_office_data(request, key, office_date, office_settings)["modules"]
+        if not audio_available(
+            office_settings.get("bible_translation", "esv"), office_settings.get("display_language", "english")
+        ):
+            return Response({"modules": modules, "audio": []})
 
-class FamilyCloseOfDayPrayerView(OfficeAPIView):
-    def get(self, request, year, month, day):
-        office = FamilyCloseOfDayPrayer(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+        job = audio_jobs.enqueue(
+            self.cache_name, office_date, office_settings, request.path_info, request.query_params.dict()
+        )
+        payload = {"modules": modules, **audio_jobs.audio_payload(job)}
+        # A job that failed for good is final too; its payload says so and carries no audio.
+        if job.status == AudioBuildJob.READY or audio_jobs.has_given_up(job):
+            return Response(payload)
+        audio_jobs.AudioJobWorkers.ensure_started()
+        return Response(payload, status=202)
 
 
-class EveningPrayerView(OfficeAPIView):
-    def get(self, request, year, month, day):
-        office = EveningPrayer(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+class MorningPrayerView(DailyOfficeAPIView):
+    office_class = MorningPrayer
+    cache_name = "morning_prayer"
 
 
-class MiddayPrayerView(OfficeAPIView):
-    def get(self, request, year, month, day):
-        office = MiddayPrayer(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+class FamilyMorningPrayerView(DailyOfficeAPIView):
+    office_class = FamilyMorningPrayer
+    cache_name = "family_morning_prayer"
 
 
-class ComplineView(OfficeAPIView):
-    def get(self, request, year, month, day):
-        office = Compline(request, year, month, day)
-        if request.GET.get("include_audio_links"):
-            serializer = OfficeAudioSerializer(office)
-        else:
-            serializer = OfficeSerializer(office)
-        return Response(serializer.data)
+class FamilyMiddayPrayerView(DailyOfficeAPIView):
+    office_class = FamilyMiddayPrayer
+    cache_name = "family_midday_prayer"
+
+
+class FamilyEarlyEveningPrayerView(DailyOfficeAPIView):
+    office_class = FamilyEarlyEveningPrayer
+    cache_name = "family_early_evening_prayer"
+
+
+class FamilyCloseOfDayPrayerView(DailyOfficeAPIView):
+    office_class = FamilyCloseOfDayPrayer
+    cache_name = "family_close_of_day_prayer"
+
+
+class EveningPrayerView(DailyOfficeAPIView):
+    office_class = EveningPrayer
+    cache_name = "evening_prayer"
+
+
+class MiddayPrayerView(DailyOfficeAPIView):
+    office_class = MiddayPrayer
+    cache_name = "midday_prayer"
+
+
+class ComplineView(DailyOfficeAPIView):
+    office_class = Compline
+    cache_name = "compline"
 
 
 class ReadingsView(OfficeAPIView):
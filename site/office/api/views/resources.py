@@ -1,5 +1,7 @@
+from collections import defaultdict
 from uuid import UUID
 
+from django.core.cache import cache
 from django.db.models import Prefetch, Q
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -44,6 +46,24 @@ class CollectsViewSet(ViewSet):
 
 
 class GroupedCollectsViewSet(ViewSet):
+    """Collects grouped by source, then by theme, season, commemoration type or liturgy.
+
+    The serialized tree only changes when collects, their tags, tag categories
+    or collect types do, so it is cached under ``CACHE_KEY`` and dropped by the
+    signals in ``office/signals.py``.
+    """
+
+    CACHE_KEY = "office:grouped_collects"
+    CACHE_TIMEOUT = 60 * 60 * 24
+
+    # Source key -> subcategory groups, each (tag category keys, tag keys to leave out).
+    # Within a group subcategories follow tag order; groups follow one another.
+    GROUPINGS = {
+        "occasional": [(["theme"], [])],
+        "year": [(["season"], []), (["commemoration_type"], ["sunday", "major_feast"])],
+        "liturgical": [(["liturgy", "liturgical"], [])],
+    }
+
     queryset = (
         Collect.objects.order_by("collect_type__order", "order")
         .select_related("collect_type")
@@ -51,64 +71,44 @@ class GroupedCollectsViewSet(ViewSet):
         .all()
     )
 
-    def list(self, request):
-        collects = self.queryset
-        collect_tags = CollectTag.objects.select_related("collect_tag_category").order_by("order").all()
-        sources = [collect_tag for collect_tag in collect_tags if collect_tag.collect_tag_category.key == "source"]
-
-        themes = list(filter(lambda tag: tag.collect_tag_category.key == "theme", collect_tags))
-        seasons = list(filter(lambda tag: tag.collect_tag_category.key == "season", collect_tags))
-        commemoration_types = list(
-            filter(lambda tag: tag.collect_tag_category.key == "commemoration_type", collect_tags)
-        )
-        liturgies = list(filter(lambda tag: tag.collect_tag_category.key in ["liturgy", "liturgical"], collect_tags))
-
+    @classmethod
+    def group(cls, collects, collect_tags):
+        """Attach ``subcategories`` (each with its ``collects``) to the source tags and return the sources.
+
+        Membership comes from a tag -> collect positions index, so each
+        subcategory is one set intersection however many collects there are,
+        and collects keep their queryset order.
+        """
+        positions_by_tag = defaultdict(set)
+        for position, collect in enumerate(collects):
+            for tag in collect.tags.all():
+                positions_by_tag[tag.pk].add(position)
+
+        collect_tags = [tag for tag in collect_tags if tag.collect_tag_category is not None]
+        sources = [tag for tag in collect_tags if tag.collect_tag_category.key == "source"]
         for source in sources:
-            if source.key == "occasional":
-                source.subcategories = []
-                for theme in themes:
-                    subcategory = theme
-                    subcategory.collects = [
-                        collect for collect in collects if theme in collect.tags.all() and source in collect.tags.all()
-                    ]
-                    if subcategory.collects:
-                        source.subcategories.append(subcategory)
-            if source.key == "year":
-                source.subcategories = []
-                for season in seasons:
-                    subcategory = season
-                    subcategory.collects = [
-                        collect
-                        for collect in collects
-                        if season in collect.tags.all() and source in collect.tags.all()
-                    ]
-                    if subcategory.collects:
-                        source.subcategories.append(subcategory)
-                for commemoration_type in commemoration_types:
-                    subcategory = commemoration_type
-                    if subcategory.key in ["sunday", "major_feast"]:
+            if source.key not in cls.GROUPINGS:
+                continue
+            in_source = positions_by_tag[source.pk]
+            source.subcategories = []
+            for category_keys, excluded_keys in cls.GROUPINGS[source.key]:
+                for subcategory in collect_tags:
+                    if subcategory.collect_tag_category.key not in category_keys or subcategory.key in excluded_keys:
                         continue
-                    subcategory.collects = [
-                        collect
-                        for collect in collects
-                        if commemoration_type in collect.tags.all() and source in collect.tags.all()
-                    ]
-                    if subcategory.collects:
-                        source.subcategories.append(subcategory)
-            if source.key == "liturgical":
-                source.subcategories = []
-                for liturgy in liturgies:
-                    subcategory = liturgy
-                    subcategory.collects = [
-                        collect
-                        for collect in collects
-                        if liturgy in collect.tags.all() and source in collect.tags.all()
-                    ]
+                    members = sorted(positions_by_tag[subcategory.pk] & in_source)
+                    subcategory.collects = [collects[position] for position in members]
                     if subcategory.collects:
                         source.subcategories.append(subcategory)
+        return sources
 
-        serializer = SourceSerializer(sources, many=True)
-        return Response(serializer.data)
+    def list(self, request):
+        data = cache.get(self.CACHE_KEY)
+        if data is None:
+            collects = list(self.queryset)
+            collect_tags = CollectTag.objects.select_related("collect_tag_category").order_by("order").all()
+            data = SourceSerializer(self.group(collects, collect_tags), many=True).data
+            cache.set(self.CACHE_KEY, data, self.CACHE_TIMEOUT)
+        return Response(data)
 
 
 class CollectCategoryViewSet(ViewSet):
@@ -68,6 +68,15 @@ class BaseTTSProvider:
         """Steering prompt actually sent (empty when unsupported)."""
         return ""
 
+    @property
+    def max_concurrency(self):
+        """How many clips one office may synthesize at the same time.
+
+        Keep this under the account's rate limit; requests that still hit a
+        429 are retried by the provider where it supports that.
+        """
+        return getattr(settings, "TTS_MAX_CONCURRENCY", 4)
+
     def voice_for_line_type(self, line_type):
         """Map a liturgical line_type to a voice via substring match."""
         if not line_type:
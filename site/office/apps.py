@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class OfficeConfig(AppConfig):
     name = "office"
+
+    def ready(self):
+        from office.signals import connect_signals
+
+        connect_signals()
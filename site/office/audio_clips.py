@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+
+from mutagen.mp3 import MP3
+
+from office.models import AudioClip
+from website.generations import GenerationCachedSnapshot
+
+
+class AudioClipLedger(GenerationCachedSnapshot):
+    """``AudioClip`` rows for the clips used while building one office's audio.
+
+    ``add`` only remembers a clip; ``flush`` looks all of them up with one
+    ``key__in`` query and creates the missing rows with one ``bulk_create``.
+    Keys known to have a row are kept per process, so audio that is already
+    cached costs no query at all. The known keys are dropped whenever a clip
+    row is deleted anywhere (see ``office/signals.py``), so a clip that is
+    rebuilt gets its row back.
+    """
+
+    GENERATION_KEY = "office:audio_clips:generation"
+
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.pending = {}
+
+    @classmethod
+    def load(cls) -> frozenset:
+        # Nothing is known after an invalidation; keys are remembered as rows are confirmed.
+        return frozenset()
+
+    @classmethod
+    def known_keys(cls) -> frozenset:
+        return cls.current()
+
+    @classmethod
+    def remember(cls, keys) -> None:
+        with cls._lock:
+            generation, known = cls._loaded or (None, frozenset())
+            cls._loaded = (generation, known | frozenset(keys))
+
+    def add(self, key, file_path, **fields) -> None:
+        """Note a clip on disk; ``fields`` are its ``AudioClip`` values other than ``key`` and ``duration``."""
+        self.pending.setdefault(key, (file_path, fields))
+
+    def flush(self) -> int:
+        """Create the rows that are missing and return how many were written."""
+        pending, self.pending = self.pending, {}
+        if not pending:
+            return 0
+
+        try:
+            known = self.known_keys()
+            pending = {key: value for key, value in pending.items() if key not in known}
+            if not pending:
+                return 0
+            existing = set(AudioClip.objects.filter(key__in=list(pending)).values_list("key", flat=True))
+            clips = [
+                AudioClip(key=key, duration=self.duration(file_path), **fields)
+                for key, (file_path, fields) in pending.items()
+                if key not in existing
+            ]
+            # Another worker may create the same rows in between; its rows win.
+            AudioClip.objects.bulk_create(clips, ignore_conflicts=True)
+        except Exception:
+            # DB tracking is best-effort; audio generation must not depend on it.
+            return 0
+        self.remember(pending)
+        return len(clips)
+
+    @staticmethod
+    def duration(file_path):
+        try:
+            return MP3(file_path).info.length
+        except Exception:
+            return None
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.test import RequestFactory
+from django.urls import resolve
+from django.utils import timezone
+from rest_framework.request import Request
+
+from office.api.response_cache import OfficeResponseCache
+from office.models import AudioBuildJob
+
+logger = logging.getLogger(__name__)
+
+# A running job whose worker has not reported progress for this long is assumed
+# dead (process restarted mid-build) and may be claimed again.
+JOB_STALE_AFTER = timedelta(minutes=15)
+# A failed job is retried when the audio is requested again after this long.
+JOB_RETRY_AFTER = timedelta(minutes=10)
+JOB_MAX_ATTEMPTS = 3
+# How often an idle worker looks for jobs enqueued by other processes.
+POLL_INTERVAL = 15
+# Minimum seconds between progress writes while clips are synthesized.
+PROGRESS_INTERVAL = 2
+
+# The ``audio`` payload of a job that has not finished; old clients read it as
+# "no audio yet" and hide the player.
+PENDING_AUDIO = {"tracks": [], "headings": [], "single_track": []}
+
+
+def job_key(office_name: str, office_date: date, office_settings) -> str:
+    """Identifies one office's audio: office, date, effective settings and TTS configuration."""
+    from office.api.views.index import TTS_PROVIDER
+
+    response_key = OfficeResponseCache.key(f"{office_name}:audio", office_date, office_settings)
+    signature = f"{response_key} {TTS_PROVIDER.media_subdir} {TTS_PROVIDER.cache_signature()}"
+    return hashlib.sha1(signature.encode("utf-8")).hexdigest()
+
+
+def enqueue(office_name: str, office_date: date, office_settings, path: str, query: dict) -> AudioBuildJob:
+    """The job building this office's audio, created if nobody has asked for it yet.
+
+    A failed job is put back in the queue once ``JOB_RETRY_AFTER`` has passed,
+    up to ``JOB_MAX_ATTEMPTS`` builds, and a ready job whose track has since
+    been deleted is built again.
+    """
+    job, created = AudioBuildJob.objects.get_or_create(
+        key=job_key(office_name, office_date, office_settings),
+        defaults={"office": office_name, "office_date": office_date, "path": path, "query": query},
+    )
+    requeue_if_missing(job)
+    if (
+        job.status == AudioBuildJob.FAILED
+        and job.attempts < JOB_MAX_ATTEMPTS
+        and job.updated < timezone.now() - JOB_RETRY_AFTER
+    ):
+        if AudioBuildJob.objects.filter(pk=job.pk, status=AudioBuildJob.FAILED).update(
+            status=AudioBuildJob.PENDING, updated=timezone.now()
+        ):
+            job.status = AudioBuildJob.PENDING
+    return job
+
+
+def track_is_missing(job: AudioBuildJob) -> bool:
+    """Whether the combined track of a ready job is gone from disk.
+
+    ``rebuild_audio_clip --clear-provider`` and ``cleanup_full_audio_files``
+    delete tracks but leave the jobs that advertise them.
+    """
+    single_track = (job.result or {}).get("single_track") or []
+    if job.status != AudioBuildJob.READY or len(single_track) < 2:
+        return False
+    path = single_track[1]
+    if not path.startswith(settings.MEDIA_URL):
+        return False
+    return not os.path.isfile(os.path.join(settings.MEDIA_ROOT, path[len(settings.MEDIA_URL) :]))
+
+
+def requeue_if_missing(job: AudioBuildJob) -> AudioBuildJob:
+    """Put a ready job whose track was deleted back in the queue, as a fresh build."""
+    if track_is_missing(job):
+        if AudioBuildJob.objects.filter(pk=job.pk, status=AudioBuildJob.READY).update(
+            status=AudioBuildJob.PENDING, attempts=0, clips_ready=0, result=None, updated=timezone.now()
+        ):
+            job.status = AudioBuildJob.PENDING
+            job.attempts = job.clips_ready = 0
+            job.result = None
+    return job
+
+
+def has_given_up(job: AudioBuildJob) -> bool:
+    """A failed job that will not be retried, so clients should stop waiting for it."""
+    return job.status == AudioBuildJob.FAILED and job.attempts >= JOB_MAX_ATTEMPTS
+
+
+def describe(job: AudioBuildJob) -> dict:
+    return {
+        "id": str(job.pk),
+        "status": job.status,
+        "clips_ready": job.clips_ready,
+        "clips_total": job.clips_total,
+    }
+
+
+def audio_payload(job: AudioBuildJob) -> dict:
+    """Response body for an ``include_audio_links`` request or a job poll."""
+    audio = job.result if job.status == AudioBuildJob.READY else PENDING_AUDIO
+    return {"audio": audio, "job": describe(job)}
+
+
+def claim_next() -> AudioBuildJob | None:
+    """Mark the oldest waiting job as running and return it, or None when the queue is empty.
+
+    ``skip_locked`` lets several workers, in any number of processes, claim
+    jobs at the same time without handing the same job to two of them.
+    """
+    stale = timezone.now() - JOB_STALE_AFTER
+    with transaction.atomic():
+        job = (
+            AudioBuildJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=AudioBuildJob.PENDING)
+                | Q(status=AudioBuildJob.RUNNING, updated__lt=stale, attempts__lt=JOB_MAX_ATTEMPTS)
+            )
+            .order_by("created")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = AudioBuildJob.RUNNING
+        job.attempts += 1
+        job.error = ""
+        job.save(update_fields=["status", "attempts", "error", "updated"])
+    return job
+
+
+def build_audio(job: AudioBuildJob, progress=None) -> dict:
+    """The ``audio`` payload for a job, rebuilt from its office path and query parameters."""
+    from office.api.views.index import OfficeAudioSerializer, Settings
+
+    view_class = resolve(job.path).func.view_class
+    request = Request(RequestFactory().get(job.path, data=job.query))
+    office_date = job.office_date
+    office = view_class.office_class(
+        request, office_date.year, office_date.month, office_date.day, settings=Settings(request)
+    )
+    serializer = OfficeAudioSerializer(office, context={"audio_progress": progress})
+    return serializer.get_audio(office)
+
+
+def run_job(job: AudioBuildJob) -> None:
+    jobs = AudioBuildJob.objects.filter(pk=job.pk)
+    last_report = [0.0]
+
+    def report(ready, total):
+        # Doubles as the job's heartbeat, so it is not treated as stale while it runs.
+        now = time.monotonic()
+        if ready == total or now - last_report[0] >= PROGRESS_INTERVAL:
+            last_report[0] = now
+            jobs.update(clips_ready=ready, clips_total=total, updated=timezone.now())
+
+    try:
+        result = build_audio(job, progress=report)
+    except Exception as exc:
+        logger.exception("Audio build failed for %s", job)
+        jobs.update(status=AudioBuildJob.FAILED, error=str(exc), updated=timezone.now())
+        return
+    jobs.update(status=AudioBuildJob.READY, result=result, updated=timezone.now())
+
+
+def prune(keep_days: int = 30) -> int:
+    """Give up on builds that died on their last attempt and delete jobs older than ``keep_days``.
+
+    Old jobs belong to past dates or to superseded content generations
+    (``OfficeResponseCache``); their audio files stay on disk and a new
+    request simply queues a fresh job.
+    """
+    stale = timezone.now() - JOB_STALE_AFTER
+    AudioBuildJob.objects.filter(
+        status=AudioBuildJob.RUNNING, updated__lt=stale, attempts__gte=JOB_MAX_ATTEMPTS
+    ).update(
+        status=AudioBuildJob.FAILED, error="The worker building this audio stopped responding.", updated=timezone.now()
+    )
+    deleted, _ = AudioBuildJob.objects.filter(updated__lt=timezone.now() - timedelta(days=keep_days)).delete()
+    return deleted
+
+
+def run_pending(limit: int | None = None) -> int:
+    """Run queued jobs in this thread until the queue is empty (or ``limit`` jobs ran)."""
+    count = 0
+    while limit is None or count < limit:
+        job = claim_next()
+        if job is None:
+            break
+        run_job(job)
+        count += 1
+    return count
+
+
+class AudioJobWorkers:
+    """Daemon threads that run audio jobs inside the web process.
+
+    Started on the first enqueue in a process, so a worker that never serves
+    audio never polls. ``AUDIO_JOB_WORKERS`` sets how many threads each
+    process runs; with 0 jobs wait for ``manage.py run_audio_jobs``.
+    """
+
+    _lock = threading.Lock()
+    _wake = threading.Event()
+    _threads = []
+    _pid = None
+
+    @classmethod
+    def ensure_started(cls) -> None:
+        count = getattr(settings, "AUDIO_JOB_WORKERS", 1)
+        if count <= 0:
+            return
+        with cls._lock:
+            if cls._pid != os.getpid():
+                # Threads do not survive a fork; the child starts its own.
+                cls._threads = []
+                cls._pid = os.getpid()
+            while len(cls._threads) < count:
+                thread = threading.Thread(target=cls._run, name=f"audio-jobs-{len(cls._threads)}", daemon=True)
+                thread.start()
+                cls._threads.append(thread)
+        cls._wake.set()
+
+    @classmethod
+    def _run(cls) -> None:
+        while True:
+            close_old_connections()
+            try:
+                job = claim_next()
+                if job is not None:
+                    run_job(job)
+                    continue
+            except Exception:
+                logger.exception("Audio job worker failed")
+            cls._wake.wait(POLL_INTERVAL)
+            cls._wake.clear()
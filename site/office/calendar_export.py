@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Iterable
+
+from django.db import connections
+from django.utils import timezone
+from icalendar import Calendar, Event
+
+from churchcal.calendar_feeds import (
+    CALENDAR_FOOTER,
+    ChurchCalendarFeedBuilder,
+    FeedDay,
+    acquire_lock,
+    get_calendar_feed_directory,
+    write_chunks_atomic,
+)
+from website.settings import FIRST_BEGINNING_YEAR, LAST_BEGINNING_YEAR
+
+logger = logging.getLogger(__name__)
+
+SITE_URL = "https://www.dailyoffice2019.com"
+
+# Bump whenever the event content below changes so the compiled download is rebuilt.
+OFFICE_CALENDAR_EXPORT_VERSION = 1
+
+
+class OfficeCalendarExport:
+    """The ``dailyoffice.ics`` download covering every church year the site serves.
+
+    Events are generated from the compiled per-year feed days of the ICS
+    feeds (see ``churchcal.calendar_feeds.FeedYearStore``) and streamed into a
+    file next to the feeds. The ``generate_office_calendar`` command builds it
+    nightly and on deploy, rewriting it only when the calendar, office or
+    lectionary sources changed. Like ``ChurchCalendarFeedService``, requests
+    serve the file on disk: one that was not checked today is still served
+    while a background thread checks it, and only a missing file makes a
+    request wait for a build.
+    """
+
+    FILENAME = "dailyoffice.ics"
+
+    @classmethod
+    def path(cls) -> Path:
+        return get_calendar_feed_directory() / cls.FILENAME
+
+    @classmethod
+    def manifest_path(cls) -> Path:
+        return get_calendar_feed_directory() / "dailyoffice.json"
+
+    @classmethod
+    def lock_path(cls) -> Path:
+        return get_calendar_feed_directory() / ".dailyoffice.lock"
+
+    @classmethod
+    def ensure_current(
+        cls, years: Iterable[int] | None = None, today: date | None = None, force: bool = False
+    ) -> Path:
+        """Build the file unless it was checked today; ``force`` re-checks the sources regardless."""
+        years = cls._years(years)
+        today = today or timezone.localdate()
+        if force or cls._is_stale(cls._read_manifest(), years, today):
+            lock_file = acquire_lock(cls.lock_path())
+            try:
+                # Another worker may have built it while this one waited for the lock.
+                if force or cls._is_stale(cls._read_manifest(), years, today):
+                    cls._rebuild(years, today)
+            finally:
+                lock_file.close()
+        return cls.path()
+
+    @classmethod
+    def get_path(cls, today: date | None = None) -> Path:
+        """The file to serve, without touching the database unless it is missing."""
+        years = cls._years(None)
+        today = today or timezone.localdate()
+        if cls._is_stale(cls._read_manifest(), years, today):
+            if cls.path().exists():
+                cls.refresh_in_background(today)
+            else:
+                cls.ensure_current(years=years, today=today)
+        return cls.path()
+
+    @classmethod
+    def refresh_in_background(cls, today: date) -> threading.Thread | None:
+        """Start checking the file in a daemon thread unless another process or thread already is."""
+        lock_file = acquire_lock(cls.lock_path(), blocking=False)
+        if lock_file is None:
+            return None
+
+        thread = threading.Thread(
+            target=cls._refresh_and_release, args=(today, lock_file), name="office-calendar-refresh", daemon=True
+        )
+        thread.start()
+        return thread
+
+    @classmethod
+    def _refresh_and_release(cls, today: date, lock_file) -> None:
+        try:
+            years = cls._years(None)
+            if cls._is_stale(cls._read_manifest(), years, today):
+                cls._rebuild(years, today)
+        except Exception:
+            logger.exception("Office calendar export failed")
+        finally:
+            lock_file.close()
+            connections.close_all()
+
+    @classmethod
+    def _rebuild(cls, years: list[int], today: date) -> None:
+        """Rewrite the file if its sources changed, and record that it was checked ``today``."""
+        builder = ChurchCalendarFeedBuilder()
+        manifest = {"version": OFFICE_CALENDAR_EXPORT_VERSION, "years": years, "fingerprint": builder.fingerprint}
+        previous = cls._read_manifest() or {}
+        if {key: previous.get(key) for key in manifest} != manifest or not cls.path().exists():
+            write_chunks_atomic(cls.path(), cls.iter_ical(builder, years))
+        manifest["build_date"] = today.isoformat()
+        write_chunks_atomic(cls.manifest_path(), [json.dumps(manifest).encode("utf-8")])
+
+    @classmethod
+    def _is_stale(cls, manifest: dict[str, object] | None, years: list[int], today: date) -> bool:
+        if not manifest or manifest.get("build_date") != today.isoformat():
+            return True
+        if manifest.get("version") != OFFICE_CALENDAR_EXPORT_VERSION or manifest.get("years") != years:
+            return True
+        return not cls.path().exists()
+
+    @staticmethod
+    def _years(years: Iterable[int] | None) -> list[int]:
+        return list(years or range(FIRST_BEGINNING_YEAR, LAST_BEGINNING_YEAR + 1))
+
+    @classmethod
+    def iter_ical(cls, builder: ChurchCalendarFeedBuilder, years: Iterable[int]) -> Iterable[bytes]:
+        calendar = Calendar()
+        calendar.add("prodid", "-//Daily Office//mxm.dk//")
+        calendar.add("version", "2.0")
+        yield calendar.to_ical()[: -len(CALENDAR_FOOTER)]
+
+        for year in years:
+            for feed_day in builder.feed_year(year).feed_days:
+                yield cls.serialize_event(feed_day)
+        yield CALENDAR_FOOTER
+
+    @classmethod
+    def serialize_event(cls, feed_day: FeedDay) -> bytes:
+        day = feed_day.event_date
+        slug = f"{day.year}-{day.month}-{day.day}"
+        event = Event()
+        event.add("SUMMARY", feed_day.primary_name)
+        event.add("DTSTART", day)
+        event.add("URL", f"{SITE_URL}/morning_prayer/{slug}/")
+        event.add("LOCATION", f"{SITE_URL}/morning_prayer/{slug}/")
+        event.add("DESCRIPTION", "\n".join(cls.description_lines(feed_day, slug)))
+        return event.to_ical()
+
+    @staticmethod
+    def description_lines(feed_day: FeedDay, slug: str) -> list[str]:
+        details = feed_day.office_details
+        lines = list(feed_day.commemorations)
+
+        if feed_day.fast_day:
+            lines.extend(["", "FAST DAY"])
+
+        if feed_day.feast_day:
+            lines.extend(["", "SUNDAY OR MAJOR HOLY DAY"])
+
+        lines.extend(
+            [
+                "",
+                "MORNING PRAYER (or year 1)",
+                f"Psalms {details.mp_psalms_30_day} (30 day cycle)",
+                f"Psalms {details.mp_psalms_60_day} (60 day cycle)",
+                details.mp_reading_1,
+                details.mp_reading_2,
+                "",
+                "EVENING PRAYER (or year 2)",
+                f"Psalms {details.ep_psalms_30_day} (30 day cycle)",
+                f"Psalms {details.ep_psalms_60_day} (60 day cycle)",
+                details.ep_reading_1,
+                details.ep_reading_2,
+            ]
+        )
+
+        if feed_day.feast_day:
+            lines.extend(["", "EUCHARIST", *feed_day.mass_reading_citations])
+
+        lines.extend(
+            [
+                "",
+                f"Morning Prayer: {SITE_URL}/morning_prayer/{slug}/",
+                f"Midday Prayer: {SITE_URL}/midday_prayer/{slug}/",
+                f"Evening Prayer: {SITE_URL}/evening_prayer/{slug}/",
+                f"Compline: {SITE_URL}/compline/{slug}/",
+                f"Family Prayer in the Morning: {SITE_URL}/family/morning_prayer/{slug}/",
+                f"Family Prayer at Midday: {SITE_URL}/family/midday_prayer/{slug}/",
+                f"Family Prayer in the Early Evening: {SITE_URL}/family/early_evening_prayer/{slug}/",
+                f"Family Prayer at the Close of Day: {SITE_URL}/family/close_of_day_prayer/{slug}/",
+            ]
+        )
+        return lines
+
+    @classmethod
+    def _read_manifest(cls) -> dict[str, object] | None:
+        try:
+            return json.loads(cls.manifest_path().read_text())
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from functools import cached_property
+from types import MappingProxyType
+
+from website.generations import GenerationCachedSnapshot
+
+
+def _strip_tags(text):
+    from office.management.commands.import_collects import do_strip_tags
+
+    return do_strip_tags(text)
+
+
+class CatalogCollect:
+    """A read-only collect whose tag-stripped texts are computed once per process.
+
+    The attribute names match ``Collect`` so office modules can use either.
+    """
+
+    def __init__(self, pk, title, text, traditional_text, chinese_text, spanish_text, created, tags):
+        self.pk = pk
+        self.title = title
+        self.text = text
+        self.traditional_text = traditional_text
+        self.chinese_text = chinese_text
+        self.spanish_text = spanish_text
+        self.created = created
+        self.tags = tags
+
+    @cached_property
+    def text_no_tags(self):
+        return _strip_tags(self.text).replace(" Amen.", "")
+
+    @cached_property
+    def traditional_text_no_tags(self):
+        return _strip_tags(self.traditional_text).replace(" Amen.", "")
+
+    @cached_property
+    def chinese_text_no_tags(self):
+        if not self.chinese_text:
+            return None
+        return _strip_tags(self.chinese_text).replace("阿們。", "").replace(" Amen.", "").strip()
+
+    @cached_property
+    def spanish_text_no_tags(self):
+        if not self.spanish_text:
+            return None
+        return _strip_tags(self.spanish_text).replace("Amén.", "").replace(" Amen.", "").strip()
+
+
+class CollectCatalogSnapshot:
+    def __init__(self, collects):
+        by_pk = {}
+        by_tag = {}
+        for collect in collects:
+            by_pk[str(collect.pk)] = collect
+            for tag in collect.tags:
+                by_tag.setdefault(tag, []).append(collect)
+        self.by_pk = MappingProxyType(by_pk)
+        self.by_tag = MappingProxyType({tag: tuple(tagged) for tag, tagged in by_tag.items()})
+
+
+class CollectCatalog(GenerationCachedSnapshot):
+    """Every collect, indexed by primary key and by tag name, shared by the office modules.
+
+    Loaded with two queries the first time it is needed and kept until a
+    ``Collect``, its tags or a ``CollectTag`` changes (see ``office/signals.py``).
+    """
+
+    GENERATION_KEY = "office:collects:generation"
+
+    @staticmethod
+    def load():
+        from office.models import Collect
+
+        tags = {}
+        for collect_id, tag_name in Collect.tags.through.objects.values_list("collect_id", "collecttag__name"):
+            tags.setdefault(collect_id, []).append(tag_name)
+
+        rows = Collect.objects.order_by("created", "pk").values_list(
+            "pk", "title", "text", "traditional_text", "chinese_text", "spanish_text", "created"
+        )
+        return CollectCatalogSnapshot(CatalogCollect(*row, tuple(tags.get(row[0], ()))) for row in rows)
+
+    @classmethod
+    def tagged(cls, tag_name) -> tuple[CatalogCollect, ...]:
+        return cls.current().by_tag.get(tag_name, ())
+
+    @classmethod
+    def get_many(cls, pks) -> list[CatalogCollect]:
+        """The collects for ``pks`` in catalog order, skipping unknown and repeated keys.
+
+        The order does not depend on how ``pks`` were given, so requests that
+        name the same collects share one ``OfficeResponseCache`` entry and ETag.
+        """
+        wanted = {str(pk).strip() for pk in pks}
+        return [collect for pk, collect in cls.current().by_pk.items() if pk in wanted]
@@ -5,9 +5,11 @@ from django.conf import settings
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3NoHeaderError
 
+from office.models import AudioTrack
+
 
 class Command(BaseCommand):
-    help = "Finds and optionally deletes 'full' office audio files generated by ffmpeg."
+    help = "Finds and optionally deletes 'full' office audio files (ffmpeg-tagged or recorded as AudioTrack rows)."
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -98,6 +100,27 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write(self.style.ERROR(f"Error reading {filename}: {e}"))
 
+        # Combined tracks joined frame by frame carry no ffmpeg tag and live in the
+        # provider's subdirectory; their AudioTrack rows name them instead.
+        seen = {filename for filename, size in full_files_found}
+        for track in AudioTrack.objects.order_by("created").iterator():
+            file_path = os.path.join(media_root, track.filename)
+            if track.filename in seen or not os.path.isfile(file_path):
+                continue
+            if os.path.getmtime(file_path) >= cutoff_time:
+                continue
+
+            size = os.path.getsize(file_path)
+            full_files_found.append((track.filename, size))
+            total_size_bytes += size
+
+            if is_dry_run:
+                self.stdout.write(f"Found full file: {track.filename} ({size / 1024 / 1024:.2f} MB)")
+            else:
+                os.remove(file_path)
+                track.delete()
+                self.stdout.write(self.style.SUCCESS(f"Deleted: {track.filename}"))
+
         self.stdout.write("\n" + "=" * 40)
         self.stdout.write(self.style.SUCCESS(f"Total MP3s scanned (older than {days_old} days): {total_mp3s}"))
         self.stdout.write(self.style.SUCCESS(f"Full office files identified: {len(full_files_found)}"))
@@ -0,0 +1,14 @@
+import kronos
+from django.core.management.base import BaseCommand
+
+from office.calendar_export import OfficeCalendarExport
+
+
+# After generate_calendar_feeds, so the compiled church years it reads are current.
+@kronos.register("15 0 * * *")
+class Command(BaseCommand):
+    help = "Build the dailyoffice.ics download, rewriting it only when its sources changed."
+
+    def handle(self, *args, **options):
+        path = OfficeCalendarExport.ensure_current(force=True)
+        self.stdout.write(self.style.SUCCESS(f"Office calendar is current: {path}"))
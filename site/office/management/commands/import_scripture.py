@@ -3,10 +3,13 @@ import time
 
 import scriptures
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 from bible.passage import Passage
 from bible.sources import PassageNotFoundException
+from churchcal.mass_readings import MassLectionary
 from churchcal.models import MassReading
+from office.api.response_cache import OfficeResponseCache
 from office.models import OfficeDay, Scripture
 
 SCOPES = "https://www.googleapis.com/auth/spreadsheets.readonly"
@@ -44,6 +47,12 @@ class Command(BaseCommand):
             default=0.5,
             help="Sleep time between API calls in seconds",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Changed passages per bulk_update (default: 50)",
+        )
 
     def parse_passage(self, passage):
         try:
@@ -192,6 +201,15 @@ class Command(BaseCommand):
         imported = 0
         errors = 0
         skipped = 0
+        batch_size = options["batch_size"]
+        pending = []
+        started = time.monotonic()
+
+        def flush():
+            nonlocal pending
+            if pending:
+                Scripture.objects.bulk_update(pending, [*translations, "updated"], batch_size=batch_size)
+                pending = []
 
         self.stdout.write(f"Processing {total} passages for translations: {', '.join(translations)}")
 
@@ -222,15 +240,22 @@ class Command(BaseCommand):
                     self.stderr.write(f"  [{i+1}/{total}] {passage} ({translation}): ERROR - {e}")
 
             if changed:
-                scripture.save()
+                scripture.updated = timezone.now()
+                pending.append(scripture)
                 imported += 1
             else:
                 skipped += 1
 
+            if len(pending) >= batch_size:
+                flush()
+
             if (i + 1) % 50 == 0:
+                elapsed = time.monotonic() - started
                 self.stdout.write(
-                    f"Progress: {i+1}/{total} processed, {imported} imported, {skipped} skipped, {errors} errors"
+                    f"Progress: {i+1}/{total} processed, {imported} imported, {skipped} skipped, {errors} errors "
+                    f"({(i + 1) / elapsed:.1f} passages/s)"
                 )
+        flush()
 
         # 3. Handle Apocrypha (KJV -> av fallback)
         if "kjv" in translations:
@@ -246,6 +271,11 @@ class Command(BaseCommand):
                 except Exception as e:
                     self.stderr.write(f"  [Apocrypha] {scripture.passage} (kjv fallback to av): ERROR - {e}")
 
+        # bulk_update sends no post_save, so drop cached offices and lectionary text explicitly.
+        if imported:
+            OfficeResponseCache.invalidate()
+            MassLectionary.invalidate()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"Done! {imported} imported, {skipped} skipped, {errors} errors out of {total} passages."
@@ -0,0 +1,61 @@
+import os
+from datetime import timedelta
+
+import kronos
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from office.api.prerender import popular_setting_combinations, prerender_offices
+
+
+@kronos.register("20 3 * * *")
+class Command(BaseCommand):
+    help = "Pre-render office JSON for upcoming days using the most requested setting combinations."
+
+    DEFAULT_DAYS = 9
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=self.DEFAULT_DAYS,
+            help=f"Number of days to pre-render, starting yesterday (default: {self.DEFAULT_DAYS}).",
+        )
+        parser.add_argument(
+            "--combinations",
+            type=int,
+            default=10,
+            help="How many of the most requested setting combinations to render (default: 10).",
+        )
+        parser.add_argument(
+            "--lookback",
+            type=int,
+            default=30,
+            help="Days of office views to count when ranking setting combinations (default: 30).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes (default: CPU count). Use 1 with the local-memory cache.",
+        )
+
+    def handle(self, *args, **options):
+        combinations = popular_setting_combinations(options["lookback"], options["combinations"])
+
+        # Start yesterday: clients west of the server are still on the previous day.
+        start_date = timezone.localdate() - timedelta(days=1)
+        days = [start_date + timedelta(days=i) for i in range(options["days"])]
+
+        rendered = prerender_offices(
+            days,
+            combinations,
+            workers=options["workers"],
+            log=self.stdout.write if options["verbosity"] > 1 else None,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pre-rendered {rendered} office(s) for {len(days)} day(s) "
+                f"across {len(combinations)} setting combination(s)."
+            )
+        )
@@ -5,7 +5,7 @@ from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
 from office.api.views.tts import provider_names
-from office.models import AudioClip
+from office.models import AudioClip, AudioTrack
 
 
 class Command(BaseCommand):
@@ -130,6 +130,7 @@ class Command(BaseCommand):
                 if os.path.isfile(os.path.join(media_root, f)) and (f.endswith(".mp3") or f.endswith(".mp3.txt"))
             ]
             rows = AudioClip.objects.exclude(filename__contains="/")
+            tracks = AudioTrack.objects.exclude(filename__contains="/")
         else:
             target_dir = os.path.join(media_root, name)
             files = []
@@ -139,6 +140,7 @@ class Command(BaseCommand):
                     if os.path.isfile(full) and (entry.endswith(".mp3") or entry.endswith(".mp3.txt")):
                         files.append(entry)
             rows = AudioClip.objects.filter(filename__startswith=f"{name}/")
+            tracks = AudioTrack.objects.filter(filename__startswith=f"{name}/")
 
         row_count = rows.count()
         if not files and not row_count:
@@ -165,6 +167,8 @@ class Command(BaseCommand):
             return
 
         rows.delete()
+        # Timelines of the combined tracks removed above.
+        tracks.delete()
         self.stdout.write(
             self.style.SUCCESS(
                 f"[{name}] Deleted {len(files)} file(s) ({freed_bytes / 1024 / 1024:.2f} MB) "
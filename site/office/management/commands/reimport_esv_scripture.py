@@ -8,18 +8,64 @@ This command:
 4. Handles errors prominently
 5. Includes Apocrypha citations
 6. Does not touch other translation fields
+
+With --workers N the passages are grouped by book and rendered across a
+process pool (each worker keeps its recently used books parsed), and changed
+rows are written back with bulk_update in batches.
 """
 
+import multiprocessing
+import time
 import traceback
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+from django.core.cache import caches
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connections, transaction
+from django.utils import timezone
 
 from bible.esv_xml_adapter import ESVXMLAdapter
 from bible.sources import PassageNotFoundException
+from churchcal.mass_readings import MassLectionary
+from office.api.response_cache import OfficeResponseCache
 from office.models import Scripture
 
 
+def passage_book(passage):
+    """The normalized book of ``passage``, or "" when it can't be parsed.
+
+    Building the adapter only parses the citation; no XML is read until the
+    HTML is asked for.
+    """
+    try:
+        return ESVXMLAdapter(passage, "esv").book
+    except (PassageNotFoundException, Exception):
+        return ""
+
+
+def render_book_passages(passages, include_references=False):
+    """Render ESV HTML for passages (ideally all from one book) in a worker.
+
+    Returns ``(passage, html, error)`` tuples; exactly one of ``html`` and
+    ``error`` is set.
+    """
+    results = []
+    for passage in passages:
+        try:
+            results.append((passage, ESVXMLAdapter(passage, "esv", include_references=include_references).html, None))
+        # PassageNotFoundException derives from BaseException, so it is named on its own.
+        except (PassageNotFoundException, Exception) as e:
+            results.append((passage, None, str(e)))
+    return results
+
+
+def _prepare_worker():
+    # Forked workers must not share the parent's database or cache sockets.
+    connections.close_all()
+    caches.close_all()
+
+
 class Command(BaseCommand):
     help = "Reimport ESV scripture content from XML files"
 
@@ -44,6 +90,18 @@ class Command(BaseCommand):
             action="store_true",
             help="Include cross-references and footnotes in output (default: False)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Render passages across this many processes, grouped by book (default: 1, serial)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows per bulk_update when --workers is above 1 (default: 500)",
+        )
 
     def handle(self, *args, **options):
         dry_run = options.get("dry_run", False)
@@ -77,6 +135,10 @@ class Command(BaseCommand):
 
         self.stdout.write("")
 
+        if options["workers"] > 1:
+            self.handle_parallel(scriptures, dry_run, include_references, options["workers"], options["batch_size"])
+            return
+
         # Counters for statistics
         total_count = 0
         updated_count = 0
@@ -181,3 +243,96 @@ class Command(BaseCommand):
             )
         else:
             self.stdout.write(self.style.SUCCESS("Command completed successfully!"))
+
+    def handle_parallel(self, scriptures, dry_run, include_references, workers, batch_size):
+        """Render by book across a process pool and bulk_update changed rows in batches."""
+        rows_by_passage = defaultdict(list)
+        skipped_count = 0
+        for scripture in scriptures:
+            if not scripture.passage or scripture.passage.strip() == "":
+                skipped_count += 1
+                continue
+            rows_by_passage[scripture.passage].append(scripture)
+
+        passages_by_book = defaultdict(list)
+        for passage in rows_by_passage:
+            passages_by_book[passage_book(passage)].append(passage)
+
+        total = len(rows_by_passage)
+        self.stdout.write(
+            f"Rendering {total} distinct passages from {len(passages_by_book)} books with {workers} workers"
+        )
+
+        processed = 0
+        updated_count = 0
+        errors = []
+        pending = []
+        started = time.monotonic()
+
+        def flush():
+            nonlocal pending
+            if pending and not dry_run:
+                Scripture.objects.bulk_update(pending, ["esv", "updated"], batch_size=batch_size)
+            pending = []
+
+        _prepare_worker()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork"), initializer=_prepare_worker
+        ) as executor:
+            futures = {
+                executor.submit(render_book_passages, passages, include_references): book
+                for book, passages in passages_by_book.items()
+            }
+            for future in as_completed(futures):
+                book = futures[future]
+                for passage, html, error in future.result():
+                    processed += 1
+                    if error is not None:
+                        errors.append((passage, error))
+                        continue
+                    if not html or html.strip() == "":
+                        skipped_count += 1
+                        continue
+                    for scripture in rows_by_passage[passage]:
+                        if scripture.esv == html:
+                            skipped_count += 1
+                            continue
+                        scripture.esv = html
+                        scripture.updated = timezone.now()
+                        pending.append(scripture)
+                        updated_count += 1
+                    if len(pending) >= batch_size:
+                        flush()
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"[{processed}/{total}] {book or 'unparsed citations'} done "
+                    f"({processed / elapsed if elapsed else 0:.1f} passages/s)"
+                )
+        flush()
+
+        # bulk_update sends no post_save, so drop cached offices and lectionary text explicitly.
+        if updated_count and not dry_run:
+            OfficeResponseCache.invalidate()
+            MassLectionary.invalidate()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS("=" * 70))
+        self.stdout.write(self.style.SUCCESS("SUMMARY"))
+        self.stdout.write(self.style.SUCCESS("=" * 70))
+        self.stdout.write(f"Total processed: {processed} passages in {elapsed:.1f}s")
+        self.stdout.write(self.style.SUCCESS(f"Updated: {updated_count}"))
+        self.stdout.write(self.style.WARNING(f"Skipped: {skipped_count}"))
+        self.stdout.write(self.style.ERROR(f"Errors: {len(errors)}"))
+
+        if errors:
+            self.stdout.write("")
+            self.stdout.write(self.style.ERROR("ERRORS ENCOUNTERED:"))
+            self.stdout.write(self.style.ERROR("-" * 70))
+            for passage, error in errors:
+                self.stdout.write(self.style.ERROR(f"  {passage}: {error}"))
+
+        if dry_run:
+            self.stdout.write("")
+            self.stdout.write(self.style.WARNING("DRY RUN - No changes were saved to the database"))
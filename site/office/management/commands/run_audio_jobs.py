@@ -0,0 +1,31 @@
+import kronos
+from django.core.management.base import BaseCommand
+
+from office import audio_jobs
+
+
+@kronos.register("*/5 * * * *")
+class Command(BaseCommand):
+    help = (
+        "Build queued office audio (see office/audio_jobs.py). Picks up jobs left behind by a restarted "
+        "web process, or every job when AUDIO_JOB_WORKERS is 0, and prunes old job records."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after this many jobs (default: run until the queue is empty).",
+        )
+        parser.add_argument(
+            "--keep-days",
+            type=int,
+            default=30,
+            help="Delete job records not touched for this many days (default: 30).",
+        )
+
+    def handle(self, *args, **options):
+        pruned = audio_jobs.prune(keep_days=options["keep_days"])
+        built = audio_jobs.run_pending(limit=options["limit"])
+        self.stdout.write(self.style.SUCCESS(f"Ran {built} audio job(s); pruned {pruned} old job record(s)."))
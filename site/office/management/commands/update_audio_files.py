@@ -2,10 +2,12 @@ from datetime import timedelta
 
 import kronos
 from django.core.management.base import BaseCommand
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 from django.urls import resolve
 from django.utils import timezone
 
+from office import audio_jobs
+
 
 @kronos.register("55 9 * * *")
 class Command(BaseCommand):
@@ -29,6 +31,9 @@ class Command(BaseCommand):
             help="Start warming from today instead of including yesterday.",
         )
 
+    # The office views only queue audio builds; this command runs them itself,
+    # so no background workers are started in this short-lived process.
+    @override_settings(AUDIO_JOB_WORKERS=0)
     def handle(self, *args, **options):
 
         days = options["days"]
@@ -165,3 +170,6 @@ class Command(BaseCommand):
                         # Print the response content
                         print(response.content)
                         print(response.status_code)
+
+                        # Build the audio the view just queued.
+                        audio_jobs.run_pending()
@@ -0,0 +1,56 @@
+# Generated by Django 6.0.4 on 2026-10-18 12:00
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("office", "0028_merge_20260718_2138"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AudioBuildJob",
+            fields=[
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("key", models.CharField(max_length=64, unique=True)),
+                ("office", models.CharField(max_length=64)),
+                ("office_date", models.DateField()),
+                (
+                    "path",
+                    models.CharField(help_text="Office API path the audio belongs to.", max_length=255),
+                ),
+                (
+                    "query",
+                    models.JSONField(blank=True, default=dict, help_text="Query parameters of the original request."),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("ready", "Ready"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("clips_ready", models.PositiveIntegerField(default=0)),
+                ("clips_total", models.PositiveIntegerField(default=0)),
+                ("result", models.JSONField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "ordering": ("created",),
+            },
+        ),
+    ]
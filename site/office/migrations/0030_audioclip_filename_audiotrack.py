@@ -0,0 +1,39 @@
+# Generated by Django 6.0.4 on 2026-10-18 12:30
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("office", "0029_audiobuildjob"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="audioclip",
+            name="filename",
+            field=models.CharField(db_index=True, max_length=128),
+        ),
+        migrations.CreateModel(
+            name="AudioTrack",
+            fields=[
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("key", models.CharField(help_text="uuid5 stem of the combined file.", max_length=64, unique=True)),
+                ("filename", models.CharField(max_length=128)),
+                (
+                    "duration",
+                    models.FloatField(blank=True, help_text="Length in seconds (via mutagen).", null=True),
+                ),
+                ("track_list", models.JSONField(blank=True, default=list)),
+                ("short_track_list", models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -800,7 +800,7 @@ class AudioClip(BaseModel):
     )
 
     key = models.CharField(max_length=64, unique=True, db_index=True, help_text="uuid5 stem / filename base.")
-    filename = models.CharField(max_length=128)
+    filename = models.CharField(max_length=128, db_index=True)
     text = models.TextField(blank=True, default="", help_text="Normalized text sent to OpenAI.")
     line_type = models.CharField(max_length=64, blank=True, default="")
     voice = models.CharField(max_length=32, blank=True, default="", db_index=True)
@@ -835,6 +835,62 @@ class AudioClip(BaseModel):
         return False
 
 
+class AudioTrack(BaseModel):
+    """A combined office track and its timeline, recorded when the track is built.
+
+    ``start_time`` values in ``track_list`` (modules) and ``short_track_list``
+    (line ids) are already scaled to ``duration``, so an office whose combined
+    file exists can be answered, and its track served, without reading any mp3.
+    """
+
+    key = models.CharField(max_length=64, unique=True, help_text="uuid5 stem of the combined file.")
+    filename = models.CharField(max_length=128)
+    duration = models.FloatField(null=True, blank=True, help_text="Length in seconds (via mutagen).")
+    track_list = models.JSONField(default=list, blank=True)
+    short_track_list = models.JSONField(default=list, blank=True)
+
+    def __str__(self):
+        return self.filename
+
+
+class AudioBuildJob(BaseModel):
+    """One office's combined audio, built in the background (see ``office/audio_jobs.py``).
+
+    ``key`` identifies the office, date, effective settings and TTS
+    configuration, so every request for the same audio shares one job. The
+    finished ``include_audio_links`` payload is kept in ``result``.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+    STATUSES = (
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (READY, "Ready"),
+        (FAILED, "Failed"),
+    )
+
+    key = models.CharField(max_length=64, unique=True)
+    office = models.CharField(max_length=64)
+    office_date = models.DateField()
+    path = models.CharField(max_length=255, help_text="Office API path the audio belongs to.")
+    query = models.JSONField(default=dict, blank=True, help_text="Query parameters of the original request.")
+    status = models.CharField(max_length=16, choices=STATUSES, default=PENDING, db_index=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    clips_ready = models.PositiveIntegerField(default=0)
+    clips_total = models.PositiveIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ("created",)
+
+    def __str__(self):
+        return f"{self.office} {self.office_date} ({self.status})"
+
+
 class MetricalCollect(BaseModel):
     collect_number = models.PositiveSmallIntegerField(null=True, blank=True)
     original_collect = models.TextField(max_length=255, null=True, blank=True)
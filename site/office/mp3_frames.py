@@ -0,0 +1,294 @@
+"""MPEG layer III frames, read and written without decoding.
+
+Every office clip and silence gap is stored in one constant-bitrate profile
+(``Mp3Profile``), so a combined office track is just their audio frames one
+after another behind a fresh Xing "Info" frame with a LAME tag. Nothing is
+re-encoded; see ``GenericDailyOfficeSerializer.get_single_track``.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from typing import NamedTuple
+
+# kbps by bitrate index, for MPEG-1 and for MPEG-2/2.5 layer III.
+BITRATES = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Hz by sample rate index, keyed by the two version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5).
+SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+INFO_FLAGS = 0x0F  # frame count, byte count, TOC and quality are present
+MONO = 3
+
+
+def _crc16_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC16_TABLE = _crc16_table()
+
+
+def crc16(data: bytes, crc: int = 0) -> int:
+    """The CRC-16 (ARC) LAME stores in its tag."""
+    for byte in data:
+        crc = (crc >> 8) ^ CRC16_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+class FrameHeader(NamedTuple):
+    version_bits: int
+    bitrate: int  # bits per second
+    sample_rate: int
+    padding: int
+    channel_mode: int
+    raw: bytes
+
+    @property
+    def mpeg1(self) -> bool:
+        return self.version_bits == 3
+
+    @property
+    def channels(self) -> int:
+        return 1 if self.channel_mode == MONO else 2
+
+    @property
+    def samples(self) -> int:
+        return 1152 if self.mpeg1 else 576
+
+    @property
+    def length(self) -> int:
+        return self.samples // 8 * self.bitrate // self.sample_rate + self.padding
+
+    @property
+    def side_info_size(self) -> int:
+        if self.mpeg1:
+            return 17 if self.channels == 1 else 32
+        return 9 if self.channels == 1 else 17
+
+    @classmethod
+    def parse(cls, data, offset: int = 0) -> FrameHeader | None:
+        """The layer III frame header at ``offset``, or None when there is none."""
+        if len(data) < offset + 4:
+            return None
+        b0, b1, b2, b3 = data[offset : offset + 4]
+        version_bits = (b1 >> 3) & 3
+        if b0 != 0xFF or b1 & 0xE0 != 0xE0 or version_bits == 1 or (b1 >> 1) & 3 != 1:
+            return None
+        bitrate_index = b2 >> 4
+        sample_rate_index = (b2 >> 2) & 3
+        if bitrate_index in (0, 15) or sample_rate_index == 3:
+            return None
+        return cls(
+            version_bits=version_bits,
+            bitrate=BITRATES[version_bits == 3][bitrate_index] * 1000,
+            sample_rate=SAMPLE_RATES[version_bits][sample_rate_index],
+            padding=(b2 >> 1) & 1,
+            channel_mode=b3 >> 6,
+            raw=bytes(data[offset : offset + 4]),
+        )
+
+
+class Mp3Profile(NamedTuple):
+    """The constant-bitrate format every clip is normalized to."""
+
+    sample_rate: int
+    bitrate: int  # bits per second
+    channels: int = 1
+
+    def matches(self, header: FrameHeader) -> bool:
+        return (header.sample_rate, header.bitrate, header.channels) == self
+
+    def header(self, padding: int = 0) -> FrameHeader:
+        """A frame header in this profile, without CRC protection."""
+        for version_bits, rates in SAMPLE_RATES.items():
+            if self.sample_rate in rates:
+                break
+        else:
+            raise ValueError(f"{self.sample_rate} Hz is not an MPEG sample rate")
+        kbps = BITRATES[version_bits == 3]
+        if self.bitrate // 1000 not in kbps[1:]:
+            raise ValueError(f"{self.bitrate} bps is not a layer III bitrate at {self.sample_rate} Hz")
+        channel_mode = MONO if self.channels == 1 else 0
+        raw = bytes(
+            (
+                0xFF,
+                0xE0 | version_bits << 3 | 1 << 1 | 1,
+                kbps.index(self.bitrate // 1000) << 4 | rates.index(self.sample_rate) << 2 | padding << 1,
+                channel_mode << 6,
+            )
+        )
+        return FrameHeader.parse(raw)
+
+    def paddings(self, count: int):
+        """Padding bits for ``count`` consecutive frames, as an encoder spreads them to keep the bitrate exact."""
+        header = self.header()
+        remainder = header.samples // 8 * self.bitrate % self.sample_rate
+        total = 0
+        for _ in range(count):
+            total += remainder
+            if total >= self.sample_rate:
+                total -= self.sample_rate
+                yield 1
+            else:
+                yield 0
+
+
+class Mp3Stream(NamedTuple):
+    """The audio frames of one file, with the encoder delay and padding from its LAME tag."""
+
+    frames: tuple[bytes, ...]
+    headers: tuple[FrameHeader, ...]
+    delay: int = 0
+    end_padding: int = 0
+
+    @property
+    def samples(self) -> int:
+        return sum(header.samples for header in self.headers)
+
+    def matches(self, profile: Mp3Profile) -> bool:
+        return bool(self.headers) and all(profile.matches(header) for header in self.headers)
+
+    @classmethod
+    def read(cls, path) -> Mp3Stream:
+        with open(path, "rb") as mp3_file:
+            return cls.parse(mp3_file.read())
+
+    @classmethod
+    def parse(cls, data: bytes) -> Mp3Stream:
+        offset = 0
+        if data[:3] == b"ID3" and len(data) >= 10:
+            size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | data[9] & 0x7F
+            offset = 10 + size + (10 if data[5] & 0x10 else 0)
+        end = len(data) - 128 if data[-128:-125] == b"TAG" else len(data)
+
+        frames = []
+        headers = []
+        delay = end_padding = 0
+        while offset < end:
+            header = FrameHeader.parse(data, offset)
+            if header is None or offset + header.length > end:
+                # Junk between frames: resync on the next header followed by another one.
+                offset = cls._resync(data, offset + 1, end)
+                if offset is None:
+                    break
+                continue
+            frame = data[offset : offset + header.length]
+            offset += header.length
+            if not frames:
+                tag = cls._read_info(frame, header)
+                if tag is not None:
+                    delay, end_padding = tag
+                    continue
+            frames.append(frame)
+            headers.append(header)
+        return cls(tuple(frames), tuple(headers), delay, end_padding)
+
+    @staticmethod
+    def _resync(data, offset, end):
+        while True:
+            offset = data.find(b"\xff", offset, end)
+            if offset < 0:
+                return None
+            header = FrameHeader.parse(data, offset)
+            if header is not None:
+                following = offset + header.length
+                if following == end or FrameHeader.parse(data, following) is not None:
+                    return offset
+            offset += 1
+
+    @staticmethod
+    def _read_info(frame, header):
+        """``(delay, padding)`` if ``frame`` is a Xing/Info or VBRI header rather than audio, else None."""
+        position = 4 + header.side_info_size
+        if frame[36:40] == b"VBRI":
+            return 0, 0
+        if frame[position : position + 4] not in (b"Xing", b"Info"):
+            return None
+        flags = struct.unpack(">I", frame[position + 4 : position + 8])[0]
+        position += 8 + 4 * bool(flags & 1) + 4 * bool(flags & 2) + 100 * bool(flags & 4) + 4 * bool(flags & 8)
+        lame = frame[position : position + 36]
+        if len(lame) < 24 or not lame[:4].isalpha():
+            return 0, 0
+        delay_padding = int.from_bytes(lame[21:24], "big")
+        return delay_padding >> 12, delay_padding & 0xFFF
+
+
+def silence(profile: Mp3Profile, seconds: float) -> Mp3Stream:
+    """``seconds`` of digital silence, rounded to whole frames.
+
+    A frame whose side information is all zero has no coded samples, so every
+    decoder outputs zeros for it; nothing needs to be encoded.
+    """
+    samples = profile.header().samples
+    count = max(1, round(seconds * profile.sample_rate / samples))
+    headers = tuple(profile.header(padding) for padding in profile.paddings(count))
+    frames = tuple(header.raw + bytes(header.length - 4) for header in headers)
+    return Mp3Stream(frames, headers)
+
+
+def info_frame(profile: Mp3Profile, stream: Mp3Stream) -> bytes:
+    """A Xing "Info" frame with a LAME tag describing ``stream`` as one CBR file.
+
+    The tag carries the byte and frame counts players need to seek, a linear
+    seek table, and the encoder delay and padding for gapless playback. The
+    music CRC is left at zero; players do not check it.
+    """
+    header = profile.header()
+    audio_bytes = sum(len(frame) for frame in stream.frames)
+    total_bytes = header.length + audio_bytes
+    toc = bytes(min(255, index * 256 // 100) for index in range(100))
+
+    # Flags, frame count (audio frames only), byte count (whole file), seek table, quality.
+    info = b"Info" + struct.pack(">III", INFO_FLAGS, len(stream.frames), total_bytes) + toc + struct.pack(">I", 0)
+    lame = bytearray(36)
+    lame[0:9] = b"LAME3.100"
+    lame[9] = 0x01  # tag revision 0, constant bitrate
+    lame[20] = min(255, profile.bitrate // 1000)
+    lame[21:24] = (min(stream.delay, 0xFFF) << 12 | min(stream.end_padding, 0xFFF)).to_bytes(3, "big")
+    lame[28:32] = struct.pack(">I", total_bytes)
+
+    frame = bytearray(header.raw + bytes(header.side_info_size) + info + bytes(lame))
+    if len(frame) > header.length:
+        raise ValueError(f"{profile.bitrate} bps frames are too small for an Info header")
+    frame[len(frame) - 2 : len(frame)] = struct.pack(">H", crc16(frame[: len(frame) - 2]))
+    return bytes(frame + bytes(header.length - len(frame)))
+
+
+def concatenate(streams) -> Mp3Stream:
+    """One stream playing ``streams`` back to back.
+
+    Every stream starts on a frame that needs no bit reservoir from the one
+    before it, so their frames can simply be joined. Only the first stream's
+    encoder delay and the last stream's padding are trimmed by players.
+    """
+    streams = list(streams)
+    frames = tuple(frame for stream in streams for frame in stream.frames)
+    headers = tuple(header for stream in streams for header in stream.headers)
+    delay = streams[0].delay if streams else 0
+    end_padding = streams[-1].end_padding if streams else 0
+    return Mp3Stream(frames, headers, delay, end_padding)
+
+
+def write(path, profile: Mp3Profile, stream: Mp3Stream) -> None:
+    """Write ``stream`` as a CBR file with an Info header, replacing ``path`` atomically."""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+    try:
+        with open(temp_path, "wb") as mp3_file:
+            mp3_file.write(info_frame(profile, stream))
+            for frame in stream.frames:
+                mp3_file.write(frame)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
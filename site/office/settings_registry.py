@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from django.db.models import Prefetch
+
+from website.generations import GenerationCachedSnapshot
+
+
+class SettingsSnapshot:
+    """Every ``Setting`` with its options, read once and never modified."""
+
+    def __init__(self, settings):
+        defaults = {}
+        options = {}
+        for setting in settings:
+            values = [option.value for option in setting.options]
+            if not values:
+                continue
+            defaults[setting.name] = values[0]
+            options[setting.name] = frozenset(values)
+        self.defaults = MappingProxyType(defaults)
+        self.options = MappingProxyType(options)
+        self.names = frozenset(defaults)
+
+
+class SettingsRegistry(GenerationCachedSnapshot):
+    """Process-level view of the office settings and their options.
+
+    Built with one query pair the first time it is needed and reused until a
+    ``Setting`` or ``SettingOption`` changes (see ``office/signals.py``).
+    """
+
+    GENERATION_KEY = "office:settings:generation"
+
+    @staticmethod
+    def load():
+        from office.models import Setting, SettingOption
+
+        return SettingsSnapshot(
+            Setting.objects.order_by("site", "setting_type", "order").prefetch_related(
+                Prefetch("settingoption_set", queryset=SettingOption.objects.order_by("order"), to_attr="options")
+            )
+        )
+
+    @classmethod
+    def defaults(cls) -> dict:
+        """The first option of every setting, as a fresh dict the caller may change."""
+        return dict(cls.current().defaults)
+
+    @classmethod
+    def names(cls) -> frozenset:
+        return cls.current().names
+
+    @classmethod
+    def is_valid_option(cls, name, value) -> bool:
+        return value in cls.current().options.get(name, ())
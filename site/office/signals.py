@@ -0,0 +1,103 @@
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from churchcal.models import CommemorationRank, Common, MassReading, Proper, Season
+from churchcal.signals import commemoration_models
+from office.api.response_cache import OfficeResponseCache
+from office.audio_clips import AudioClipLedger
+from office.collect_catalog import CollectCatalog
+from office.settings_registry import SettingsRegistry
+from office.models import (
+    AudioClip,
+    Collect,
+    CollectTag,
+    CollectTagCategory,
+    CollectType,
+    HolyDayOfficeDay,
+    OfficeDay,
+    Scripture,
+    Setting,
+    SettingOption,
+    StandardOfficeDay,
+    ThirtyDayPsalterDay,
+)
+from psalter.models import Psalm, PsalmVerse
+
+# Rows whose edits change rendered office JSON. The day's commemorations,
+# season and mass readings are embedded in it, so this also covers every
+# table MassLectionary is invalidated for (see ``churchcal/signals.py``).
+OFFICE_RESPONSE_SOURCES = (
+    CommemorationRank,
+    Proper,
+    Season,
+    MassReading,
+    Common,
+    Collect,
+    CollectTag,
+    Scripture,
+    OfficeDay,
+    StandardOfficeDay,
+    HolyDayOfficeDay,
+    ThirtyDayPsalterDay,
+    Setting,
+    SettingOption,
+    Psalm,
+    PsalmVerse,
+)
+
+
+def invalidate_office_responses(sender, **kwargs):
+    OfficeResponseCache.invalidate()
+
+
+def invalidate_settings_registry(sender, **kwargs):
+    SettingsRegistry.invalidate()
+
+
+def invalidate_collect_catalog(sender, **kwargs):
+    CollectCatalog.invalidate()
+
+
+def invalidate_grouped_collects(sender, **kwargs):
+    from office.api.views.resources import GroupedCollectsViewSet
+
+    cache.delete(GroupedCollectsViewSet.CACHE_KEY)
+
+
+def invalidate_audio_clip_ledger(sender, **kwargs):
+    AudioClipLedger.invalidate()
+
+
+def connect_signals():
+    for model in (*commemoration_models(), *OFFICE_RESPONSE_SOURCES):
+        post_save.connect(
+            invalidate_office_responses, sender=model, dispatch_uid=f"office_response_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_office_responses, sender=model, dispatch_uid=f"office_response_delete_{model.__name__}"
+        )
+    m2m_changed.connect(invalidate_office_responses, sender=Collect.tags.through, dispatch_uid="office_response_tags")
+    for model in (Setting, SettingOption):
+        post_save.connect(
+            invalidate_settings_registry, sender=model, dispatch_uid=f"settings_registry_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_settings_registry, sender=model, dispatch_uid=f"settings_registry_delete_{model.__name__}"
+        )
+    for model in (Collect, CollectTag):
+        post_save.connect(
+            invalidate_collect_catalog, sender=model, dispatch_uid=f"collect_catalog_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_collect_catalog, sender=model, dispatch_uid=f"collect_catalog_delete_{model.__name__}"
+        )
+    m2m_changed.connect(invalidate_collect_catalog, sender=Collect.tags.through, dispatch_uid="collect_catalog_tags")
+    for model in (Collect, CollectTag, CollectTagCategory, CollectType):
+        post_save.connect(
+            invalidate_grouped_collects, sender=model, dispatch_uid=f"grouped_collects_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_grouped_collects, sender=model, dispatch_uid=f"grouped_collects_delete_{model.__name__}"
+        )
+    m2m_changed.connect(invalidate_grouped_collects, sender=Collect.tags.through, dispatch_uid="grouped_collects_tags")
+    post_delete.connect(invalidate_audio_clip_ledger, sender=AudioClip, dispatch_uid="audio_clip_ledger_delete")
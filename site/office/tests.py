@@ -1,6 +1,39 @@
-from django.test import TestCase
+import datetime
+import os
+import threading
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
 
-from office.models import Scripture
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from icalendar import Calendar
+from rest_framework.request import Request
+
+from bible.sources import PassageNotFoundException
+from churchcal.calendar_feeds import ChurchCalendarFeedBuilder, FeedDay, OfficeDayDetails
+from churchcal.models import Common, MassReading, Proper, SanctoraleBasedCommemoration, Season, TemporaleCommemoration
+from office import audio_jobs, mp3_frames
+from office.audio_clips import AudioClipLedger
+
+from office.api import line as line_module
+from office.api.line import file_to_lines
+from office.api.prerender import prerender_office
+from office.api.response_cache import OfficeResponseCache
+from office.api.views.index import GenericDailyOfficeSerializer, MorningPrayerView, Settings
+from office.api.views.resources import GroupedCollectsViewSet
+from office.calendar_export import OfficeCalendarExport
+from office.collect_catalog import CatalogCollect, CollectCatalog, CollectCatalogSnapshot
+from office.management.commands import reimport_esv_scripture
+from office.models import AudioBuildJob, AudioClip, AudioTrack, Scripture
+from office.mp3_frames import Mp3Profile, Mp3Stream
+from office.settings_registry import SettingsRegistry, SettingsSnapshot
+from website.generations import GenerationCachedSnapshot
 
 
 class NormalizeBibleTranslationTests(TestCase):
@@ -20,3 +53,737 @@ class NormalizeBibleTranslationTests(TestCase):
 
     def test_unknown_translation_defaults_to_esv(self):
         self.assertEqual(Scripture.normalize_bible_translation("msg"), "esv")
+
+
+class OfficeResponseCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.date = datetime.date(2026, 7, 19)
+
+    def test_key_ignores_settings_and_extra_collect_order(self):
+        first = {
+            "language_style": "traditional",
+            "psalter": "60",
+            "extra_collects": [SimpleNamespace(pk=2), SimpleNamespace(pk=1)],
+        }
+        second = {
+            "extra_collects": [SimpleNamespace(pk=1), SimpleNamespace(pk=2)],
+            "psalter": "60",
+            "language_style": "traditional",
+        }
+
+        self.assertEqual(
+            OfficeResponseCache.key("morning_prayer", self.date, first),
+            OfficeResponseCache.key("morning_prayer", self.date, second),
+        )
+
+    def test_key_varies_by_office_date_and_settings(self):
+        settings = {"language_style": "contemporary", "extra_collects": []}
+        key = OfficeResponseCache.key("morning_prayer", self.date, settings)
+
+        self.assertNotEqual(key, OfficeResponseCache.key("evening_prayer", self.date, settings))
+        self.assertNotEqual(key, OfficeResponseCache.key("morning_prayer", datetime.date(2026, 7, 20), settings))
+        self.assertNotEqual(
+            key,
+            OfficeResponseCache.key(
+                "morning_prayer", self.date, {"language_style": "traditional", "extra_collects": []}
+            ),
+        )
+
+    def test_invalidate_moves_every_key_to_a_new_generation(self):
+        settings = {"extra_collects": []}
+        key = OfficeResponseCache.key("compline", self.date, settings)
+        OfficeResponseCache.set(key, {"modules": []})
+
+        OfficeResponseCache.invalidate()
+        new_key = OfficeResponseCache.key("compline", self.date, settings)
+
+        self.assertNotEqual(key, new_key)
+        self.assertIsNone(OfficeResponseCache.get(new_key))
+
+    def test_edits_to_every_commemoration_table_and_the_lectionary_invalidate(self):
+        for model in (TemporaleCommemoration, SanctoraleBasedCommemoration, Season, Proper, MassReading, Common):
+            with self.subTest(model=model.__name__):
+                generation = OfficeResponseCache.generation()
+                post_save.send(sender=model, instance=model(), created=False)
+                self.assertNotEqual(OfficeResponseCache.generation(), generation)
+
+    def test_dated_entries_last_until_their_day_is_over(self):
+        now = timezone.make_aware(datetime.datetime(2026, 7, 19, 3, 20))
+        with mock.patch("office.api.response_cache.timezone.now", return_value=now):
+            self.assertEqual(OfficeResponseCache.timeout(), OfficeResponseCache.TIMEOUT)
+            self.assertEqual(OfficeResponseCache.timeout(datetime.date(2026, 7, 18)), OfficeResponseCache.TIMEOUT)
+            self.assertEqual(
+                OfficeResponseCache.timeout(datetime.date(2026, 7, 22)), (4 * 24 + 20) * 60 * 60 + 40 * 60
+            )
+            self.assertEqual(OfficeResponseCache.timeout(datetime.date(2027, 1, 1)), OfficeResponseCache.MAX_TIMEOUT)
+
+    def test_if_none_match(self):
+        etag = OfficeResponseCache.etag("some-key")
+        factory = RequestFactory()
+
+        self.assertTrue(OfficeResponseCache.is_not_modified(factory.get("/", HTTP_IF_NONE_MATCH=etag), etag))
+        self.assertTrue(OfficeResponseCache.is_not_modified(factory.get("/", HTTP_IF_NONE_MATCH=f"W/{etag}"), etag))
+        self.assertFalse(OfficeResponseCache.is_not_modified(factory.get("/", HTTP_IF_NONE_MATCH='"other"'), etag))
+        self.assertFalse(OfficeResponseCache.is_not_modified(factory.get("/"), etag))
+
+
+class PrerenderOfficeTests(SimpleTestCase):
+    def test_renders_each_combination_through_the_office_view(self):
+        requests = []
+
+        def view(request, year, month, day):
+            requests.append((request.GET.dict(), (year, month, day)))
+            return SimpleNamespace(status_code=200 if request.GET.get("psalter") != "bad" else 500)
+
+        match = SimpleNamespace(func=view, args=(), kwargs={"year": 2026, "month": 7, "day": 19})
+        with mock.patch("office.api.prerender.resolve", return_value=match) as resolve:
+            rendered = prerender_office(
+                "morning_prayer_view", datetime.date(2026, 7, 19), [{}, {"psalter": "30"}, {"psalter": "bad"}]
+            )
+
+        resolve.assert_called_once_with("/api/v1/office/morning_prayer/2026-7-19")
+        self.assertEqual(rendered, 2)
+        self.assertEqual([params for params, _ in requests], [{}, {"psalter": "30"}, {"psalter": "bad"}])
+
+
+class FileToLinesTests(SimpleTestCase):
+    def setUp(self):
+        line_module._parsed_files.clear()
+
+    def test_each_file_is_parsed_once_per_language(self):
+        with mock.patch("office.api.line._parse_file", wraps=line_module._parse_file) as parse_file:
+            english = file_to_lines("chrysostom.csv")
+            self.assertEqual(file_to_lines("chrysostom"), english)
+            spanish = file_to_lines("chrysostom", "spanish")
+
+        self.assertEqual(parse_file.call_count, 2)
+        self.assertNotEqual(english, spanish)
+
+    def test_callers_get_independent_copies(self):
+        first = file_to_lines("chrysostom")
+        first[0]["content"] = "changed"
+
+        self.assertNotEqual(file_to_lines("chrysostom")[0]["content"], "changed")
+
+    def test_missing_file(self):
+        self.assertIsNone(file_to_lines("no_such_text"))
+
+
+class GenerationCachedSnapshotTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.loads = []
+
+        def snapshot_class(name):
+            return type(
+                name,
+                (GenerationCachedSnapshot,),
+                {"GENERATION_KEY": f"test:{name}", "load": classmethod(lambda cls: self.loads.append(name) or name)},
+            )
+
+        self.first, self.second = snapshot_class("first"), snapshot_class("second")
+
+    def test_each_subclass_keeps_and_invalidates_its_own_snapshot(self):
+        self.assertEqual((self.first.current(), self.second.current()), ("first", "second"))
+        self.first.invalidate()
+        self.assertEqual((self.first.current(), self.second.current()), ("first", "second"))
+
+        self.assertEqual(self.loads, ["first", "second", "first"])
+        self.assertIsNone(GenerationCachedSnapshot._loaded)
+
+
+def fake_setting(name, *values):
+    return SimpleNamespace(name=name, options=[SimpleNamespace(value=value) for value in values])
+
+
+class SettingsRegistryTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        SettingsRegistry._loaded = None
+        self.addCleanup(setattr, SettingsRegistry, "_loaded", None)
+        snapshot = SettingsSnapshot(
+            [fake_setting("psalter", "60", "30"), fake_setting("language_style", "contemporary", "traditional")]
+        )
+        patcher = mock.patch.object(SettingsRegistry, "load", return_value=snapshot)
+        self.load = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_defaults_names_and_options_come_from_one_load(self):
+        defaults = SettingsRegistry.defaults()
+        defaults["psalter"] = "30"
+
+        self.assertEqual(SettingsRegistry.defaults(), {"psalter": "60", "language_style": "contemporary"})
+        self.assertEqual(SettingsRegistry.names(), {"psalter", "language_style"})
+        self.assertTrue(SettingsRegistry.is_valid_option("psalter", "30"))
+        self.assertFalse(SettingsRegistry.is_valid_option("psalter", "90"))
+        self.assertFalse(SettingsRegistry.is_valid_option("unknown", "30"))
+        self.load.assert_called_once_with()
+
+    def test_invalid_values_fall_back_to_the_default(self):
+        request = Request(RequestFactory().get("/", {"psalter": "30", "language_style": "<script>", "unknown": "1"}))
+
+        self.assertEqual(Settings(request), {"psalter": "30", "language_style": "contemporary", "extra_collects": []})
+
+    def test_invalidate_reloads(self):
+        SettingsRegistry.names()
+        SettingsRegistry.invalidate()
+        SettingsRegistry.names()
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_settings_without_options_are_skipped(self):
+        self.assertEqual(SettingsSnapshot([fake_setting("empty")]).names, frozenset())
+
+
+def catalog_collect(pk, title, *tags):
+    return CatalogCollect(
+        pk, title, f"<p>{title} text Amen.</p>", f"<p>{title} thee Amen.</p>", None, None, None, tags
+    )
+
+
+class CollectCatalogTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        CollectCatalog._loaded = None
+        self.addCleanup(setattr, CollectCatalog, "_loaded", None)
+        snapshot = CollectCatalogSnapshot(
+            [
+                catalog_collect("1", "A Collect for Peace", "Morning Prayer", "Evening Prayer"),
+                catalog_collect("2", "A Collect for Grace", "Morning Prayer"),
+            ]
+        )
+        patcher = mock.patch.object(CollectCatalog, "load", return_value=snapshot)
+        self.load = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookup_by_tag_and_pk(self):
+        self.assertEqual(
+            [c.title for c in CollectCatalog.tagged("Morning Prayer")], ["A Collect for Peace", "A Collect for Grace"]
+        )
+        self.assertEqual([c.title for c in CollectCatalog.tagged("Evening Prayer")], ["A Collect for Peace"])
+        self.assertEqual(CollectCatalog.tagged("Compline"), ())
+        self.assertEqual([c.pk for c in CollectCatalog.get_many(["2", "missing", " 1"])], ["1", "2"])
+        self.load.assert_called_once_with()
+
+    def test_extra_collects_in_any_order_share_a_cache_key(self):
+        office_date = datetime.date(2024, 6, 2)
+        keys = {
+            OfficeResponseCache.key(
+                "morning_prayer", office_date, {"psalter": "60", "extra_collects": CollectCatalog.get_many(pks)}
+            )
+            for pks in (["1", "2"], ["2", "1"], ["2", "1", "2"])
+        }
+
+        self.assertEqual(len(keys), 1)
+        self.assertEqual([c.pk for c in CollectCatalog.get_many(["2", "1"])], ["1", "2"])
+
+    def test_texts_are_stripped_once(self):
+        collect = CollectCatalog.get_many(["1"])[0]
+        with mock.patch("office.collect_catalog._strip_tags", wraps=lambda text: text[3:-4]) as strip:
+            self.assertEqual(collect.text_no_tags, "A Collect for Peace text")
+            self.assertEqual(collect.text_no_tags, "A Collect for Peace text")
+        strip.assert_called_once()
+
+    def test_invalidate_reloads(self):
+        CollectCatalog.tagged("Morning Prayer")
+        CollectCatalog.invalidate()
+        CollectCatalog.tagged("Morning Prayer")
+
+        self.assertEqual(self.load.call_count, 2)
+
+
+def fake_tag(pk, key, category):
+    return SimpleNamespace(pk=pk, key=key, collect_tag_category=SimpleNamespace(key=category))
+
+
+def fake_collect(title, *tags):
+    return SimpleNamespace(title=title, tags=SimpleNamespace(all=lambda: tags))
+
+
+class GroupedCollectsTests(SimpleTestCase):
+    def test_group(self):
+        occasional = fake_tag(1, "occasional", "source")
+        year = fake_tag(2, "year", "source")
+        other = fake_tag(3, "other", "source")
+        church = fake_tag(4, "church", "theme")
+        advent = fake_tag(5, "advent", "season")
+        sunday = fake_tag(6, "sunday", "commemoration_type")
+        martyr = fake_tag(7, "martyr", "commemoration_type")
+        empty = fake_tag(8, "world", "theme")
+        collects = [
+            fake_collect("For the Church", occasional, church),
+            fake_collect("Advent I", year, advent, sunday),
+            fake_collect("A Martyr", year, martyr),
+            fake_collect("For Unity", occasional, church),
+        ]
+
+        sources = GroupedCollectsViewSet.group(
+            collects, [occasional, year, other, church, advent, sunday, martyr, empty]
+        )
+
+        self.assertEqual(sources, [occasional, year, other])
+        self.assertEqual([subcategory.key for subcategory in occasional.subcategories], ["church"])
+        self.assertEqual([c.title for c in church.collects], ["For the Church", "For Unity"])
+        self.assertEqual([subcategory.key for subcategory in year.subcategories], ["advent", "martyr"])
+        self.assertEqual([c.title for c in martyr.collects], ["A Martyr"])
+        self.assertFalse(hasattr(other, "subcategories"))
+
+
+class OfficeCalendarExportTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        details = OfficeDayDetails("1", "1, 2", "Genesis 1", "John 1", "3", "4, 5", "Romans 1", "Luke 1")
+        self.feed_days = {
+            year: (
+                FeedDay(
+                    event_date=datetime.date(year + 1, 3, 25),
+                    major_feast_name="The Annunciation",
+                    major_or_minor_feast_name="The Annunciation",
+                    primary_name="The Annunciation",
+                    commemorations=("The Annunciation",),
+                    fast_day=False,
+                    feast_day=True,
+                    office_details=details,
+                    mass_reading_citations=("Isaiah 7:10-14",),
+                ),
+            )
+            for year in (2025, 2026)
+        }
+        patchers = [
+            mock.patch.object(
+                ChurchCalendarFeedBuilder,
+                "feed_year",
+                autospec=True,
+                side_effect=lambda builder, year: SimpleNamespace(feed_days=self.feed_days[year]),
+            ),
+            mock.patch("churchcal.calendar_feeds.get_feed_source_fingerprint", return_value="abc"),
+            mock.patch("office.calendar_export.FIRST_BEGINNING_YEAR", 2025),
+            mock.patch("office.calendar_export.LAST_BEGINNING_YEAR", 2026),
+        ]
+        self.feed_year = patchers[0].start()
+        for patcher in patchers[1:]:
+            patcher.start()
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+    def test_export_is_compiled_once_and_lists_every_year(self):
+        path = OfficeCalendarExport.ensure_current(years=[2025, 2026])
+        self.assertEqual(OfficeCalendarExport.ensure_current(years=[2025, 2026]), path)
+
+        self.assertEqual(self.feed_year.call_count, 2)
+        events = [
+            component for component in Calendar.from_ical(path.read_bytes()).walk() if component.name == "VEVENT"
+        ]
+        self.assertEqual(
+            [event.decoded("dtstart") for event in events], [datetime.date(2026, 3, 25), datetime.date(2027, 3, 25)]
+        )
+        description = str(events[0].get("description"))
+        self.assertIn("MORNING PRAYER (or year 1)", description)
+        self.assertIn("EUCHARIST\nIsaiah 7:10-14", description)
+        self.assertIn("https://www.dailyoffice2019.com/compline/2026-3-25/", description)
+
+    def test_forced_build_rewrites_only_when_sources_change(self):
+        OfficeCalendarExport.ensure_current(years=[2025])
+        OfficeCalendarExport.ensure_current(years=[2025], force=True)
+        self.assertEqual(self.feed_year.call_count, 1)
+
+        with mock.patch("churchcal.calendar_feeds.get_feed_source_fingerprint", return_value="changed"):
+            OfficeCalendarExport.ensure_current(years=[2025], force=True)
+
+        self.assertEqual(self.feed_year.call_count, 2)
+
+    def test_stale_file_is_served_while_it_is_checked_in_the_background(self):
+        today = datetime.date(2026, 7, 19)
+        OfficeCalendarExport.ensure_current(years=[2025, 2026], today=today - datetime.timedelta(days=1))
+
+        with mock.patch.object(OfficeCalendarExport, "refresh_in_background") as refresh:
+            with mock.patch("churchcal.calendar_feeds.get_feed_source_fingerprint") as fingerprint:
+                self.assertEqual(OfficeCalendarExport.get_path(today=today), OfficeCalendarExport.path())
+            refresh.assert_called_once_with(today)
+            fingerprint.assert_not_called()
+
+            OfficeCalendarExport.ensure_current(years=[2025, 2026], today=today)
+            refresh.reset_mock()
+            OfficeCalendarExport.get_path(today=today)
+            refresh.assert_not_called()
+
+        self.assertEqual(self.feed_year.call_count, 2)
+
+    def test_missing_file_is_built_by_the_request(self):
+        path = OfficeCalendarExport.get_path(today=datetime.date(2026, 7, 19))
+
+        self.assertTrue(path.exists())
+        self.assertEqual(self.feed_year.call_count, 2)
+
+
+def spoken_module(name, *lines):
+    return SimpleNamespace(
+        json={
+            "name": name,
+            "lines": [
+                {"id": f"{name}_{index}", "line_type": line_type, "content": content}
+                for index, (line_type, content) in enumerate(lines)
+            ],
+        }
+    )
+
+
+@override_settings(SITE_ADDRESS="https://example.com")
+class OfficeAudioSynthesisTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.synthesized = []
+        self.threads = set()
+        patchers = [
+            mock.patch.object(GenericDailyOfficeSerializer, "normalize_tts_text", side_effect=lambda text: text),
+            mock.patch.object(GenericDailyOfficeSerializer, "synthesize_speech", side_effect=self.fake_synthesize),
+            mock.patch.object(GenericDailyOfficeSerializer, "record_audio_clip"),
+            mock.patch.object(GenericDailyOfficeSerializer, "get_single_track", return_value=[]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fake_synthesize(self, voice, text, file_path):
+        self.synthesized.append(text)
+        self.threads.add(threading.current_thread().name)
+        if text == "Fails.":
+            raise RuntimeError("provider error")
+        Path(file_path).write_bytes(b"mp3")
+
+    def get_audio(self, *modules, context=None):
+        office = SimpleNamespace(settings={}, get_modules=lambda: modules)
+        return GenericDailyOfficeSerializer(context=context or {}).get_audio(office)
+
+    def test_missing_clips_are_synthesized_once_on_the_pool(self):
+        audio = self.get_audio(
+            spoken_module("Opening", ("leader", "O Lord, open our lips;"), ("congregation", "And our mouth.")),
+            spoken_module("Closing", ("leader", "Let us bless the Lord."), ("congregation", "And our mouth.")),
+        )
+
+        self.assertCountEqual(self.synthesized, ["O Lord, open our lips;", "And our mouth.", "Let us bless the Lord."])
+        self.assertTrue(all(name.startswith("tts") for name in self.threads))
+        self.assertEqual(
+            [track["text"] for track in audio["tracks"]],
+            [
+                "O Lord, open our lips;",
+                "And our mouth.",
+                "Let us bless the Lord.",
+                "And our mouth.",
+            ],
+        )
+
+        self.synthesized.clear()
+        self.get_audio(spoken_module("Opening", ("leader", "O Lord, open our lips;")))
+        self.assertEqual(self.synthesized, [])
+
+    def test_failed_clip_is_skipped_and_not_retried(self):
+        audio = self.get_audio(
+            spoken_module("Opening", ("leader", "Fails."), ("congregation", "Thanks be to God.")),
+        )
+
+        self.assertCountEqual(self.synthesized, ["Fails.", "Thanks be to God."])
+        self.assertEqual([track["text"] for track in audio["tracks"]], ["Thanks be to God."])
+
+    def test_progress_is_reported(self):
+        progress = mock.Mock()
+        self.get_audio(
+            spoken_module("Opening", ("leader", "O Lord, open our lips;"), ("congregation", "And our mouth.")),
+            context={"audio_progress": progress},
+        )
+
+        self.assertEqual(progress.call_args_list, [mock.call(0, 2), mock.call(1, 2), mock.call(2, 2)])
+
+
+class AudioClipLedgerTests(SimpleTestCase):
+    def setUp(self):
+        cache.delete(AudioClipLedger.GENERATION_KEY)
+        AudioClipLedger._loaded = None
+        patcher = mock.patch.object(AudioClip, "objects")
+        self.clips = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clips.filter.return_value.values_list.return_value = ["a"]
+
+    def flush(self, *keys):
+        ledger = AudioClipLedger()
+        for key in keys:
+            ledger.add(key, f"/missing/{key}.mp3", filename=f"{key}.mp3", voice="ash")
+        return ledger.flush()
+
+    def test_missing_rows_are_created_in_one_batch(self):
+        self.assertEqual(self.flush("a", "b", "c", "b"), 2)
+
+        self.clips.filter.assert_called_once_with(key__in=["a", "b", "c"])
+        created, kwargs = self.clips.bulk_create.call_args
+        self.assertEqual([clip.key for clip in created[0]], ["b", "c"])
+        self.assertEqual(kwargs, {"ignore_conflicts": True})
+
+    def test_known_keys_cost_no_query(self):
+        self.flush("a", "b")
+        self.clips.reset_mock()
+
+        self.assertEqual(self.flush("a", "b"), 0)
+        self.clips.filter.assert_not_called()
+
+    def test_invalidate_forgets_known_keys(self):
+        self.flush("a", "b")
+        AudioClipLedger.invalidate()
+        self.clips.reset_mock()
+
+        self.flush("a", "b")
+        self.clips.filter.assert_called_once()
+
+
+@override_settings(SITE_ADDRESS="https://example.com", BASE_DIR="")
+class OfficeSingleTrackTests(SimpleTestCase):
+    PROFILE = Mp3Profile(sample_rate=24000, bitrate=160000)
+
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.media_root = Path(temp_dir.name)
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.clips = []
+        for index, seconds in enumerate((1.152, 2.304, 0.576)):
+            clip = self.media_root / f"clip{index}.mp3"
+            stream = mp3_frames.silence(self.PROFILE, seconds)
+            mp3_frames.write(clip, self.PROFILE, stream._replace(delay=576 if index == 0 else 0))
+            self.clips.append(str(clip))
+
+        self.tracks = mock.patch.object(AudioTrack, "objects")
+        patchers = [
+            mock.patch("office.api.views.index.TTS_CLIP_PROFILE", self.PROFILE),
+            mock.patch("office.api.views.index.TTS_GAP_GROUP", 0.48),
+            mock.patch("office.api.views.index.TTS_GAP_MODULE", 0.96),
+            mock.patch.object(GenericDailyOfficeSerializer, "record_audio_clip"),
+            mock.patch("office.api.views.index.subprocess.run", side_effect=AssertionError("re-encoded")),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_single_track(self):
+        return GenericDailyOfficeSerializer.get_single_track(
+            [
+                {"path": self.clips[0], "module": "Opening", "line_id": "a"},
+                {"path": self.clips[1], "module": "Opening", "line_id": "b"},
+                {"path": self.clips[2], "module": "Closing", "line_id": "c"},
+            ]
+        )
+
+    def test_track_is_joined_from_frames_and_recorded(self):
+        with self.tracks as tracks:
+            tracks.filter.return_value.first.return_value = None
+            _, path, track_list, short_track_list = self.get_single_track()
+
+        # 1.152s (less 576 samples of encoder delay), 0.48s gap, 2.304s, 0.96s gap, 0.576s.
+        self.assertEqual(track_list, [{"name": "Opening", "start_time": 0}, {"name": "Closing", "start_time": 4.872}])
+        self.assertEqual([entry["start_time"] for entry in short_track_list], [0, 1.608, 4.872])
+        combined = Mp3Stream.read(self.media_root / Path(path).parent.name / Path(path).name)
+        self.assertTrue(combined.matches(self.PROFILE))
+        self.assertEqual((combined.samples, combined.delay), (131328, 576))
+        self.assertEqual(tracks.update_or_create.call_args.kwargs["defaults"]["duration"], 5.448)
+
+    def test_built_track_is_answered_from_its_record(self):
+        with self.tracks as tracks:
+            tracks.filter.return_value.first.return_value = None
+            self.get_single_track()
+
+        record = AudioTrack(track_list=[{"name": "Opening", "start_time": 0}], short_track_list=[])
+        with self.tracks as tracks, mock.patch.object(Mp3Stream, "read") as read:
+            tracks.filter.return_value.first.return_value = record
+            _, _, track_list, _ = self.get_single_track()
+
+        read.assert_not_called()
+        self.assertEqual(track_list, record.track_list)
+
+
+class AudioBuildJobTests(TestCase):
+    AUDIO = {"tracks": [], "headings": [], "single_track": ["https://example.com/track.mp3", "/uploads/track.mp3"]}
+
+    def enqueue(self):
+        return audio_jobs.enqueue(
+            "morning_prayer",
+            datetime.date(2026, 7, 19),
+            {"bible_translation": "esv", "display_language": "english", "extra_collects": []},
+            "/api/v1/office/morning_prayer/2026-7-19",
+            {"bible_translation": "esv", "include_audio_links": "true"},
+        )
+
+    def test_requests_for_the_same_audio_share_a_job(self):
+        self.assertEqual(self.enqueue().pk, self.enqueue().pk)
+        self.assertEqual(AudioBuildJob.objects.count(), 1)
+
+    def test_job_is_built_once_and_keeps_the_audio(self):
+        job = self.enqueue()
+        self.assertEqual(audio_jobs.audio_payload(job)["audio"], audio_jobs.PENDING_AUDIO)
+
+        with mock.patch.object(audio_jobs, "build_audio", return_value=self.AUDIO) as build_audio:
+            self.assertEqual(audio_jobs.run_pending(), 1)
+            self.assertEqual(audio_jobs.run_pending(), 0)
+
+        build_audio.assert_called_once()
+        job.refresh_from_db()
+        self.assertEqual(job.status, AudioBuildJob.READY)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(audio_jobs.audio_payload(job), {"audio": self.AUDIO, "job": audio_jobs.describe(job)})
+
+    def test_failed_build_is_recorded(self):
+        job = self.enqueue()
+        with mock.patch.object(audio_jobs, "build_audio", side_effect=RuntimeError("ffmpeg failed")):
+            audio_jobs.run_pending()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, AudioBuildJob.FAILED)
+        self.assertEqual(job.error, "ffmpeg failed")
+        # Not retried straight away.
+        self.assertEqual(self.enqueue().status, AudioBuildJob.FAILED)
+
+    def test_ready_job_is_rebuilt_when_its_track_is_deleted(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        track = Path(temp_dir.name, "track.mp3")
+        track.write_bytes(b"mp3")
+        job = self.enqueue()
+        AudioBuildJob.objects.filter(pk=job.pk).update(status=AudioBuildJob.READY, attempts=1, result=self.AUDIO)
+
+        with override_settings(MEDIA_ROOT=temp_dir.name, MEDIA_URL="/uploads/"):
+            self.assertEqual(self.enqueue().status, AudioBuildJob.READY)
+            track.unlink()
+            job = self.enqueue()
+
+        self.assertEqual((job.status, job.attempts, job.result), (AudioBuildJob.PENDING, 0, None))
+        job.refresh_from_db()
+        self.assertEqual(job.status, AudioBuildJob.PENDING)
+
+    def test_job_that_gave_up_is_final(self):
+        job = self.enqueue()
+        AudioBuildJob.objects.filter(pk=job.pk).update(
+            status=AudioBuildJob.FAILED, attempts=audio_jobs.JOB_MAX_ATTEMPTS, updated=datetime.datetime(2020, 1, 1)
+        )
+        view = MorningPrayerView()
+        request = Request(RequestFactory().get("/api/v1/office/morning_prayer/2026-7-19"))
+        office_settings = {"bible_translation": "esv", "display_language": "english", "extra_collects": []}
+
+        with (
+            mock.patch.object(audio_jobs, "enqueue", return_value=AudioBuildJob.objects.get(pk=job.pk)),
+            mock.patch.object(view, "get_office_data", return_value={"modules": []}),
+        ):
+            response = view.get_audio(request, datetime.date(2026, 7, 19), office_settings)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["job"]["status"], AudioBuildJob.FAILED)
+        self.assertEqual(response.data["audio"], audio_jobs.PENDING_AUDIO)
+
+    def test_audio_response_keeps_the_office_modules(self):
+        modules = [{"name": "Opening", "lines": [{"content": "O Lord, open our lips;"}]}]
+        view = MorningPrayerView()
+        request = Request(RequestFactory().get("/api/v1/office/morning_prayer/2026-7-19"))
+        office_settings = {"bible_translation": "esv", "display_language": "english", "extra_collects": []}
+
+        with (
+            mock.patch.object(view, "get_office_data", return_value={"modules": modules}),
+            mock.patch.object(audio_jobs.AudioJobWorkers, "ensure_started"),
+        ):
+            response = view.get_audio(request, datetime.date(2026, 7, 19), office_settings)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["modules"], modules)
+        self.assertEqual(response.data["audio"], audio_jobs.PENDING_AUDIO)
+
+
+class CleanupFullAudioFilesTests(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.track_path = Path(temp_dir.name, "openai", "combined.mp3")
+        self.track_path.parent.mkdir()
+        # Joined frames behind an Info header: no ID3 tag for the ffmpeg check to find.
+        profile = Mp3Profile(sample_rate=24000, bitrate=160000)
+        mp3_frames.write(self.track_path, profile, mp3_frames.silence(profile, 1))
+        os.utime(self.track_path, (0, 0))
+        AudioTrack.objects.create(key="combined", filename="openai/combined.mp3", duration=1)
+
+    def test_combined_tracks_are_found_through_their_rows(self):
+        call_command("cleanup_full_audio_files", stdout=StringIO())
+        self.assertTrue(self.track_path.exists())
+
+        call_command("cleanup_full_audio_files", "--execute", stdout=StringIO())
+        self.assertFalse(self.track_path.exists())
+        self.assertFalse(AudioTrack.objects.exists())
+
+
+class FakeESVAdapter:
+    def __init__(self, passage, version, include_references=False):
+        self.book = passage.split()[0]
+        self.passage = passage
+
+    @property
+    def html(self):
+        if self.book == "Baruch":
+            raise PassageNotFoundException(f"No verses found for passage: {self.passage}")
+        return f"<p>{self.passage}</p>"
+
+
+class ReimportESVScriptureTests(SimpleTestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch.object(reimport_esv_scripture, "ESVXMLAdapter", FakeESVAdapter),
+            mock.patch.object(Scripture, "objects"),
+            mock.patch.object(OfficeResponseCache, "invalidate"),
+            mock.patch.object(reimport_esv_scripture.MassLectionary, "invalidate"),
+        ]
+        self.mocks = [patcher.start() for patcher in patchers]
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+    def test_passages_are_rendered_by_book_in_worker_processes(self):
+        rows = [
+            SimpleNamespace(passage="John 1:1-5", esv="-", updated=None),
+            SimpleNamespace(passage="John 1:1-5", esv="-", updated=None),
+            SimpleNamespace(passage="John 3:16", esv="<p>John 3:16</p>", updated=None),
+            SimpleNamespace(passage="Genesis 1:1", esv="", updated=None),
+            SimpleNamespace(passage="Baruch 1:1", esv="old", updated=None),
+            SimpleNamespace(passage=" ", esv="", updated=None),
+        ]
+        output = StringIO()
+        command = reimport_esv_scripture.Command(stdout=output)
+        command.handle_parallel(rows, dry_run=False, include_references=False, workers=2, batch_size=500)
+
+        self.assertEqual(
+            [row.esv for row in rows],
+            ["<p>John 1:1-5</p>"] * 2 + ["<p>John 3:16</p>", "<p>Genesis 1:1</p>", "old", ""],
+        )
+        (updated, fields), kwargs = Scripture.objects.bulk_update.call_args
+        self.assertCountEqual(updated, [rows[0], rows[1], rows[3]])
+        self.assertEqual(fields, ["esv", "updated"])
+        OfficeResponseCache.invalidate.assert_called_once()
+        self.assertIn("Errors: 1", output.getvalue())
+        self.assertIn("Baruch 1:1: No verses found", output.getvalue())
+
+    def test_a_failing_passage_does_not_stop_its_book(self):
+        self.assertEqual(
+            reimport_esv_scripture.render_book_passages(["Baruch 1:1", "Baruch 2:1"]),
+            [
+                ("Baruch 1:1", None, "No verses found for passage: Baruch 1:1"),
+                ("Baruch 2:1", None, "No verses found for passage: Baruch 2:1"),
+            ],
+        )
@@ -1,20 +1,18 @@
-from datetime import date
-
 from bs4 import BeautifulSoup
 from django.core import serializers
 from django.db.models import Prefetch
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from django.http.response import HttpResponseRedirect
 from django.shortcuts import render
 from django.template.loader import render_to_string
 from django.templatetags.static import static
 from django.urls import reverse
 from docx.shared import RGBColor
-from icalendar import Calendar, Event
 from meta.views import Meta
 
 from churchcal.calculations import ChurchYear
 from churchcal.models import Season, SanctoraleCommemoration, MassReading
+from office.calendar_export import OfficeCalendarExport
 from office.compline import Compline
 from office.evening_prayer import EveningPrayer
 from office.family_close_of_day import FamilyCloseOfDay
@@ -24,7 +22,6 @@ from office.family_morning import FamilyMorning
 from office.midday_prayer import MiddayPrayer
 from office.models import AboutItem, UpdateNotice, StandardOfficeDay, HolyDayOfficeDay, LectionaryItem
 from office.morning_prayer import MorningPrayer
-from office.offices import Office
 from office.utils import passage_to_citation, testament_to_closing, testament_to_closing_response
 from psalter.models import PsalmTopic, Psalm, PsalmVerse, PsalmTopicPsalm
 from psalter.utils import get_psalms
@@ -367,114 +364,12 @@ def privacy_policy(request):
 
 
 def calendar(request):
-    cal = Calendar()
-    cal.add("prodid", "-//Daily Office//mxm.dk//")
-    cal.add("version", "2.0")
-
-    years = range(FIRST_BEGINNING_YEAR, LAST_BEGINNING_YEAR + 1)
-    for year in years:
-        year = ChurchYear(year)
-        for datestring, calendardate in year.dates.items():
-            office = Office(datestring)
-            event = Event()
-            event.add("SUMMARY", calendardate.primary.name)
-            event.add("DTSTART", date(calendardate.date.year, calendardate.date.month, calendardate.date.day))
-            event.add(
-                "URL",
-                "https://www.dailyoffice2019.com/morning_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                ),
-            )
-            event.add(
-                "LOCATION",
-                "https://www.dailyoffice2019.com/morning_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                ),
-            )
-            fast_day = calendardate.fast_day != calendardate.FAST_NONE
-            feast_day = calendardate.primary.rank.precedence_rank <= 4
-            description_lines = []
-            for feast in calendardate.all:
-                description_lines.append(feast.name)
-
-            if fast_day:
-                description_lines.append("")
-                description_lines.append("FAST DAY")
-
-            if feast_day:
-                description_lines.append("")
-                description_lines.append("SUNDAY OR MAJOR HOLY DAY")
-
-            description_lines.append("")
-            description_lines.append("MORNING PRAYER (or year 1)")
-            description_lines.append("Psalms {} (30 day cycle)".format(office.thirty_day_psalter_day.mp_psalms))
-            description_lines.append("Psalms {} (60 day cycle)".format(office.office_readings.mp_psalms))
-            description_lines.append(office.office_readings.mp_reading_1)
-            description_lines.append(office.office_readings.mp_reading_2)
-            description_lines.append("")
-            description_lines.append("EVENING PRAYER (or year 2)")
-            description_lines.append("Psalms {} (30 day cycle)".format(office.thirty_day_psalter_day.ep_psalms))
-            description_lines.append("Psalms {} (60 day cycle)".format(office.office_readings.ep_psalms))
-            description_lines.append(office.office_readings.ep_reading_1)
-            description_lines.append(office.office_readings.ep_reading_2)
-
-            if calendardate.primary.rank.precedence_rank <= 4:
-                description_lines.append("")
-                description_lines.append("EUCHARIST")
-                for reading in calendardate.mass_readings:
-                    description_lines.append(reading.long_citation)
-
-            description_lines.append("")
-            description_lines.append(
-                "Morning Prayer: https://www.dailyoffice2019.com/morning_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-            description_lines.append(
-                "Midday Prayer: https://www.dailyoffice2019.com/midday_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-            description_lines.append(
-                "Evening Prayer: https://www.dailyoffice2019.com/evening_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-            description_lines.append(
-                "Compline: https://www.dailyoffice2019.com/compline/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-
-            description_lines.append(
-                "Family Prayer in the Morning: https://www.dailyoffice2019.com/family/morning_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-            description_lines.append(
-                "Family Prayer at Midday: https://www.dailyoffice2019.com/family/midday_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-            description_lines.append(
-                "Family Prayer in the Early Evening: https://www.dailyoffice2019.com/family/early_evening_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-            description_lines.append(
-                "Family Prayer at the Close of Day: https://www.dailyoffice2019.com/family/close_of_day_prayer/{}-{}-{}/".format(
-                    calendardate.date.year, calendardate.date.month, calendardate.date.day
-                )
-            )
-
-            event.add("DESCRIPTION", "\n".join(description_lines))
-
-            cal.add_component(event)
-
-    res = cal.to_ical()
-    response = HttpResponse(res, content_type="text/calendar")
-    response["Content-Disposition"] = "attachment; filename=dailyoffice.ics"
-    return HttpResponse(res)
+    return FileResponse(
+        open(OfficeCalendarExport.get_path(), "rb"),
+        as_attachment=True,
+        filename=OfficeCalendarExport.FILENAME,
+        content_type="text/calendar",
+    )
 
 
 def mass_readings_data(year=None, readings=None):
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class PsalterConfig(AppConfig):
     name = "psalter"
+
+    def ready(self):
+        from psalter.signals import connect_signals
+
+        connect_signals()
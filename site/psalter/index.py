@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from psalter.models import PsalmVerse
+from website.generations import GenerationCachedSnapshot
+
+
+def psalter_generation():
+    """Token that changes whenever a psalm or verse is edited (see ``psalter/signals.py``)."""
+    return PsalterIndex.generation()
+
+
+def invalidate_psalter():
+    PsalterIndex.invalidate()
+
+
+class PsalmHeader(NamedTuple):
+    number: int
+    latin_title: str | None
+
+
+class IndexedVerse(NamedTuple):
+    """One verse with every language variant; attribute-compatible with ``PsalmVerse``."""
+
+    psalm: PsalmHeader
+    number: int
+    first_half: str
+    second_half: str
+    first_half_tle: str | None
+    second_half_tle: str | None
+    first_half_spanish: str | None
+    second_half_spanish: str | None
+    first_half_chinese: str | None
+    second_half_chinese: str | None
+
+
+VERSE_FIELDS = IndexedVerse._fields[2:]
+
+
+class PsalterIndex(GenerationCachedSnapshot):
+    """The whole psalter in memory: per psalm, its verses in order plus their numbers for bisecting.
+
+    The psalter is small (about 2,500 verses) and changes rarely, so one query
+    builds it and rendering never touches the database afterwards.
+    """
+
+    GENERATION_KEY = "psalter:generation"
+
+    def __init__(self, verses: list[IndexedVerse]):
+        by_psalm = {}
+        for verse in sorted(verses, key=lambda verse: (verse.psalm.number, verse.number)):
+            by_psalm.setdefault(verse.psalm.number, []).append(verse)
+        self._verses = {psalm: tuple(psalm_verses) for psalm, psalm_verses in by_psalm.items()}
+        self._numbers = {
+            psalm: tuple(verse.number for verse in psalm_verses) for psalm, psalm_verses in by_psalm.items()
+        }
+
+    @classmethod
+    def load(cls) -> PsalterIndex:
+        headers = {}
+        verses = []
+        for row in PsalmVerse.objects.values_list("psalm__number", "psalm__latin_title", "number", *VERSE_FIELDS):
+            psalm_number, latin_title, *verse = row
+            header = headers.setdefault(psalm_number, PsalmHeader(psalm_number, latin_title))
+            verses.append(IndexedVerse(header, *verse))
+        return cls(verses)
+
+    def verses(self, psalm: int, start: int | None = None, end: int | None = None) -> tuple[IndexedVerse, ...]:
+        psalm_verses = self._verses.get(psalm, ())
+        if start is None:
+            return psalm_verses
+        numbers = self._numbers[psalm] if psalm_verses else ()
+        return psalm_verses[bisect_left(numbers, start) : bisect_right(numbers, end)]
+
+
+def get_psalter_index() -> PsalterIndex:
+    """The process's psalter index, reloaded when the psalter generation moves on."""
+    return PsalterIndex.current()
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+
+from psalter.models import Psalm, PsalmVerse
+from psalter.index import invalidate_psalter
+
+
+def invalidate_rendered_psalms(sender, **kwargs):
+    invalidate_psalter()
+
+
+def connect_signals():
+    for model in (Psalm, PsalmVerse):
+        post_save.connect(invalidate_rendered_psalms, sender=model, dispatch_uid=f"psalter_save_{model.__name__}")
+        post_delete.connect(invalidate_rendered_psalms, sender=model, dispatch_uid=f"psalter_delete_{model.__name__}")
@@ -1,3 +1,79 @@
-from django.test import TestCase
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from psalter.index import IndexedVerse, PsalterIndex, invalidate_psalter
+from psalter.utils import _render_psalms, get_psalms, normalize_citations
+
+
+def fake_verses(psalm, numbers):
+    psalm = SimpleNamespace(number=psalm, latin_title=f"Latin {psalm}")
+    return [
+        SimpleNamespace(
+            psalm=psalm,
+            number=number,
+            first_half=f"first {number}",
+            second_half=f"second {number}",
+            first_half_tle=f"thou first {number}",
+            second_half_tle=f"thou second {number}",
+            first_half_spanish=None,
+            second_half_spanish=None,
+            first_half_chinese=None,
+            second_half_chinese=None,
+        )
+        for number in numbers
+    ]
+
+
+class GetPsalmsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        _render_psalms.cache_clear()
+        self.verses = {"119:105-112": fake_verses(119, range(105, 113)), "121": fake_verses(121, range(1, 9))}
+        patcher = mock.patch("psalter.utils.get_verses", side_effect=lambda citations: self.verses)
+        self.get_verses = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_normalize_citations(self):
+        self.assertEqual(normalize_citations("119:105-112,121"), ["119:105-112", "121"])
+        self.assertEqual(normalize_citations("31:1-6 or 91"), ["31:1-6", "91"])
+
+    def test_citations_are_fetched_together_and_memoized(self):
+        html = get_psalms("119:105-112,121")
+        self.assertEqual(get_psalms("119:105-112, 121"), html)
+
+        self.get_verses.assert_called_once_with(("119:105-112", "121"))
+        self.assertIn("Psalm 121", html)
+        self.assertIn("thou", get_psalms("119:105-112,121", language_style="traditional"))
+
+    def test_api_lines_are_copies(self):
+        lines = get_psalms("119:105-112,121", api=True)
+        self.assertEqual(lines[0]["content"], "Psalm 119:105-112")
+        lines[0]["content"] = "changed"
+
+        self.assertEqual(get_psalms("119:105-112,121", api=True)[0]["content"], "Psalm 119:105-112")
+        self.assertEqual(self.get_verses.call_count, 1)
+
+    def test_invalidation_renders_again(self):
+        get_psalms("121")
+        invalidate_psalter()
+        get_psalms("121")
+
+        self.assertEqual(self.get_verses.call_count, 2)
+
+
+class PsalterIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = PsalterIndex(
+            [IndexedVerse(verse.psalm, verse.number, *[None] * 8) for verse in fake_verses(31, [3, 1, 2, 5, 6])]
+        )
+
+    def test_whole_psalm_in_verse_order(self):
+        self.assertEqual([verse.number for verse in self.index.verses(31)], [1, 2, 3, 5, 6])
+
+    def test_verse_range(self):
+        self.assertEqual([verse.number for verse in self.index.verses(31, 2, 5)], [2, 3, 5])
+        self.assertEqual(self.index.verses(31, 7, 9), ())
+        self.assertEqual(self.index.verses(150, 1, 6), ())
@@ -1,7 +1,9 @@
+from functools import lru_cache
+
 from django.utils.html import format_html
 
 from office.api.line import Line
-from psalter.models import PsalmVerse
+from psalter.index import get_psalter_index, psalter_generation
 
 
 def parse_single_psalm(psalm):
@@ -110,6 +112,49 @@ def _has_verse_text(verse, language_style, display_language, use_target_language
     return bool(verse.first_half)
 
 
+def _citation_range(citation):
+    """``(psalm, first verse, last verse)`` for a normalized citation; whole psalms have no verse bounds."""
+    citation_parts = citation.split(":")
+    if len(citation_parts) > 1:
+        start, end = citation_parts[1].split("-")
+        return int(citation_parts[0]), int(start), int(end)
+    return int(citation), None, None
+
+
+def get_verses(citations):
+    """The verses for every normalized citation, read from the in-memory psalter index."""
+    index = get_psalter_index()
+    return {citation: list(index.verses(*_citation_range(citation))) for citation in citations}
+
+
+@lru_cache(maxsize=2048)
+def _render_psalms(generation, citations, api, simplified_citations, language_style, headings, display_language):
+    verses = get_verses(citations)
+    if api:
+        return tuple(
+            line
+            for citation in citations
+            for line in psalm_api_lines(
+                citation,
+                verses[citation],
+                language_style=language_style,
+                headings=headings,
+                display_language=display_language,
+            )
+        )
+    return "".join(
+        psalm_html(
+            citation,
+            verses[citation],
+            simplified_citations=simplified_citations,
+            language_style=language_style,
+            headings=headings,
+            display_language=display_language,
+        )
+        for citation in citations
+    )
+
+
 def get_psalms(
     citations,
     api=False,
@@ -118,39 +163,25 @@ def get_psalms(
     headings="whole_verse",
     display_language="english",
 ):
-    citations = normalize_citations(citations)
-    html = ""
-    lines = []
-    for citation in citations:
-        citation_parts = citation.split(":")
-        if len(citation_parts) > 1:
-            start, end = citation_parts[1].split("-")
-            verses = (
-                PsalmVerse.objects.filter(psalm__number=citation_parts[0], number__gte=start, number__lte=end)
-                .order_by("number")
-                .select_related("psalm")
-                .all()
-            )
-        else:
-            verses = PsalmVerse.objects.filter(psalm__number=citation).order_by("number").select_related("psalm").all()
-        html = html + psalm_html(
-            citation,
-            verses,
-            simplified_citations=simplified_citations,
-            language_style=language_style,
-            headings=headings,
-            display_language=display_language,
-        )
-        lines = lines + psalm_api_lines(
-            citation,
-            verses,
-            language_style=language_style,
-            headings=headings,
-            display_language=display_language,
-        )
+    """Render psalm citations as HTML, or as API lines when ``api`` is set.
+
+    All citations are fetched together and only the requested form is built.
+    Results are memoized per process under the psalter generation, so an edit
+    in any process makes every process render afresh.
+    """
+    rendered = _render_psalms(
+        psalter_generation(),
+        tuple(normalize_citations(citations)),
+        api,
+        simplified_citations and not api,
+        language_style,
+        headings,
+        display_language,
+    )
     if api:
-        return lines
-    return html
+        # Callers may edit their lines; keep the memoized ones pristine.
+        return [Line(**line) for line in rendered]
+    return rendered
 
 
 def psalm_api_lines(
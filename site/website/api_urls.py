@@ -22,6 +22,7 @@ from office.api.views.index import (
     ReadingsView,
     GreatLitanyView,
     AudioViewSet,
+    AudioBuildJobView,
     CommemorationsView,
 )
 from office.api.views.resources import (
@@ -86,6 +87,7 @@ urlpatterns = [
         AudioViewSet.as_view({"post": "retrieve"}),
         name="audio_view",
     ),
+    path(r"api/v1/audio/jobs/<uuid:job_id>", AudioBuildJobView.as_view(), name="audio_build_job"),
     path(
         r"api/v1/office/morning_prayer/<int:year>-<int:month>-<int:day>",
         MorningPrayerView.as_view(),
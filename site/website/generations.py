@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import uuid
+from abc import ABC, abstractmethod
+
+from django.core.cache import cache
+
+
+class GenerationCachedSnapshot(ABC):
+    """Base for data read once per process and kept until it is edited anywhere.
+
+    Subclasses set ``GENERATION_KEY`` and implement ``load``. ``current`` loads
+    the first time it is needed and again whenever the generation token has
+    moved on; ``invalidate`` (called from ``post_save``/``post_delete``
+    handlers) moves it. The token lives in the shared cache, so an edit made
+    in one process is picked up by every process on its next request.
+    """
+
+    GENERATION_KEY: str
+
+    # (generation, loaded value); set on the subclass, so each keeps its own.
+    _loaded = None
+
+    @classmethod
+    def generation(cls):
+        return cache.get_or_set(cls.GENERATION_KEY, lambda: uuid.uuid4().hex, None)
+
+    @classmethod
+    def invalidate(cls):
+        cache.set(cls.GENERATION_KEY, uuid.uuid4().hex, None)
+
+    @classmethod
+    @abstractmethod
+    def load(cls):
+        """Read the value ``current`` hands out until the next invalidation."""
+
+    @classmethod
+    def current(cls):
+        generation = cls.generation()
+        loaded = cls._loaded
+        if loaded is None or loaded[0] != generation:
+            loaded = (generation, cls.load())
+            cls._loaded = loaded
+        return loaded[1]
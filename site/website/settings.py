@@ -21,6 +21,7 @@ env = environ.Env(
     DEBUG=(bool, False),
     DEBUG_DATES=(bool, False),
     USE_CALENDAR_CACHE=(bool, True),
+    ANALYTICS_BUFFER_EVENTS=(bool, True),
     MODE=(str, "web"),
     SECURE_SSL_REDIRECT=(bool, False),
     EMAIL_USE_TLS=(bool, True),
@@ -47,6 +48,9 @@ SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", env("SECURE_PROXY_SSL_HEADE
 DEBUG = env("DEBUG")
 DEBUG_DATES = env("DEBUG_DATES")
 USE_CALENDAR_CACHE = env("USE_CALENDAR_CACHE")
+# Write analytics events in batches from a background thread (see analytics/buffer.py);
+# the test runner writes them straight away so tests can assert on them.
+ANALYTICS_BUFFER_EVENTS = env("ANALYTICS_BUFFER_EVENTS") and "test" not in sys.argv
 MODE = env("MODE")
 APP_VERSION = 1.1
 
@@ -370,6 +374,11 @@ OPENAI_API_KEY = env("OPENAI_API_KEY")
 # The adapters live in office/api/views/tts.py; each reads its own settings
 # below so the model and voices can be switched without code changes.
 TTS_PROVIDER = env("TTS_PROVIDER", default="openai")
+# Clips synthesized in parallel for one office (bounded by the provider's rate limit).
+TTS_MAX_CONCURRENCY = env.int("TTS_MAX_CONCURRENCY", default=4)
+# Threads per web process that build queued office audio (office/audio_jobs.py).
+# With 0, queued builds wait for `manage.py run_audio_jobs`; the test runner never starts them.
+AUDIO_JOB_WORKERS = 0 if "test" in sys.argv else env.int("AUDIO_JOB_WORKERS", default=1)
 
 # OpenAI TTS. Valid tts-1 / tts-1-hd voices: alloy, ash, coral, echo, fable,
 # onyx, nova, sage, shimmer. gpt-4o-mini-tts adds ballad, verse, marin, cedar